@@ -28,6 +28,7 @@ from ._capabilities import Capabilities, capabilities
 from .client_cursor import AsyncClientCursor, ClientCursor
 from ._server_cursor import ServerCursor
 from ._pipeline_async import AsyncPipeline
+from ._observe import QueryInfo
 from ._connection_base import BaseConnection, Notify
 from ._connection_info import ConnectionInfo
 from .connection_async import AsyncConnection
@@ -79,6 +80,7 @@ __all__ = [
     "IsolationLevel",
     "Notify",
     "Pipeline",
+    "QueryInfo",
     "RawCursor",
     "RawServerCursor",
     "Rollback",
@@ -0,0 +1,381 @@
+"""
+Support for loading and dumping data by column.
+
+The NumPy conversions are used both by the Python and the C Transformer and
+by copy. The Arrow conversions are built on top of the NumPy ones.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+from datetime import timezone
+from collections.abc import Sequence
+
+from . import errors as e
+from . import pq
+from ._oids import BOOL_OID, BPCHAR_OID, BYTEA_OID, DATE_OID, FLOAT4_OID
+from ._oids import FLOAT8_OID, INT2_OID, INT4_OID, INT8_OID, INTERVAL_OID, NAME_OID
+from ._oids import TEXT_OID, TIME_OID, TIMESTAMP_OID, TIMESTAMPTZ_OID, VARCHAR_OID
+
+if TYPE_CHECKING:
+    from .abc import Buffer, LoadFunc
+    from .adapt import AdaptersMap
+
+BINARY = pq.Format.BINARY
+
+# Map from the oid of the types that can be loaded into typed arrays to the
+# dtype of the array and the dtype of the data in binary format.
+NUMPY_DTYPES: dict[int, tuple[str, str]] = {
+    BOOL_OID: ("?", "?"),
+    INT2_OID: ("i2", ">i2"),
+    INT4_OID: ("i4", ">i4"),
+    INT8_OID: ("i8", ">i8"),
+    FLOAT4_OID: ("f4", ">f4"),
+    FLOAT8_OID: ("f8", ">f8"),
+    DATE_OID: ("M8[D]", ">i4"),
+    TIMESTAMP_OID: ("M8[us]", ">i8"),
+    TIMESTAMPTZ_OID: ("M8[us]", ">i8"),
+}
+
+# Distance between the PostgreSQL epoch (2000-01-01) and the Unix epoch
+PG_EPOCH_DAYS = 10_957
+PG_EPOCH_USECS = PG_EPOCH_DAYS * 86_400 * 1_000_000
+
+# Binary representation of 'infinity'; '-infinity' is the minimum value.
+DATE_INFINITY = 2**31 - 1
+TIMESTAMP_INFINITY = 2**63 - 1
+
+
+def binary_to_array(data: bytes, oid: int) -> Any:
+    """
+    Convert the concatenation of values in binary format into a NumPy array.
+
+    `!oid` must be one of the `NUMPY_DTYPES` keys.
+    """
+    import numpy as np
+
+    dtype, wire = NUMPY_DTYPES[oid]
+    raw = np.frombuffer(data, dtype=wire)
+    if oid == DATE_OID:
+        if ((raw == DATE_INFINITY) | (raw == -DATE_INFINITY - 1)).any():
+            raise e.DataError("infinity dates can't be loaded into numpy arrays")
+        return (raw.astype("i8") + PG_EPOCH_DAYS).view(dtype)
+    elif oid == TIMESTAMP_OID or oid == TIMESTAMPTZ_OID:
+        if ((raw == TIMESTAMP_INFINITY) | (raw == -TIMESTAMP_INFINITY - 1)).any():
+            raise e.DataError("infinity timestamps can't be loaded into numpy arrays")
+        return (raw + PG_EPOCH_USECS).view(dtype)
+    else:
+        return raw.astype(dtype)
+
+
+def buffers_to_array(
+    values: Sequence[Buffer | None], oid: int, format: pq.Format, load: LoadFunc
+) -> Any:
+    """
+    Convert a list of unparsed values into a masked NumPy array.
+
+    Binary values of the `NUMPY_DTYPES` types are converted in bulk, the other
+    ones are converted to Python objects using `!load`.
+    """
+    import numpy as np
+
+    nulls = np.fromiter((v is None for v in values), dtype=bool, count=len(values))
+    if format == BINARY and oid in NUMPY_DTYPES:
+        size = np.dtype(NUMPY_DTYPES[oid][1]).itemsize
+        filler = bytes(size)
+        data = b"".join(v if v is not None else filler for v in values)
+        if len(data) != size * len(values):
+            raise e.DataError(f"unexpected data size for oid {oid}")
+        arr = binary_to_array(data, oid)
+    else:
+        arr = values_to_array([load(v) if v is not None else v for v in values], oid)
+
+    return masked_array(arr, nulls)
+
+
+def values_to_array(values: list[Any], oid: int) -> Any:
+    """
+    Convert a list of loaded Python objects into a NumPy array.
+
+    Null values are represented by `!None` in `!values`. If the `!oid` is not
+    one of the `NUMPY_DTYPES` keys return an array of objects.
+    """
+    import numpy as np
+
+    if not (info := NUMPY_DTYPES.get(oid)):
+        arr = np.empty(len(values), dtype=object)
+        arr[:] = values
+        return arr
+
+    if oid == TIMESTAMPTZ_OID:
+        # datetime64 has no timezone: represent the instants in UTC
+        values = [
+            v.astimezone(timezone.utc).replace(tzinfo=None) if v is not None else v
+            for v in values
+        ]
+    elif oid != DATE_OID and oid != TIMESTAMP_OID:
+        values = [v if v is not None else 0 for v in values]
+
+    return np.array(values, dtype=info[0])
+
+
+def masked_array(arr: Any, nulls: Any) -> Any:
+    """
+    Return a masked array with the `!arr` values masked where `!nulls` is set.
+    """
+    import numpy as np
+
+    return np.ma.MaskedArray(arr, mask=nulls if nulls.any() else np.ma.nomask)
+
+
+def concat_arrays(arrays: Sequence[Any]) -> Any:
+    """
+    Return the concatenation of masked NumPy arrays, keeping their masks.
+    """
+    import numpy as np
+
+    return np.ma.concatenate(arrays)
+
+
+def arrow_batch(
+    arrays: Sequence[Any],
+    oids: Sequence[int],
+    names: Sequence[str],
+    adapters: AdaptersMap,
+) -> Any:
+    """
+    Return a `!pyarrow.RecordBatch` from a list of masked NumPy arrays.
+
+    The Arrow types of the columns are chosen from the columns `!oids`; values
+    whose type is not known are converted by Arrow type inference.
+    """
+    import pyarrow as pa
+
+    columns = [_arrow_array(arr, oid, adapters) for arr, oid in zip(arrays, oids)]
+    return pa.RecordBatch.from_arrays(columns, names=list(names))
+
+
+def _arrow_array(arr: Any, oid: int, adapters: AdaptersMap) -> Any:
+    import numpy as np
+    import pyarrow as pa
+
+    atype = arrow_type(oid, adapters)
+    if arr.dtype.kind != "O":
+        mask = np.ma.getmask(arr)
+        return pa.array(
+            arr.data, mask=mask if mask is not np.ma.nomask else None, type=atype
+        )
+
+    try:
+        return pa.array(arr.data, type=atype)
+    except (pa.ArrowException, TypeError, ValueError) as ex:
+        name = t.regtype if (t := adapters.types.get(oid)) else f"oid {oid}"
+        raise e.NotSupportedError(
+            f"cannot convert values of type {name} to Arrow: {ex}"
+        ) from None
+
+
+def arrow_type(oid: int, adapters: AdaptersMap) -> Any:
+    """
+    Return the `!pyarrow.DataType` to represent values of a PostgreSQL type.
+
+    Return `!None` if there is no known type for `!oid`. For array types
+    known in the `!adapters` return a list of the base type, if known.
+    """
+    import pyarrow as pa
+
+    global _arrow_types
+    if not _arrow_types:
+        _arrow_types = {
+            BOOL_OID: pa.bool_(),
+            INT2_OID: pa.int16(),
+            INT4_OID: pa.int32(),
+            INT8_OID: pa.int64(),
+            FLOAT4_OID: pa.float32(),
+            FLOAT8_OID: pa.float64(),
+            DATE_OID: pa.date32(),
+            TIME_OID: pa.time64("us"),
+            TIMESTAMP_OID: pa.timestamp("us"),
+            TIMESTAMPTZ_OID: pa.timestamp("us", tz="UTC"),
+            INTERVAL_OID: pa.duration("us"),
+            TEXT_OID: pa.string(),
+            VARCHAR_OID: pa.string(),
+            BPCHAR_OID: pa.string(),
+            NAME_OID: pa.string(),
+            BYTEA_OID: pa.binary(),
+        }
+
+    if (atype := _arrow_types.get(oid)) is not None:
+        return atype
+
+    if (info := adapters.types.get(oid)) and info.array_oid == oid:
+        if (base := arrow_type(info.oid, adapters)) is not None:
+            return pa.list_(base)
+
+    return None
+
+
+_arrow_types: dict[int, Any] = {}
+
+
+def column_to_numpy(column: Any, nulls: Any = None) -> tuple[Any, Any]:
+    """
+    Return a NumPy array and the mask of its null values from a column.
+
+    `!column` can be a NumPy array, a masked array, an Arrow array or a
+    sequence. `!nulls`, if specified, is an additional mask of null values.
+    The mask returned is `!None` if there are no null values.
+    """
+    import numpy as np
+
+    mask = None
+    if isinstance(column, np.ma.MaskedArray):
+        if column.mask is not np.ma.nomask:
+            mask = np.ma.getmaskarray(column)
+        column = column.data
+    elif hasattr(column, "is_null") and hasattr(column, "to_numpy"):
+        # An Arrow Array or ChunkedArray
+        if column.null_count:
+            mask = column.is_null().to_numpy(zero_copy_only=False)
+            try:
+                column = column.fill_null(False if str(column.type) == "bool" else 0)
+            except (TypeError, ValueError):
+                pass  # not a numeric type: the values will be None
+        column = column.to_numpy(zero_copy_only=False)
+    else:
+        column = np.asarray(column)
+
+    if column.dtype.kind == "M" and (nat := np.isnat(column)).any():
+        mask = nat if mask is None else mask | nat
+
+    if nulls is not None:
+        nulls = np.asarray(nulls, dtype=bool)
+        mask = nulls if mask is None else mask | nulls
+
+    if mask is not None:
+        mask = np.ascontiguousarray(mask, dtype=bool)
+
+    return column, mask
+
+
+def numpy_oid(arr: Any) -> int | None:
+    """
+    Return the oid of the type to represent the values of an array.
+
+    Return `!None` if the array dtype has no fixed-size equivalent.
+    """
+    import numpy as np
+
+    kind = arr.dtype.kind
+    size = arr.dtype.itemsize
+    if kind == "b":
+        return BOOL_OID
+    elif kind == "i":
+        return {1: INT2_OID, 2: INT2_OID, 4: INT4_OID, 8: INT8_OID}.get(size)
+    elif kind == "u":
+        return {1: INT2_OID, 2: INT4_OID, 4: INT8_OID}.get(size)
+    elif kind == "f":
+        return {2: FLOAT4_OID, 4: FLOAT4_OID, 8: FLOAT8_OID}.get(size)
+    elif kind == "M":
+        unit = np.datetime_data(arr.dtype)[0]
+        return DATE_OID if unit in ("Y", "M", "W", "D") else TIMESTAMP_OID
+    else:
+        return None
+
+
+def numpy_to_binary(arr: Any, mask: Any, oid: int) -> Any:
+    """
+    Convert an array into the binary representation of a PostgreSQL type.
+
+    Return an array whose items, in big-endian order, are the binary
+    representation of the `!arr` values as `!oid`, or `!None` if the conversion
+    is not supported. Values where `!mask` is set are ignored.
+    """
+    import numpy as np
+
+    kind = arr.dtype.kind
+    if oid == BOOL_OID and kind in "biu":
+        return (arr != 0).view(np.uint8)
+    elif oid in (INT2_OID, INT4_OID, INT8_OID) and kind in "biu":
+        rv = arr.astype(NUMPY_DTYPES[oid][0])
+        _check_range(rv != arr, mask, oid)
+        return rv
+    elif oid in (FLOAT4_OID, FLOAT8_OID) and kind in "biuf":
+        return arr.astype(NUMPY_DTYPES[oid][0])
+    elif oid == DATE_OID and kind == "M":
+        days = arr.astype("M8[D]").view("i8") - PG_EPOCH_DAYS
+        rv = days.astype("i4")
+        _check_range(rv != days, mask, oid)
+        return rv
+    elif oid in (TIMESTAMP_OID, TIMESTAMPTZ_OID) and kind == "M":
+        return arr.astype("M8[us]").view("i8") - PG_EPOCH_USECS
+    else:
+        return None
+
+
+def _check_range(bad: Any, mask: Any, oid: int) -> None:
+    if mask is not None:
+        bad &= ~mask
+    if bad.any():
+        raise e.DataError(f"value out of range for type with oid {oid}")
+
+
+def columns_to_binary(
+    columns: Sequence[Any], nulls: Sequence[Any] | None, types: Sequence[int] | None
+) -> tuple[list[Any], list[Any]] | None:
+    """
+    Convert a list of columns into the arrays to dump in a binary copy.
+
+    Return the arrays of values converted by `numpy_to_binary()`, with their
+    null masks. Return `!None` if any column cannot be converted.
+    """
+    if types is not None and len(types) != len(columns):
+        raise e.ProgrammingError(
+            f"cannot dump {len(columns)} columns: {len(types)} types set"
+        )
+    if nulls is not None and len(nulls) != len(columns):
+        raise e.ProgrammingError(
+            f"got {len(columns)} columns but {len(nulls)} null masks"
+        )
+
+    arrays = []
+    masks = []
+    for i, column in enumerate(columns):
+        arr, mask = column_to_numpy(column, nulls[i] if nulls is not None else None)
+        if (oid := types[i] if types is not None else numpy_oid(arr)) is None:
+            return None
+        if (arr := numpy_to_binary(arr, mask, oid)) is None:
+            return None
+        arrays.append(arr)
+        masks.append(mask)
+
+    if len({len(arr) for arr in arrays}) > 1:
+        raise e.ProgrammingError("all the columns must have the same length")
+
+    return arrays, masks
+
+
+def columns_to_rows(
+    columns: Sequence[Any], nulls: Sequence[Any] | None
+) -> list[tuple[Any, ...]]:
+    """
+    Convert a list of columns into a list of records of Python objects.
+    """
+    values = []
+    for i, column in enumerate(columns):
+        arr, mask = column_to_numpy(column, nulls[i] if nulls is not None else None)
+        if arr.dtype.kind == "M" and numpy_oid(arr) == TIMESTAMP_OID:
+            # tolist() would return int instead of datetime for ns precision
+            arr = arr.astype("M8[us]")
+        items = arr.tolist()
+        if mask is not None:
+            for j in mask.nonzero()[0]:
+                items[j] = None
+        values.append(items)
+
+    if len({len(items) for items in values}) > 1:
+        raise e.ProgrammingError("all the columns must have the same length")
+
+    return list(zip(*values))
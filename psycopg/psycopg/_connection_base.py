@@ -25,15 +25,17 @@ from .adapt import AdaptersMap
 from ._enums import IsolationLevel
 from ._compat import LiteralString, Self, TypeVar
 from .pq.misc import connection_summary
+from ._observe import QueryInfo, QueryObserver
 from ._preparing import PrepareManager
 from ._capabilities import capabilities
-from ._pipeline_base import BasePipeline
+from ._pipeline_base import BasePipeline, PipelinedQuery
 from ._connection_info import ConnectionInfo
 
 if TYPE_CHECKING:
     from psycopg_pool.base import BasePool
 
     from .pq.abc import PGconn, PGresult
+    from ._server_cursor_base import ServerCursorMixin
 
 # Row Type variable for Cursor (when it needs to be distinguished from the
 # connection's one)
@@ -105,6 +107,7 @@ class BaseConnection(Generic[Row]):
 
         self._notice_handlers: list[NoticeHandler] = []
         self._notify_handlers: list[NotifyHandler] = []
+        self._query_observers: list[QueryObserver] = []
 
         # Number of transaction blocks currently entered
         self._num_transactions = 0
@@ -127,6 +130,13 @@ class BaseConnection(Generic[Row]):
 
         self._pipeline: BasePipeline | None = None
 
+        # Queries waiting to be executed in automatic pipeline mode
+        self._auto_pipeline = False
+        self._pipeline_queue = deque[PipelinedQuery]()
+
+        # Server-side cursor waiting for the result of a FETCH sent ahead
+        self._prefetch_cursor: ServerCursorMixin[Any, Any] | None = None
+
         # Time when the connection was created (currently only used by the pool)
         self._created_at: float
         # Time after which the connection should be closed
@@ -251,6 +261,7 @@ class BaseConnection(Generic[Row]):
 
     def _check_intrans_gen(self, attribute: str) -> PQGen[None]:
         # Raise an exception if we are in a transaction
+        yield from self._collect_prefetch_gen()
         if (status := self.pgconn.transaction_status) == IDLE and self._pipeline:
             yield from self._pipeline._sync_gen()
             status = self.pgconn.transaction_status
@@ -388,6 +399,31 @@ class BaseConnection(Generic[Row]):
             if (d := self._notifies_backlog) is not None:
                 d.append(n)
 
+    def add_query_observer(self, callback: QueryObserver) -> None:
+        """
+        Register a callable to be invoked whenever a query is complete.
+
+        :param callback: the callback to call upon query completed.
+        :type callback: Callable[[~psycopg.QueryInfo], None]
+        """
+        self._query_observers.append(callback)
+
+    def remove_query_observer(self, callback: QueryObserver) -> None:
+        """
+        Unregister a query observer previously registered.
+
+        :param callback: the callback to remove.
+        :type callback: Callable[[~psycopg.QueryInfo], None]
+        """
+        self._query_observers.remove(callback)
+
+    def _notify_query_observers(self, info: QueryInfo) -> None:
+        for cb in self._query_observers:
+            try:
+                cb(info)
+            except Exception as ex:
+                logger.exception("error processing query observer '%s': %s", cb, ex)
+
     @property
     def prepare_threshold(self) -> int | None:
         """
@@ -406,6 +442,36 @@ class BaseConnection(Generic[Row]):
     def prepare_threshold(self, value: int | None) -> None:
         self._prepared.prepare_threshold = value
 
+    @property
+    def auto_pipeline(self) -> bool:
+        """
+        Send the queries executed concurrently on the connection together.
+
+        If set, the queries run by `~Cursor.execute()` while the connection is
+        busy are queued, and sent all together in pipeline mode as soon as the
+        connection is available, saving the network round trips.
+
+        Default value: False
+        """
+        return self._auto_pipeline
+
+    @auto_pipeline.setter
+    def auto_pipeline(self, value: bool) -> None:
+        if value:
+            capabilities.has_pipeline(check=True)
+        self._auto_pipeline = bool(value)
+
+    def _take_pipeline_queue(self) -> list[PipelinedQuery]:
+        """Remove the queries waiting in the automatic pipeline queue."""
+        # Use popleft(), which is atomic, as other threads might change the
+        # queue concurrently.
+        queries = []
+        while True:
+            try:
+                queries.append(self._pipeline_queue.popleft())
+            except IndexError:
+                return queries
+
     @property
     def prepared_max(self) -> int | None:
         """
@@ -423,6 +489,40 @@ class BaseConnection(Generic[Row]):
             value = sys.maxsize
         self._prepared.prepared_max = value
 
+    @property
+    def prepared_eviction(self) -> str:
+        """
+        Policy to choose the prepared statement to deallocate.
+
+        - ``lru``: deallocate the least recently used statement.
+        - ``lfu``: deallocate the least frequently used statement, so that
+          the statements used often are not evicted by a burst of queries
+          executed only a few times.
+
+        Default value: ``lru``
+        """
+        return self._prepared.eviction
+
+    @prepared_eviction.setter
+    def prepared_eviction(self, value: str) -> None:
+        if value not in ("lru", "lfu"):
+            raise ValueError(
+                f"bad prepared_eviction: {value!r}. It should be 'lru' or 'lfu'"
+            )
+        self._prepared.eviction = value
+
+    def get_prepared_stats(self) -> dict[str, int]:
+        """
+        Return the counters of the prepared statements usage on the connection.
+        """
+        stats = self._prepared.stats
+        return {
+            "hits": stats["hits"],
+            "misses": stats["misses"],
+            "prepares": stats["prepares"],
+            "deallocations": stats["deallocations"],
+        }
+
     # Generators to perform high-level operations on the connection
     #
     # These operations are expressed in terms of non-blocking generators
@@ -452,6 +552,7 @@ class BaseConnection(Generic[Row]):
         arguments bound client-side. The cursor can do more complex stuff.
         """
         self._check_connection_ok()
+        yield from self._collect_prefetch_gen()
 
         if isinstance(command, str):
             command = command.encode(self.pgconn._encoding)
@@ -546,6 +647,7 @@ class BaseConnection(Generic[Row]):
 
     def _start_query(self) -> PQGen[None]:
         """Generator to start a transaction if necessary."""
+        yield from self._collect_prefetch_gen()
         if self._autocommit:
             return
 
@@ -556,6 +658,16 @@ class BaseConnection(Generic[Row]):
         if self._pipeline:
             yield from self._pipeline._sync_gen()
 
+    def _collect_prefetch_gen(self, check: bool = True) -> PQGen[None]:
+        """Receive the result of a FETCH sent ahead by a server-side cursor.
+
+        The connection must be idle before sending a new command, or before
+        inspecting its transaction status. Raise the error of a failed FETCH,
+        unless *check* is `!False`.
+        """
+        if cur := self._prefetch_cursor:
+            yield from cur._recv_prefetch_gen(check=check)
+
     def _get_tx_start_command(self) -> bytes:
         if self._begin_statement:
             return self._begin_statement
@@ -588,6 +700,7 @@ class BaseConnection(Generic[Row]):
             raise e.ProgrammingError(
                 "commit() cannot be used during a two-phase transaction"
             )
+        yield from self._collect_prefetch_gen()
         if self.pgconn.transaction_status == IDLE:
             return
 
@@ -609,6 +722,9 @@ class BaseConnection(Generic[Row]):
                 "rollback() cannot be used during a two-phase transaction"
             )
 
+        # The transaction is discarded: so is the error of a FETCH sent ahead.
+        yield from self._collect_prefetch_gen(check=False)
+
         # Get out of a "pipeline aborted" state
         if self._pipeline:
             yield from self._pipeline._sync_gen()
@@ -642,6 +758,7 @@ class BaseConnection(Generic[Row]):
         if not isinstance(xid, Xid):
             xid = Xid.from_string(xid)
 
+        yield from self._collect_prefetch_gen()
         if self.pgconn.transaction_status != IDLE:
             raise e.ProgrammingError(
                 "can't start two-phase transaction: connection in status"
@@ -6,6 +6,9 @@ Objects to return information about a PostgreSQL connection.
 
 from __future__ import annotations
 
+import sys
+import socket
+import struct
 from pathlib import Path
 from datetime import tzinfo
 
@@ -14,6 +17,10 @@ from . import pq
 from ._tz import get_tzinfo
 from .conninfo import make_conninfo
 
+# Position of the tcpi_bytes_acked, tcpi_bytes_received fields in tcp_info
+_TCP_INFO_BYTES = struct.Struct("QQ")
+_TCP_INFO_BYTES_OFFSET = 120
+
 
 class ConnectionInfo:
     """Allow access to information about the connection."""
@@ -196,6 +203,67 @@ class ConnectionInfo:
         """The Python codec name of the connection's client encoding."""
         return self.pgconn._encoding
 
+    @property
+    def waits(self) -> int:
+        """
+        The number of times the connection waited for the server.
+
+        Every wait is roughly a network round-trip: a number growing much
+        faster than the number of operations performed is the sign of a
+        chatty access pattern.
+        """
+        return self.pgconn._nwaits
+
+    @property
+    def wait_time(self) -> float:
+        """The total time, in seconds, spent waiting for the server."""
+        return self.pgconn._wait_time
+
+    @property
+    def results_received(self) -> int:
+        """The number of results received from the server."""
+        return self.pgconn._nresults
+
+    @property
+    def rows_received(self) -> int:
+        """The number of rows received from the server."""
+        return self.pgconn._nrows
+
+    @property
+    def bytes_sent(self) -> int | None:
+        """
+        The number of bytes sent to the server, as counted by the OS.
+
+        `!None` if the information is not available, for instance on a
+        non-TCP connection or on a platform other than Linux.
+        """
+        return nbytes[0] if (nbytes := self._get_tcp_bytes()) else None
+
+    @property
+    def bytes_received(self) -> int | None:
+        """
+        The number of bytes received from the server, as counted by the OS.
+
+        `!None` if the information is not available, see `bytes_sent`.
+        """
+        return nbytes[1] if (nbytes := self._get_tcp_bytes()) else None
+
+    def _get_tcp_bytes(self) -> tuple[int, int] | None:
+        # Read the tcpi_bytes_acked, tcpi_bytes_received fields of the
+        # Linux tcp_info struct.
+        if sys.platform != "linux" or self.pgconn.status != pq.ConnStatus.OK:
+            return None
+        try:
+            with socket.fromfd(
+                self.pgconn.socket, socket.AF_INET, socket.SOCK_STREAM
+            ) as sock:
+                info = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_INFO, 256)
+        except OSError:
+            return None
+        if len(info) < _TCP_INFO_BYTES.size + _TCP_INFO_BYTES_OFFSET:
+            return None
+        return _TCP_INFO_BYTES.unpack_from(info, _TCP_INFO_BYTES_OFFSET)
+
     def _get_pgconn_attr(self, name: str) -> str:
         value: bytes = getattr(self.pgconn, name)
         return value.decode(self.encoding)
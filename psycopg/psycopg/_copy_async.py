@@ -6,20 +6,26 @@ Objects to support the COPY protocol (async version).
 
 from __future__ import annotations
 
+import logging
 from abc import ABC, abstractmethod
+from uuid import uuid4
 from types import TracebackType
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Protocol
+from contextlib import AbstractAsyncContextManager, AsyncExitStack
+from contextlib import asynccontextmanager
 from collections.abc import AsyncIterator, Sequence
 
 from . import errors as e
 from . import pq
 from ._compat import Self
 from ._acompat import AQueue, AWorker, agather, aspawn
-from ._copy_base import MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE, BaseCopy
+from ._copy_base import CHUNK_SIZE, MAX_BUFFER_SIZE, PREFER_FLUSH, QUEUE_SIZE
+from ._copy_base import BaseCopy
 from .generators import copy_end, copy_to
 
 if TYPE_CHECKING:
-    from .abc import Buffer
+    from .abc import Buffer, Params, Query
+    from ._tpc import Xid
     from .cursor_async import AsyncCursor
     from .connection_async import AsyncConnection  # noqa: F401
 
@@ -28,6 +34,8 @@ COPY_OUT = pq.ExecStatus.COPY_OUT
 
 ACTIVE = pq.TransactionStatus.ACTIVE
 
+logger = logging.getLogger("psycopg")
+
 
 class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
     """Manage an asynchronous :sql:`COPY` operation.
@@ -110,6 +118,20 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         """
         return await self.connection.wait(self._read_row_gen())
 
+    async def read_arrow_batches(
+        self, size: int = 10000, *, names: Sequence[str] | None = None
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate on the result of a :sql:`COPY TO` operation by Arrow batches.
+
+        Return `!pyarrow.RecordBatch` objects of up to `!size` records each.
+        The columns are named after `!names`, if specified, otherwise
+        ``column1``, ``column2``... The Arrow types are chosen according to the
+        types specified by `set_types()`.
+        """
+        while columns := await self.connection.wait(self._read_columns_gen(size)):
+            yield self._arrow_batch(columns, names)
+
     async def write(self, buffer: Buffer | str) -> None:
         """
         Write a block of data to a table after a :sql:`COPY FROM` operation.
@@ -125,6 +147,19 @@ class AsyncCopy(BaseCopy["AsyncConnection[Any]"]):
         if data := self.formatter.write_row(row):
             await self._write(data)
 
+    async def write_columns(
+        self, columns: Sequence[Any], nulls: Sequence[Any] | None = None
+    ) -> None:
+        """
+        Write records to a table after a :sql:`COPY FROM` operation by columns.
+
+        `!columns` is a sequence of NumPy or Arrow arrays, one per column, of
+        the same length. `!nulls`, if specified, is a sequence of boolean
+        arrays (or `!None`) marking the null values of each column.
+        """
+        for data in self.formatter.write_columns(columns, nulls, self._types):
+            await self._write(data)
+
     async def finish(self, exc: BaseException | None) -> None:
         """Terminate the copy operation and free the resources allocated.
 
@@ -219,6 +254,7 @@ class AsyncLibpqWriter(AsyncWriter):
                 raise
         else:
             self.cursor._results = [res]
+            self.cursor._finish_observed([res])
 
 
 class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
@@ -287,3 +323,202 @@ class AsyncQueuedLibpqWriter(AsyncLibpqWriter):
             raise self._worker_error
 
         await super().finish(exc)
+
+
+class _AsyncPool(Protocol):
+    """The part of the `psycopg_pool.AsyncConnectionPool` interface we use."""
+
+    @property
+    def min_size(self) -> int: ...
+
+    def connection(
+        self, timeout: float | None = None
+    ) -> AbstractAsyncContextManager[AsyncConnection[Any]]: ...
+
+
+class AsyncParallelCopy:
+    """Manage a :sql:`COPY FROM` operation spread over several connections.
+
+    :param connections: the connections to use, or a pool to take them from.
+    :param statement: the :sql:`COPY ... FROM STDIN` statement to execute on
+        every connection.
+    :param params: the parameters of the statement, if any.
+    :param workers: the number of connections to use. By default use all the
+        connections passed, or the `!min_size` connections of the pool.
+    :param chunk_size: the number of records to send to a connection before
+        considering switching to another one.
+    :param two_phase: if `!True`, use a two-phase commit to make the operation
+        atomic across the connections.
+
+    The records are written in chunks, to the connection with the shortest
+    queue of data to send. The data is written in a transaction on every
+    connection, committed only if all the connections completed the copy
+    successfully; if any of them fails, all the transactions are rolled back.
+    """
+
+    __module__ = "psycopg.copy"
+
+    def __init__(
+        self,
+        connections: Sequence[AsyncConnection[Any]] | _AsyncPool,
+        statement: Query,
+        params: Params | None = None,
+        *,
+        workers: int | None = None,
+        chunk_size: int = CHUNK_SIZE,
+        two_phase: bool = False,
+    ):
+        if isinstance(connections, Sequence):
+            if workers is None:
+                workers = len(connections)
+            elif workers > len(connections):
+                raise e.ProgrammingError(
+                    f"cannot use {workers} workers with {len(connections)}"
+                    " connections"
+                )
+        elif workers is None:
+            workers = connections.min_size
+        if workers < 1:
+            raise e.ProgrammingError("at least one worker is needed")
+        if chunk_size < 1:
+            raise e.ProgrammingError("chunk_size must be a positive number")
+
+        self._source = connections
+        self._statement = statement
+        self._params = params
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.two_phase = two_phase
+
+        self.xids: list[Xid] = []
+        self.rowcount = -1
+
+        self._stack = AsyncExitStack()
+        self._cursors: list[AsyncCursor[Any]] = []
+        self._copies: list[AsyncCopy] = []
+        self._writers: list[AsyncQueuedLibpqWriter] = []
+        self._current = 0
+        self._count = 0
+
+    async def __aenter__(self) -> Self:
+        if self._copies:
+            raise TypeError("the ParallelCopy object can be entered only once")
+
+        await self._stack.__aenter__()
+        try:
+            await self._start()
+        except BaseException as ex:
+            await self._stack.__aexit__(type(ex), ex, ex.__traceback__)
+            raise
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        # The copies are terminated first, then the transactions are closed,
+        # then the connections are returned to the pool.
+        await self._stack.__aexit__(exc_type, exc_val, exc_tb)
+        if not exc_val:
+            self.rowcount = sum(cur.rowcount for cur in self._cursors)
+
+    async def _start(self) -> None:
+        if isinstance(self._source, Sequence):
+            conns = list(self._source[: self.workers])
+        else:
+            conns = []
+            for _ in range(self.workers):
+                pconn = self._source.connection()
+                conns.append(await self._stack.enter_async_context(pconn))
+
+        if self.two_phase:
+            await self._stack.enter_async_context(self._tpc_transactions(conns))
+        else:
+            for conn in conns:
+                await self._stack.enter_async_context(conn.transaction())
+
+        for conn in conns:
+            cur = conn.cursor()
+            writer = AsyncQueuedLibpqWriter(cur)
+            copy = cur.copy(self._statement, self._params, writer=writer)
+            self._copies.append(await self._stack.enter_async_context(copy))
+            self._cursors.append(cur)
+            self._writers.append(writer)
+
+    @asynccontextmanager
+    async def _tpc_transactions(
+        self, conns: list[AsyncConnection[Any]]
+    ) -> AsyncIterator[None]:
+        gtrid = f"psycopg-copy-{uuid4().hex}"
+        begun = []
+        try:
+            for i, conn in enumerate(conns):
+                xid = conn.xid(0, gtrid, str(i))
+                await conn.tpc_begin(xid)
+                begun.append(conn)
+                self.xids.append(xid)
+
+            yield
+
+            for conn in conns:
+                await conn.tpc_prepare()
+
+        except BaseException:
+            for conn in begun:
+                try:
+                    await conn.tpc_rollback()
+                except Exception as ex:
+                    logger.warning("error rolling back %s: %s", conn, ex)
+            raise
+
+        # Once all the transactions are prepared the decision is to commit.
+        # If committing fails, the transactions left prepared can be committed
+        # later using the `xids`.
+        for conn in conns:
+            await conn.tpc_commit()
+
+    def set_types(self, types: Sequence[int | str]) -> None:
+        """
+        Set the types expected in a :sql:`COPY` operation.
+
+        See `Copy.set_types()` for details.
+        """
+        for copy in self._copies:
+            copy.set_types(types)
+
+    async def write(self, buffer: Buffer | str) -> None:
+        """
+        Write a block of data to a table after a :sql:`COPY FROM` operation.
+
+        The block is sent to a single connection, so it must contain whole
+        records. Only text-based formats are supported.
+        """
+        copy = self._copies[self._next()]
+        if copy.formatter.format == pq.Format.BINARY:
+            raise e.NotSupportedError(
+                "writing blocks in binary format is not supported by ParallelCopy"
+            )
+        await copy.write(buffer)
+
+    async def write_row(self, row: Sequence[Any]) -> None:
+        """Write a record to a table after a :sql:`COPY FROM` operation."""
+        if self._count >= self.chunk_size:
+            self._next()
+        self._count += 1
+        await self._copies[self._current].write_row(row)
+
+    def _next(self) -> int:
+        # Choose the connection with the shortest queue, starting from the
+        # one after the current one, to round-robin across idle connections.
+        n = len(self._writers)
+        self._current = min(
+            range(n),
+            key=lambda i: (
+                self._writers[i]._queue.qsize(),
+                (i - self._current - 1) % n,
+            ),
+        )
+        self._count = 0
+        return self._current
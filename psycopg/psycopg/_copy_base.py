@@ -11,14 +11,17 @@ import sys
 import struct
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, Generic
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 
 from . import adapt
 from . import errors as e
 from . import pq
 from .abc import Buffer, ConnectionType, PQGen, Transformer
 from .pq.misc import connection_summary
+from ._oids import INVALID_OID
 from ._cmodule import _psycopg
+from ._columns import arrow_batch, buffers_to_array, columns_to_binary
+from ._columns import columns_to_rows
 from .generators import copy_from
 
 if TYPE_CHECKING:
@@ -51,6 +54,10 @@ MAX_BUFFER_SIZE = 4 * BUFFER_SIZE
 # Each buffer should be around BUFFER_SIZE size.
 QUEUE_SIZE = 1024
 
+# Number of records written by ParallelCopy to a connection before choosing
+# which connection to write to next.
+CHUNK_SIZE = 1000
+
 # On certain systems, memmove seems particularly slow and flushing often is
 # more performing than accumulating a larger buffer. See #746 for details.
 PREFER_FLUSH = sys.platform == "darwin"
@@ -100,6 +107,7 @@ class BaseCopy(Generic[ConnectionType]):
             self.formatter = TextFormatter(tx, encoding=self._pgconn._encoding)
 
         self._finished = False
+        self._types: list[int] | None = None
 
     def __repr__(self) -> str:
         cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
@@ -131,6 +139,7 @@ class BaseCopy(Generic[ConnectionType]):
         """
         registry = self.cursor.adapters.types
         oids = [t if isinstance(t, int) else registry.get_oid(t) for t in types]
+        self._types = oids
 
         if self._direction == COPY_IN:
             self.formatter.transformer.set_dumper_types(oids, self.formatter.format)
@@ -156,6 +165,7 @@ class BaseCopy(Generic[ConnectionType]):
         # So, don't replace the results in the cursor, just update the rowcount.
         nrows = res.command_tuples
         self.cursor._rowcount = nrows if nrows is not None else -1
+        self.cursor._finish_observed([res])
         return memoryview(b"")
 
     def _read_row_gen(self) -> PQGen[tuple[Any, ...] | None]:
@@ -170,6 +180,45 @@ class BaseCopy(Generic[ConnectionType]):
 
         return row
 
+    def _read_columns_gen(self, size: int) -> PQGen[list[list[Buffer | None]]]:
+        columns: list[list[Buffer | None]] = []
+        nrows = 0
+        while nrows < size:
+            if not (data := (yield from self._read_gen())):
+                break
+
+            if (fields := self.formatter.parse_fields(data)) is None:
+                # Get the final result to finish the copy operation
+                yield from self._read_gen()
+                self._finished = True
+                break
+
+            if not columns:
+                columns = [[] for _ in fields]
+            for column, field in zip(columns, fields):
+                column.append(field)
+            nrows += 1
+
+        return columns
+
+    def _arrow_batch(
+        self, columns: list[list[Buffer | None]], names: Sequence[str] | None
+    ) -> Any:
+        tx = self.formatter.transformer
+        fmt = self.formatter.format
+        oids = self._types or [INVALID_OID] * len(columns)
+        if len(oids) != len(columns):
+            raise e.ProgrammingError(
+                f"cannot load {len(columns)} columns: {len(oids)} types set"
+            )
+        if names is None:
+            names = [f"column{i}" for i in range(1, len(columns) + 1)]
+        arrays = [
+            buffers_to_array(column, oid, fmt, tx.get_loader(oid, fmt).load)
+            for column, oid in zip(columns, oids)
+        ]
+        return arrow_batch(arrays, oids, names, self.cursor.adapters)
+
     def _end_copy_out_gen(self) -> PQGen[None]:
         try:
             while (yield from self._read_gen()):
@@ -193,12 +242,25 @@ class Formatter(ABC):
     @abstractmethod
     def parse_row(self, data: Buffer) -> tuple[Any, ...] | None: ...
 
+    @abstractmethod
+    def parse_fields(self, data: Buffer) -> list[Buffer | None] | None: ...
+
     @abstractmethod
     def write(self, buffer: Buffer | str) -> Buffer: ...
 
     @abstractmethod
     def write_row(self, row: Sequence[Any]) -> Buffer: ...
 
+    def write_columns(
+        self,
+        columns: Sequence[Any],
+        nulls: Sequence[Any] | None,
+        types: Sequence[int] | None,
+    ) -> Iterator[Buffer]:
+        for row in columns_to_rows(columns, nulls):
+            if data := self.write_row(row):
+                yield data
+
     @abstractmethod
     def end(self) -> Buffer: ...
 
@@ -217,6 +279,9 @@ class TextFormatter(Formatter):
 
         return rv
 
+    def parse_fields(self, data: Buffer) -> list[Buffer | None] | None:
+        return split_row_text(data) if data else None
+
     def write(self, buffer: Buffer | str) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -271,6 +336,17 @@ class BinaryFormatter(Formatter):
 
         return rv
 
+    def parse_fields(self, data: Buffer) -> list[Buffer | None] | None:
+        if not self._signature_sent:
+            if data[: len(_binary_signature)] != _binary_signature:
+                raise e.DataError(
+                    "binary copy doesn't start with the expected signature"
+                )
+            self._signature_sent = True
+            data = data[len(_binary_signature) :]
+
+        return split_row_binary(data) if data != _binary_trailer else None
+
     def write(self, buffer: Buffer | str) -> Buffer:
         data = self._ensure_bytes(buffer)
         self._signature_sent = True
@@ -292,6 +368,40 @@ class BinaryFormatter(Formatter):
         else:
             return b""
 
+    def write_columns(
+        self,
+        columns: Sequence[Any],
+        nulls: Sequence[Any] | None,
+        types: Sequence[int] | None,
+    ) -> Iterator[Buffer]:
+        if not (converted := columns_to_binary(columns, nulls, types)):
+            # Some column is not of a fixed-size type: go through write_row()
+            yield from super().write_columns(columns, nulls, types)
+            return
+
+        arrays, masks = converted
+        self._row_mode = True
+        if not self._signature_sent:
+            self._write_buffer += _binary_signature
+            self._signature_sent = True
+
+        if not arrays:
+            return
+
+        # Format the rows in chunks of about BUFFER_SIZE bytes
+        nrows = len(arrays[0])
+        size = 2 + sum(4 + arr.itemsize for arr in arrays)
+        step = max(BUFFER_SIZE // size, 1)
+        for i in range(0, nrows, step):
+            format_columns_binary(
+                [arr[i : i + step] for arr in arrays],
+                [mask[i : i + step] if mask is not None else None for mask in masks],
+                self._write_buffer,
+            )
+            if len(self._write_buffer) > BUFFER_SIZE:
+                buffer, self._write_buffer = self._write_buffer, bytearray()
+                yield buffer
+
     def end(self) -> Buffer:
         # If we have sent no data we need to send the signature
         # and the trailer
@@ -347,18 +457,70 @@ def _format_row_binary(row: Sequence[Any], tx: Transformer, out: bytearray) -> N
             out += _binary_null
 
 
+def _format_columns_binary(
+    arrays: Sequence[Any], masks: Sequence[Any], out: bytearray
+) -> None:
+    """
+    Convert a list of columns to the data to send for binary copy.
+
+    `!arrays` items contain the values in the native binary representation of
+    their type, `!masks` items, if not `!None`, mark the null values.
+    """
+    import numpy as np
+
+    # Create all the records at once as a packed structured array, with the
+    # number of fields, then the length and the big-endian value of each field.
+    nrows = len(arrays[0])
+    fields: list[tuple[str, Any]] = [("n", ">i2")]
+    offsets = []
+    offset = 2
+    for i, arr in enumerate(arrays):
+        fields.append((f"l{i}", ">i4"))
+        fields.append((f"v{i}", arr.dtype.newbyteorder(">")))
+        offsets.append(offset + 4)
+        offset += 4 + arr.itemsize
+    recs = np.empty(nrows, dtype=np.dtype(fields))
+    recs["n"] = len(arrays)
+    for i, (arr, mask) in enumerate(zip(arrays, masks)):
+        recs[f"v{i}"] = arr
+        recs[f"l{i}"] = arr.itemsize
+        if mask is not None:
+            recs[f"l{i}"][mask] = -1
+
+    data = recs.view(np.uint8).reshape(nrows, recs.dtype.itemsize)
+    if any(mask is not None and mask.any() for mask in masks):
+        # Drop the bytes of the null values from the records
+        keep = np.ones(data.shape, dtype=bool)
+        for i, mask in enumerate(masks):
+            if mask is not None:
+                offset = offsets[i]
+                keep[mask, offset : offset + arrays[i].itemsize] = False
+        out += data[keep].tobytes()
+    else:
+        out += data.tobytes()
+
+
 def _parse_row_text(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+    return tx.load_sequence(split_row_text(data))
+
+
+def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+    return tx.load_sequence(split_row_binary(data))
+
+
+def split_row_text(data: Buffer) -> list[Buffer | None]:
+    """Split a row of text copy data into unparsed fields."""
     if not isinstance(data, bytes):
         data = bytes(data)
     if not data.endswith(b"\n"):
         raise e.DataError("bad copy data: field delimiter not found")
     fields = data.split(b"\t")
     fields[-1] = fields[-1][:-1]  # drop \n
-    row = [None if f == b"\\N" else _load_re.sub(_load_sub, f) for f in fields]
-    return tx.load_sequence(row)
+    return [None if f == b"\\N" else _load_re.sub(_load_sub, f) for f in fields]
 
 
-def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
+def split_row_binary(data: Buffer) -> list[Buffer | None]:
+    """Split a row of binary copy data into unparsed fields."""
     row: list[Buffer | None] = []
     nfields = _unpack_int2(data, 0)[0]
     pos = 2
@@ -371,7 +533,7 @@ def _parse_row_binary(data: Buffer, tx: Transformer) -> tuple[Any, ...]:
         else:
             row.append(None)
 
-    return tx.load_sequence(row)
+    return row
 
 
 _pack_int2 = struct.Struct("!h").pack
@@ -415,11 +577,13 @@ def _load_sub(m: re.Match[bytes], __map: dict[bytes, bytes] = _load_repl) -> byt
 if _psycopg:
     format_row_text = _psycopg.format_row_text
     format_row_binary = _psycopg.format_row_binary
+    format_columns_binary = _psycopg.format_columns_binary
     parse_row_text = _psycopg.parse_row_text
     parse_row_binary = _psycopg.parse_row_binary
 
 else:
     format_row_text = _format_row_text
     format_row_binary = _format_row_binary
+    format_columns_binary = _format_columns_binary
     parse_row_text = _parse_row_text
     parse_row_binary = _parse_row_binary
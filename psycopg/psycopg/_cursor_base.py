@@ -6,10 +6,12 @@ Psycopg BaseCursor object
 
 from __future__ import annotations
 
+from time import monotonic
 from typing import TYPE_CHECKING, Any, Generic, NoReturn
 from weakref import ReferenceType, ref
 from functools import partial
-from collections.abc import Iterable, Sequence
+from itertools import islice
+from collections.abc import Iterable, Iterator, Sequence
 
 from . import adapt
 from . import errors as e
@@ -17,11 +19,14 @@ from . import pq
 from .abc import ConnectionType, Loader, Params, PQGen, Query
 from .rows import Row, RowMaker
 from ._column import Column
+from ._columns import arrow_batch
 from ._compat import Template
 from .pq.misc import connection_summary
-from ._queries import PostgresClientQuery, PostgresQuery
+from ._queries import InsertBatcher, PostgresClientQuery, PostgresQuery
+from ._queries import PostgresRawQuery
 from ._preparing import Prepare
-from .generators import execute, fetch, send
+from ._observe import ObservedQuery
+from .generators import execute, fetch, fetch_many, send
 from ._capabilities import capabilities
 
 if TYPE_CHECKING:
@@ -49,7 +54,8 @@ class BaseCursor(Generic[ConnectionType, Row]):
     __slots__ = """
         _conn format _adapters arraysize _closed _results pgresult _pos
         _iresult _rowcount _query _tx _last_query _row_factory _make_row
-        _pgconn _execmany_returning _statusmessage
+        _pgconn _execmany_returning _statusmessage _prepared_name _row_cache
+        _columns _observed
         __weakref__
         """.split()
 
@@ -66,6 +72,15 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self.arraysize = 1
         self._closed = False
         self._last_query: Query | None = None
+
+        # The prepared statement, result format, and transformer which the
+        # current row loaders, row maker, and description were set up for.
+        self._row_cache: tuple[bytes, int, Transformer] | None = None
+        self._columns: list[Column] | None = None
+
+        # The stream or copy operation running, if there are query observers.
+        self._observed: ObservedQuery | None = None
+
         self._reset()
 
         # Set up a callback to allow changing loaders on already returned result.
@@ -83,6 +98,8 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self._query: PostgresQuery | None
         # None if executemany() not executing, True/False according to returning state
         self._execmany_returning: bool | None = None
+        # Name of the prepared statement the results come from, if any
+        self._prepared_name = b""
         if reset_query:
             self._query = None
 
@@ -129,7 +146,14 @@ class BaseCursor(Generic[ConnectionType, Row]):
             or res.status == SINGLE_TUPLE
             or res.status == TUPLES_CHUNK
         ):
-            return [Column(self, i) for i in range(res.nfields)]
+            if not self._prepared_name:
+                return [Column(self, i) for i in range(res.nfields)]
+
+            # The result comes from a prepared statement: it has the same
+            # columns on every execution.
+            if self._columns is None:
+                self._columns = [Column(self, i) for i in range(res.nfields)]
+            return self._columns[:]
         else:
             return None
 
@@ -210,8 +234,32 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self._last_query = query
         yield from self._conn._prepared.maintain_gen(self._conn)
 
+    def _execute_gen_pipeline(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool | None = None,
+    ) -> PQGen[None]:
+        """
+        Generator queuing a query in the pipeline, leaving the results to fetch.
+
+        Used to execute queries in automatic pipeline mode.
+        """
+        yield from self._start_query(query)
+        pgq = self._convert_query(query, params)
+        yield from self._maybe_prepare_gen(pgq, prepare=prepare, binary=binary)
+        self._last_query = query
+        yield from self._conn._prepared.maintain_gen(self._conn)
+
     def _executemany_gen_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch: str | None = None,
+        batch_size: int = 1000,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines available.
@@ -226,15 +274,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
-                self._query = pgq
-                first = False
-            else:
-                pgq.dump(params)
-
+        for pgq in self._executemany_queries(query, params_seq, batch, batch_size):
             yield from self._maybe_prepare_gen(pgq, prepare=True)
             yield from pipeline._communicate_gen()
 
@@ -246,7 +286,12 @@ class BaseCursor(Generic[ConnectionType, Row]):
         yield from self._conn._prepared.maintain_gen(self._conn)
 
     def _executemany_gen_no_pipeline(
-        self, query: Query, params_seq: Iterable[Params], returning: bool
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        returning: bool,
+        batch: str | None = None,
+        batch_size: int = 1000,
     ) -> PQGen[None]:
         """
         Generator implementing `Cursor.executemany()` with pipelines not available.
@@ -258,20 +303,65 @@ class BaseCursor(Generic[ConnectionType, Row]):
         assert self._execmany_returning is None
         self._execmany_returning = returning
 
-        first = True
-        for params in params_seq:
-            if first:
-                pgq = self._convert_query(query, params)
-                self._query = pgq
-                first = False
-            else:
-                pgq.dump(params)
-
+        for pgq in self._executemany_queries(query, params_seq, batch, batch_size):
             yield from self._maybe_prepare_gen(pgq, prepare=True)
 
         self._last_query = query
         yield from self._conn._prepared.maintain_gen(self._conn)
 
+    def _executemany_queries(
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        batch: str | None,
+        batch_size: int,
+    ) -> Iterator[PostgresQuery]:
+        """
+        Return the queries to execute for `Cursor.executemany()`.
+
+        If `!batch` is specified, rewrite the query to insert `!batch_size`
+        records at time.
+        """
+        if not batch:
+            first = True
+            for params in params_seq:
+                if first:
+                    pgq = self._convert_query(query, params)
+                    self._query = pgq
+                    first = False
+                else:
+                    pgq.dump(params)
+                yield pgq
+            return
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be >= 1")
+        if isinstance(query, Template) or issubclass(self._query_cls, PostgresRawQuery):
+            raise e.NotSupportedError(
+                "batch mode is only supported with '%s' placeholders"
+            )
+
+        bquery = PostgresQuery(self._tx)._ensure_bytes(query)
+        batcher = InsertBatcher(bquery, self._encoding, batch)
+        batch_size = min(batch_size, batcher.max_records)
+
+        # Reuse the same query, and prepared statement, for batches of the
+        # same size.
+        pgqs: dict[int, PostgresQuery] = {}
+        it = iter(params_seq)
+        while records := list(islice(it, batch_size)):
+            params = batcher.params(records)
+            key = len(records) if batch == "values" else 0
+            if key in pgqs:
+                pgq = pgqs[key]
+                pgq.dump(params)
+            else:
+                pgq = pgqs[key] = self._convert_query(
+                    batcher.query(len(records)), params
+                )
+            self._query = pgq
+            yield pgq
+
     def _maybe_prepare_gen(
         self,
         pgq: PostgresQuery,
@@ -281,6 +371,11 @@ class BaseCursor(Generic[ConnectionType, Row]):
     ) -> PQGen[None]:
         # Check if the query is prepared or needs preparing
         prep, name = self._get_prepared(pgq, prepare)
+
+        obs = None
+        if self._conn._query_observers:
+            obs = ObservedQuery(pgq.query, pgq.params, prep is not Prepare.NO)
+
         if prep is Prepare.NO:
             # The query must be executed without preparing
             self._execute_send(pgq, binary=binary)
@@ -306,15 +401,28 @@ class BaseCursor(Generic[ConnectionType, Row]):
             if key is not None:
                 queued = (key, prep, name)
             self._conn._pipeline.result_queue.append((self, queued))
+            self._conn._pipeline._add_in_flight_bytes(
+                len(pgq.query) + sum(len(p) for p in pgq.params or () if p)
+            )
+            if obs:
+                self._conn._pipeline._add_observed(obs)
             return
 
         # run the query
-        results = yield from execute(self._pgconn)
+        if not obs:
+            results = yield from execute(self._pgconn)
+        else:
+            yield from send(self._pgconn)
+            obs.sent = monotonic()
+            results = yield from fetch_many(self._pgconn)
+            obs.finish(self._conn, results)
 
         if key is not None:
             self._conn._prepared.validate(key, prep, name, results)
 
         self._check_results(results)
+        if prep is not Prepare.NO:
+            self._prepared_name = name
         self._set_results(results)
 
     def _get_prepared(
@@ -333,6 +441,9 @@ class BaseCursor(Generic[ConnectionType, Row]):
         """Generator to send the query for `Cursor.stream()`."""
         yield from self._start_query(query)
         pgq = self._convert_query(query, params)
+        self._observed = None
+        if self._conn._query_observers:
+            self._observed = ObservedQuery(pgq.query, pgq.params)
         self._execute_send(pgq, binary=binary, force_extended=True)
         if size < 1:
             raise ValueError("size must be >= 1")
@@ -343,6 +454,8 @@ class BaseCursor(Generic[ConnectionType, Row]):
             self._pgconn.set_chunked_rows_mode(size)
         self._last_query = query
         yield from send(self._pgconn)
+        if self._observed:
+            self._observed.sent = monotonic()
 
     def _stream_fetchone_gen(self, first: bool) -> PQGen[PGresult | None]:
         res: PGresult | None = yield from fetch(self._pgconn)
@@ -359,6 +472,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         elif status == TUPLES_OK or status == COMMAND_OK:
             # End of single row results
+            self._finish_observed([res])
             while res:
                 res = yield from fetch(self._pgconn)
             if status != TUPLES_OK:
@@ -369,6 +483,7 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         else:
             # Errors, unexpected values
+            self._finish_observed([res])
             return self._raise_for_result(res)
 
     def _start_query(self, query: Query | None = None) -> PQGen[None]:
@@ -406,10 +521,19 @@ class BaseCursor(Generic[ConnectionType, Row]):
 
         query = self._convert_query(statement)
 
+        self._observed = None
+        if self._conn._query_observers:
+            self._observed = ObservedQuery(query.query)
+
         self._execute_send(query, binary=False)
         if len(results := (yield from execute(self._pgconn))) != 1:
+            self._finish_observed(results)
             raise e.ProgrammingError("COPY cannot be mixed with other operations")
 
+        if (status := results[0].status) != COPY_IN and status != COPY_OUT:
+            self._finish_observed(results)
+        elif self._observed:
+            self._observed.sent = monotonic()
         self._check_copy_result(results[0])
         self._set_results(results)
 
@@ -508,10 +632,18 @@ class BaseCursor(Generic[ConnectionType, Row]):
         self._iresult = i
         res = self.pgresult = self._results[i]
 
-        # Note: the only reason to override format is to correctly set
-        # binary loaders on server-side cursors, because send_describe_portal
-        # only returns a text result.
-        self._tx.set_pgresult(res, format=format)
+        # If the result comes from the same prepared statement of the
+        # previous one, the row loaders and the row maker can be reused.
+        cache = None
+        if self._prepared_name:
+            cache = (self._prepared_name, res.fformat(0), self._tx)
+        if reuse := (cache is not None and cache == self._row_cache):
+            self._tx.set_pgresult(res, set_loaders=False)
+        else:
+            # Note: the only reason to override format is to correctly set
+            # binary loaders on server-side cursors, because send_describe_portal
+            # only returns a text result.
+            self._tx.set_pgresult(res, format=format)
 
         self._pos = 0
 
@@ -526,7 +658,10 @@ class BaseCursor(Generic[ConnectionType, Row]):
             self._rowcount = nrows if nrows is not None else -1
 
         self._statusmessage = res.command_status
-        self._make_row = self._make_row_maker()
+        if not reuse:
+            self._make_row = self._make_row_maker()
+            self._row_cache = cache
+            self._columns = None
 
     def _set_results(self, results: list[PGresult]) -> None:
         if self._execmany_returning is None:
@@ -629,6 +764,21 @@ class BaseCursor(Generic[ConnectionType, Row]):
                 f"the last operation didn't produce records{detail}"
             )
 
+    def _make_arrow_batch(self, arrays: list[Any]) -> Any:
+        res = self.pgresult
+        assert res
+        oids = [res.ftype(i) for i in range(res.nfields)]
+        names = [col.name for col in self.description or ()]
+        return arrow_batch(arrays, oids, names, self.adapters)
+
+    def _finish_observed(self, results: list[PGresult]) -> None:
+        """
+        Notify the query observers that a stream or copy operation is complete.
+        """
+        if obs := self._observed:
+            self._observed = None
+            obs.finish(self._conn, results)
+
     def _check_copy_result(self, result: PGresult) -> None:
         """
         Check that the value returned in a copy() operation is a legit COPY.
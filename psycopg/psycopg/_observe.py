@@ -0,0 +1,110 @@
+"""
+Support for observing the queries executed by a connection.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+from time import monotonic
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias
+from collections.abc import Callable, Sequence
+
+from . import errors as e
+from . import pq
+from .abc import Buffer
+
+if TYPE_CHECKING:
+    from .pq.abc import PGresult
+    from ._connection_base import BaseConnection
+
+FATAL_ERROR = pq.ExecStatus.FATAL_ERROR
+PIPELINE_ABORTED = pq.ExecStatus.PIPELINE_ABORTED
+
+
+class QueryInfo(NamedTuple):
+    """Information about a query executed, passed to the query observers."""
+
+    query: bytes
+    """The query sent to the server, with placeholders such as ``$1``."""
+
+    nparams: int
+    """The number of parameters sent with the query."""
+
+    prepared: bool
+    """Whether the query was executed as a prepared statement."""
+
+    start: float
+    """The time the query started to be sent, according to `time.monotonic()`.
+    """
+
+    sent: float
+    """The time the query was entirely sent to the server.
+
+    In pipeline mode, the time the query was queued instead.
+    """
+
+    end: float
+    """The time the query was complete."""
+
+    rows: int
+    """The number of rows returned or affected by the query."""
+
+    bytes_sent: int
+    """The size of the query and of its parameters."""
+
+    error: e.Error | None
+    """The error returned by the server, if the query failed."""
+
+
+QueryInfo.__module__ = "psycopg"
+
+QueryObserver: TypeAlias = Callable[[QueryInfo], None]
+
+
+class ObservedQuery:
+    """
+    The state of a query being executed, to pass to the observers on completion.
+    """
+
+    __slots__ = ("query", "nparams", "nbytes", "prepared", "start", "sent")
+
+    def __init__(
+        self,
+        query: bytes,
+        params: Sequence[Buffer | None] | None = None,
+        prepared: bool = False,
+    ):
+        self.query = query
+        self.nparams = len(params) if params else 0
+        self.nbytes = len(query) + sum(len(p) for p in params or () if p)
+        self.prepared = prepared
+        self.start = self.sent = monotonic()
+
+    def finish(self, conn: BaseConnection[Any], results: Sequence[PGresult]) -> None:
+        """Notify the connection observers that the query is complete."""
+        end = monotonic()
+        rows = 0
+        error: e.Error | None = None
+        for res in results:
+            if (status := res.status) == FATAL_ERROR:
+                if not error:
+                    error = e.error_from_result(res, encoding=conn.pgconn._encoding)
+            elif status == PIPELINE_ABORTED:
+                if not error:
+                    error = e.PipelineAborted("pipeline aborted")
+            elif (n := res.command_tuples) is not None:
+                rows += n
+
+        info = QueryInfo(
+            self.query,
+            self.nparams,
+            self.prepared,
+            self.start,
+            self.sent,
+            end,
+            rows,
+            self.nbytes,
+            error,
+        )
+        conn._notify_query_observers(info)
@@ -12,7 +12,7 @@ from collections import deque
 
 from . import errors as e
 from . import pq
-from .abc import PipelineCommand, PQGen
+from .abc import Params, PipelineCommand, PQGen, Query
 from .pq.misc import connection_summary
 from .generators import fetch_many, pipeline_communicate, send
 from ._capabilities import capabilities
@@ -21,6 +21,7 @@ if TYPE_CHECKING:
     from .pq.abc import PGresult
     from ._preparing import Key, Prepare  # noqa: F401
     from ._cursor_base import BaseCursor  # noqa: F401
+    from ._observe import ObservedQuery
     from ._connection_base import BaseConnection
 
 
@@ -37,6 +38,33 @@ ACTIVE = pq.TransactionStatus.ACTIVE
 logger = logging.getLogger("psycopg")
 
 
+class PipelinedQuery:
+    """
+    A query waiting to be executed by a connection in automatic pipeline mode.
+    """
+
+    __slots__ = ("cursor", "query", "params", "prepare", "binary", "done", "error")
+
+    def __init__(
+        self,
+        cursor: BaseCursor[Any, Any],
+        query: Query,
+        params: Params | None = None,
+        *,
+        prepare: bool | None = None,
+        binary: bool | None = None,
+    ):
+        self.cursor = cursor
+        self.query = query
+        self.params = params
+        self.prepare = prepare
+        self.binary = binary
+
+        # Set once the query has been executed, with the error, if it failed.
+        self.done = False
+        self.error: BaseException | None = None
+
+
 class BasePipeline:
     command_queue: deque[PipelineCommand]
     result_queue: deque[PendingResult]
@@ -48,6 +76,20 @@ class BasePipeline:
         self.result_queue = deque[PendingResult]()
         self.level = 0
 
+        # Limits to the results pending, after which results are fetched.
+        self.max_in_flight: int | None = None
+        self.max_in_flight_bytes: int | None = None
+
+        # Number of results processed and, for the queries queued, the number
+        # of results processed after which their bytes are not in flight anymore.
+        self._nprocessed = 0
+        self._in_flight_bytes = 0
+        self._bytes_queue = deque[tuple[int, int]]()
+
+        # The queries to notify the query observers about, with the number of
+        # results processed after which they are complete.
+        self._observed_queue = deque[tuple[int, ObservedQuery]]()
+
     def __repr__(self) -> str:
         cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
         info = connection_summary(self._conn.pgconn)
@@ -57,6 +99,16 @@ class BasePipeline:
     def status(self) -> pq.PipelineStatus:
         return pq.PipelineStatus(self.pgconn.pipeline_status)
 
+    @property
+    def in_flight(self) -> int:
+        """The number of results queued or sent and not received yet."""
+        return len(self.result_queue)
+
+    @property
+    def in_flight_bytes(self) -> int:
+        """The size of the queries queued or sent and not completed yet."""
+        return self._in_flight_bytes
+
     @classmethod
     def is_supported(cls) -> bool:
         """Return `!True` if the psycopg libpq wrapper supports pipeline mode."""
@@ -65,6 +117,7 @@ class BasePipeline:
     def _enter_gen(self) -> PQGen[None]:
         capabilities.has_pipeline(check=True)
         if self.level == 0:
+            yield from self._conn._collect_prefetch_gen()
             self.pgconn.enter_pipeline_mode()
         elif self.command_queue or self.pgconn.transaction_status == ACTIVE:
             # Nested pipeline case.
@@ -105,9 +158,50 @@ class BasePipeline:
         finally:
             yield from self._fetch_gen(flush=True)
 
+    def _set_window(
+        self, max_in_flight: int | None, max_in_flight_bytes: int | None
+    ) -> None:
+        """Set the limits to the results pending in the pipeline."""
+        if max_in_flight is not None:
+            if max_in_flight < 1:
+                raise ValueError(
+                    f"max_in_flight must be a positive number, got {max_in_flight}"
+                )
+            self.max_in_flight = max_in_flight
+
+        if max_in_flight_bytes is not None:
+            if max_in_flight_bytes < 1:
+                raise ValueError(
+                    "max_in_flight_bytes must be a positive number,"
+                    f" got {max_in_flight_bytes}"
+                )
+            self.max_in_flight_bytes = max_in_flight_bytes
+
+    def _window_full(self) -> bool:
+        """Return True if there are more results pending than allowed."""
+        if self.max_in_flight is not None:
+            if len(self.result_queue) > self.max_in_flight:
+                return True
+        if self.max_in_flight_bytes is not None:
+            if self._in_flight_bytes > self.max_in_flight_bytes:
+                return True
+        return False
+
+    def _add_in_flight_bytes(self, nbytes: int) -> None:
+        """Account for the size of the query whose result was last queued."""
+        self._in_flight_bytes += nbytes
+        self._bytes_queue.append((self._nprocessed + len(self.result_queue), nbytes))
+
+    def _add_observed(self, obs: ObservedQuery) -> None:
+        """Notify the query observers when the query last queued is complete."""
+        self._observed_queue.append((self._nprocessed + len(self.result_queue), obs))
+
     def _communicate_gen(self) -> PQGen[None]:
         """Communicate with pipeline to send commands and possibly fetch
         results, which are then processed.
+
+        If there are more results pending than allowed by the pipeline limits,
+        wait for the server to return results until back within limits.
         """
         fetched = yield from pipeline_communicate(self.pgconn, self.command_queue)
         exception = None
@@ -118,6 +212,35 @@ class BasePipeline:
             except e.Error as exc:
                 if exception is None:
                     exception = exc
+
+        if self._window_full():
+            try:
+                yield from self._drain_gen()
+            except e.Error as exc:
+                if exception is None:
+                    exception = exc
+
+        if exception is not None:
+            raise exception
+
+    def _drain_gen(self) -> PQGen[None]:
+        """Fetch results from the pipeline until back within the limits.
+
+        All the commands must have already been sent.
+        """
+        self.pgconn.send_flush_request()
+        yield from send(self.pgconn)
+
+        exception = None
+        while self._window_full():
+            if not (results := (yield from fetch_many(self.pgconn))):
+                break
+            queued = self.result_queue.popleft()
+            try:
+                self._process_results(queued, results)
+            except e.Error as exc:
+                if exception is None:
+                    exception = exc
         if exception is not None:
             raise exception
 
@@ -160,6 +283,14 @@ class BasePipeline:
         checked directly. For prepare statement creation requests, update the
         cache. Otherwise, results are attached to their respective cursor.
         """
+        self._nprocessed += 1
+        while self._bytes_queue and self._bytes_queue[0][0] <= self._nprocessed:
+            self._in_flight_bytes -= self._bytes_queue.popleft()[1]
+        while self._observed_queue and self._observed_queue[0][0] <= self._nprocessed:
+            n, obs = self._observed_queue.popleft()
+            if n == self._nprocessed:
+                obs.finish(self._conn, results)
+
         if queued is None:
             (result,) = results
             if result.status == FATAL_ERROR:
@@ -175,6 +306,63 @@ class BasePipeline:
             cursor._check_results(results)
             cursor._set_results(results)
 
+    def _execute_batch_gen(self, queries: list[PipelinedQuery]) -> PQGen[None]:
+        """Execute a batch of queries, possibly from different cursors.
+
+        Enter pipeline mode, send all the queries and fetch all their results,
+        then exit pipeline mode. Every query is followed by a Sync, so that it
+        behaves as if it was executed alone. Errors are not raised, but stored
+        in the respective query.
+        """
+        yield from self._enter_gen()
+
+        exc: BaseException | None = None
+        try:
+            # The query each item in the result queue belongs to.
+            owners = deque[PipelinedQuery]()
+            for query in queries:
+                nresults = len(self.result_queue)
+                try:
+                    yield from query.cursor._execute_gen_pipeline(
+                        query.query,
+                        query.params,
+                        prepare=query.prepare,
+                        binary=query.binary,
+                    )
+                except Exception as ex:
+                    query.error = ex
+                self._enqueue_sync()
+                owners.extend([query] * (len(self.result_queue) - nresults))
+
+            fetched = yield from pipeline_communicate(self.pgconn, self.command_queue)
+            fetched.reverse()
+            while self.result_queue:
+                if fetched:
+                    results = fetched.pop()
+                elif not (results := (yield from fetch_many(self.pgconn))):
+                    break
+                queued = self.result_queue.popleft()
+                owner = owners.popleft()
+                try:
+                    self._process_results(queued, results)
+                except e.Error as ex:
+                    if owner.error is None:
+                        owner.error = ex
+
+        except BaseException as ex:
+            exc = ex
+            raise
+
+        finally:
+            if self.result_queue or self.command_queue:
+                try:
+                    yield from self._exit_gen()
+                except Exception as ex2:
+                    if not exc:
+                        raise
+                    logger.warning("error ignored terminating %r: %s", self, ex2)
+            self._exit(exc)
+
     def _enqueue_sync(self) -> None:
         """Enqueue a PQpipelineSync() command."""
         self.command_queue.append(self.pgconn.pipeline_sync)
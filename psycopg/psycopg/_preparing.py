@@ -9,12 +9,14 @@ from __future__ import annotations
 import re
 from enum import IntEnum, auto
 from typing import TYPE_CHECKING, Any, TypeAlias
-from collections import OrderedDict, deque
+from itertools import islice
+from collections import Counter, OrderedDict, deque
 from collections.abc import Sequence
 
-from . import pq
+from . import generators, pq
 from .abc import PQGen
 from ._queries import PostgresQuery
+from ._capabilities import capabilities
 
 if TYPE_CHECKING:
     from .pq.abc import PGresult
@@ -39,6 +41,9 @@ class PrepareManager:
     # Maximum number of prepared statements on the connection.
     prepared_max: int = 100
 
+    # Policy to choose the prepared statement to deallocate.
+    eviction: str = "lru"
+
     def __init__(self) -> None:
         # Map (query, types) to the number of times the query was seen.
         self._counts: OrderedDict[Key, int] = OrderedDict()
@@ -46,6 +51,14 @@ class PrepareManager:
         # Map (query, types) to the name of the statement if  prepared.
         self._names: OrderedDict[Key, bytes] = OrderedDict()
 
+        # Map (query, types) of the prepared statements to their usage
+        # frequency, aged by the frequency of the last statement evicted.
+        self._freqs: dict[Key, int] = {}
+        self._age = 0
+
+        # Counters of the prepared statements usage.
+        self.stats = Counter[str]()
+
         # Counter to generate prepared statements names
         self._prepared_idx = 0
 
@@ -67,18 +80,24 @@ class PrepareManager:
 
         if name := self._names.get(key := self.key(query)):
             # The query was already prepared in this session
+            self.stats["hits"] += 1
             return Prepare.YES, name
 
+        self.stats["misses"] += 1
         count = self._counts.get(key, 0)
         if count >= self.prepare_threshold or prepare:
             # The query has been executed enough times and needs to be prepared
-            name = f"_pg3_{self._prepared_idx}".encode()
-            self._prepared_idx += 1
-            return Prepare.SHOULD, name
+            return Prepare.SHOULD, self._next_name()
         else:
             # The query is not to be prepared yet
             return Prepare.NO, b""
 
+    def _next_name(self) -> bytes:
+        """Generate a new name for a prepared statement."""
+        name = f"_pg3_{self._prepared_idx}".encode()
+        self._prepared_idx += 1
+        return name
+
     def _should_discard(
         self,
         prep: Prepare,
@@ -120,8 +139,26 @@ class PrepareManager:
             self._counts.popitem(last=False)
 
         if len(self._names) > self.prepared_max:
-            name = self._names.popitem(last=False)[1]
-            self._to_flush.append(name)
+            key = self._evict_key()
+            self._age = self._freqs.pop(key, self._age)
+            self._to_flush.append(self._names.pop(key))
+            self.stats["deallocations"] += 1
+
+    def _evict_key(self) -> Key:
+        """Return the key of the prepared statement to deallocate."""
+        if self.eviction == "lfu" and len(self._names) > 1:
+            # The least frequently used, the least recently used among the
+            # ones with the same frequency. Spare the last statement added.
+            candidates = islice(self._names, len(self._names) - 1)
+            return min(candidates, key=lambda k: self._freqs.get(k, 0))
+        else:
+            return next(iter(self._names))
+
+    def _add_name(self, key: Key, name: bytes, count: int) -> None:
+        """Record the name of a statement prepared after being seen 'count' times."""
+        self._names[key] = name
+        self._freqs[key] = self._age + count
+        self.stats["prepares"] += 1
 
     def maybe_add_to_cache(
         self, query: PostgresQuery, prep: Prepare, name: bytes
@@ -137,8 +174,7 @@ class PrepareManager:
 
         if (key := self.key(query)) in self._counts:
             if prep is Prepare.SHOULD:
-                del self._counts[key]
-                self._names[key] = name
+                self._add_name(key, name, self._counts.pop(key) + 1)
             else:
                 self._counts[key] += 1
                 self._counts.move_to_end(key)
@@ -146,11 +182,12 @@ class PrepareManager:
 
         elif key in self._names:
             self._names.move_to_end(key)
+            self._freqs[key] = max(self._freqs.get(key, 0), self._age) + 1
             return None
 
         else:
             if prep is Prepare.SHOULD:
-                self._names[key] = name
+                self._add_name(key, name, 1)
             else:
                 self._counts[key] = 1
             return key
@@ -167,6 +204,7 @@ class PrepareManager:
 
         if not self._check_results(results):
             self._names.pop(key, None)
+            self._freqs.pop(key, None)
             self._counts.pop(key, None)
         else:
             self._rotate()
@@ -178,7 +216,10 @@ class PrepareManager:
         the server.
         """
         self._counts.clear()
+        self._freqs.clear()
+        self._age = 0
         if self._names:
+            self.stats["deallocations"] += len(self._names)
             self._names.clear()
             self._to_flush.clear()
             self._to_flush.append(None)
@@ -196,3 +237,51 @@ class PrepareManager:
         while self._to_flush:
             name = self._to_flush.popleft()
             yield from conn._deallocate(name)
+
+    def prepare_gen(
+        self, conn: BaseConnection[Any], keys: Sequence[Key]
+    ) -> PQGen[list[Key]]:
+        """
+        Generator to prepare in advance the statements identified by 'keys'.
+
+        Skip the statements already prepared. Return the keys of the statements
+        prepared by the call: the other ones failed, or were already prepared.
+        """
+        rv: list[Key] = []
+        if self.prepare_threshold is None:
+            return rv
+
+        names = {key: self._next_name() for key in keys if key not in self._names}
+        allres: list[list[PGresult]] = []
+        pgconn = conn.pgconn
+        if (
+            len(names) > 1
+            and capabilities.has_pipeline()
+            and not pgconn.pipeline_status
+        ):
+            # Send all the statements in a single round trip. Every PREPARE is
+            # followed by a sync, so that a failing one doesn't abort the others.
+            pgconn.enter_pipeline_mode()
+            for key, name in names.items():
+                pgconn.send_prepare(name, key[0], param_types=key[1])
+                pgconn.pipeline_sync()
+            yield from generators.send(pgconn)
+            for _ in names:
+                allres.append((yield from generators.fetch_many(pgconn)))
+                yield from generators.fetch_many(pgconn)  # the sync
+            pgconn.exit_pipeline_mode()
+        else:
+            for key, name in names.items():
+                pgconn.send_prepare(name, key[0], param_types=key[1])
+                allres.append((yield from generators.execute(pgconn)))
+
+        for (key, name), results in zip(names.items(), allres):
+            if not self._check_results(results):
+                continue
+
+            self._add_name(key, name, self._counts.pop(key, 0))
+            self._rotate()
+            rv.append(key)
+
+        yield from self.maintain_gen(conn)
+        return rv
@@ -21,6 +21,7 @@ from . import pq
 from .abc import AdaptContext, Buffer, LoadFunc, NoneType, PyFormat
 from .rows import Row, RowMaker
 from ._oids import INVALID_OID, TEXT_OID
+from ._columns import buffers_to_array
 from ._encodings import conn_encoding
 
 if TYPE_CHECKING:
@@ -330,6 +331,46 @@ class Transformer(AdaptContext):
 
         return make_row(record)
 
+    def load_columns(self, row0: int, row1: int) -> list[list[Any]]:
+        if not self._pgresult:
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        return [self._load_column(col, row0, row1) for col in range(self._nfields)]
+
+    def load_numpy(self, row0: int, row1: int) -> list[Any]:
+        if not (res := self._pgresult):
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        return [
+            buffers_to_array(
+                [res.get_value(row, col) for row in range(row0, row1)],
+                res.ftype(col),
+                res.fformat(col),  # type: ignore[arg-type]
+                self._row_loaders[col],
+            )
+            for col in range(self._nfields)
+        ]
+
+    def _load_column(self, col: int, row0: int, row1: int) -> list[Any]:
+        res = self._pgresult
+        assert res
+        load = self._row_loaders[col]
+        column: list[Any] = [None] * max(row1 - row0, 0)
+        for i, row in enumerate(range(row0, row1)):
+            if (val := res.get_value(row, col)) is not None:
+                column[i] = load(val)
+        return column
+
     def load_sequence(self, record: Sequence[Buffer | None]) -> tuple[Any, ...]:
         if len(self._row_loaders) != len(record):
             raise e.ProgrammingError(
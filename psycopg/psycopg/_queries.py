@@ -453,6 +453,170 @@ _ph_to_fmt = {
 }
 
 
+# Maximum number of parameters accepted by the server in a query
+MAX_QUERY_PARAMS = 65535
+
+_re_insert_values = re.compile(rb"(?is)\A\s*insert\s.*?\bvalues\s*\(")
+
+
+class InsertBatcher:
+    """
+    Helper to rewrite an ``INSERT ... VALUES`` query to insert several records.
+
+    In ``values`` mode the query is rewritten into ``INSERT ... VALUES (...),
+    (...), ...``, with one group of placeholders per record. In ``unnest``
+    mode it is rewritten into ``INSERT ... SELECT * FROM unnest(...)``, taking
+    an array per column, so that the query is the same for any number of
+    records.
+    """
+
+    __slots__ = ("mode", "max_records", "_prefix", "_suffix", "_row", "_parts")
+
+    def __init__(self, query: bytes, encoding: str, mode: str):
+        if mode not in ("values", "unnest"):
+            raise ValueError(f"bad batch: {mode}. It should be 'values' or 'unnest'")
+        self.mode = mode
+
+        if not (m := _re_insert_values.match(query)):
+            raise e.ProgrammingError(
+                "batch mode requires a query in the form 'INSERT ... VALUES (...)'"
+            )
+
+        items, end = _split_values_row(query, m.end(0), encoding)
+        self._prefix = query[: m.end(0) - 1].rstrip()[: -len(b"values")].rstrip()
+        self._suffix = query[end:]
+        if self._suffix.lstrip().startswith(b","):
+            raise e.ProgrammingError(
+                "batch mode requires a query with a single row of VALUES"
+            )
+
+        for chunk in (self._prefix, self._suffix):
+            if len(_split_query(chunk, encoding, collapse_double_percent=False)) > 1:
+                raise e.ProgrammingError(
+                    "in batch mode placeholders are only allowed in the VALUES row"
+                )
+
+        # The row of values, with positional placeholders, and its parts.
+        cols = []
+        self._parts: list[QueryPart] = []
+        for item in items:
+            parts = _split_query(item, encoding, collapse_double_percent=False)
+            self._parts.extend(parts[:-1])
+            chunks = [b"%s%%%s" % (p.pre, p.format.value.encode()) for p in parts[:-1]]
+            chunks.append(parts[-1].pre)
+            col = b"".join(chunks).strip()
+
+            if mode == "unnest":
+                if len(parts) != 2 or parts[0].pre.strip():
+                    raise e.ProgrammingError(
+                        "in 'unnest' batch mode every value must be a placeholder,"
+                        f" optionally with a cast, got '{item.strip().decode(encoding)}'"
+                    )
+                # Cast the placeholder to an array of the type requested.
+                if cast := parts[1].pre.strip():
+                    if not cast.startswith(b"::"):
+                        raise e.ProgrammingError(
+                            "in 'unnest' batch mode every value must be a"
+                            " placeholder, optionally with a cast, got"
+                            f" '{item.strip().decode(encoding)}'"
+                        )
+                    col += b"[]"
+
+            cols.append(col)
+
+        if not self._parts:
+            raise e.ProgrammingError("batch mode requires a query with placeholders")
+        if len({type(p.item) for p in self._parts}) > 1:
+            raise e.ProgrammingError(
+                "positional and named placeholders cannot be mixed"
+            )
+        self._parts.append(QueryPart(b"", 0, PyFormat.AUTO))
+        if isinstance(self._parts[0].item, int):
+            # Renumber the placeholders, as validate_and_reorder_params expects.
+            self._parts = [p._replace(item=i) for i, p in enumerate(self._parts)]
+
+        self._row = b", ".join(cols)
+
+        if mode == "values":
+            self.max_records = MAX_QUERY_PARAMS // (len(self._parts) - 1)
+        else:
+            self.max_records = MAX_QUERY_PARAMS
+
+    def query(self, nrecords: int) -> bytes:
+        """
+        Return the query to insert `!nrecords` records.
+        """
+        if self.mode == "values":
+            rows = b", ".join([b"(%s)" % self._row] * nrecords)
+            return b"%s VALUES %s%s" % (self._prefix, rows, self._suffix)
+        else:
+            return b"%s SELECT * FROM unnest(%s)%s" % (
+                self._prefix,
+                self._row,
+                self._suffix,
+            )
+
+    def params(self, records: Sequence[Params]) -> list[Any]:
+        """
+        Return the parameters to pass to `query()` to insert `!records`.
+        """
+        parts = self._parts
+        order: list[str] | None = None
+        if isinstance(parts[0].item, str):
+            order = [p.item for p in parts[:-1]]  # type: ignore[misc]
+
+        rv: list[Any]
+        if self.mode == "values":
+            rv = []
+            for rec in records:
+                rv.extend(PostgresQuery.validate_and_reorder_params(parts, rec, order))
+        else:
+            rv = [[] for _ in range(len(parts) - 1)]
+            for rec in records:
+                values = PostgresQuery.validate_and_reorder_params(parts, rec, order)
+                for col, value in zip(rv, values):
+                    col.append(value)
+
+        return rv
+
+
+def _split_values_row(
+    query: bytes, start: int, encoding: str
+) -> tuple[list[bytes], int]:
+    """
+    Split the items of the VALUES row of an INSERT query.
+
+    `!start` is the position after the opening parenthesis. Return the items
+    and the position after the closing parenthesis.
+    """
+    rv: list[bytes] = []
+    depth = 0
+    quote = None
+    i = item_start = start
+    while i < len(query):
+        c = query[i : i + 1]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c == b"'" or c == b'"':
+            quote = c
+        elif c == b"(":
+            depth += 1
+        elif c == b")":
+            if not depth:
+                rv.append(query[item_start:i])
+                return rv, i + 1
+            depth -= 1
+        elif c == b"," and not depth:
+            rv.append(query[item_start:i])
+            item_start = i + 1
+        i += 1
+
+    raise e.ProgrammingError(
+        f"unbalanced parentheses in the query: '{query.decode(encoding)}'"
+    )
+
+
 class PostgresRawQuery(PostgresQuery):
     def convert(self, query: Query, vars: Params | None) -> None:
         if isinstance(query, Template):
@@ -100,7 +100,13 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         return self
 
     def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = True
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = True,
+        batch: str | None = None,
+        batch_size: int = 1000,
     ) -> None:
         """Method not implemented for server-side cursors."""
         raise e.NotSupportedError("executemany not supported on server-side cursors")
@@ -128,18 +134,35 @@ class ServerCursor(ServerCursorMixin["Connection[Any]", Row], Cursor[Row]):
         self._pos += len(recs)
         return recs
 
+    def fetch_columns(self, size: int | None = None) -> list[list[Any]]:
+        with self._conn.lock:
+            nrows, columns = self._conn.wait(self._fetch_columns_gen(size))
+        self._pos += nrows
+        return columns
+
+    def fetch_numpy(self, size: int | None = None) -> list[Any]:
+        with self._conn.lock:
+            nrows, arrays = self._conn.wait(self._fetch_numpy_gen(size))
+        self._pos += nrows
+        return arrays
+
+    def fetch_arrow(self, size: int | None = None) -> Any:
+        with self._conn.lock:
+            nrows, arrays = self._conn.wait(self._fetch_numpy_gen(size))
+        self._pos += nrows
+        return self._make_arrow_batch(arrays)
+
     def __iter__(self) -> Self:
         return self
 
     def __next__(self) -> Row:
         # Fetch a new page if we never fetched any, or we are at the end of
-        # a page of size itersize, meaning there is likely a following one.
-        if (
-            self._iter_rows is None
-            or self._page_pos >= len(self._iter_rows) >= self.itersize
+        # a full page, meaning there is likely a following one.
+        if self._iter_rows is None or (
+            self._page_pos >= len(self._iter_rows) and self._iter_more
         ):
             with self._conn.lock:
-                self._iter_rows = self._conn.wait(self._fetch_gen(self.itersize))
+                self._iter_rows = self._conn.wait(self._iter_page_gen())
                 self._page_pos = 0
 
         if self._page_pos >= len(self._iter_rows):
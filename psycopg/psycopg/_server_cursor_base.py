@@ -6,19 +6,27 @@ psycopg server-side cursor base objects.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any, TypeVar
 from warnings import warn
+from collections.abc import Callable
 
 from . import errors as e
 from . import pq, sql
 from .abc import ConnectionType, Params, PQGen, Query
 from .rows import Row
 from ._compat import Interpolation, Template
-from .generators import execute
+from ._columns import concat_arrays
+from .generators import execute, fetch_many, send
 from ._cursor_base import BaseCursor
 
+if TYPE_CHECKING:
+    from .pq.abc import PGresult
+
 DEFAULT_ITERSIZE = 100
 
+# Number of records to measure to adapt itersize to the records size.
+ITERSIZE_SAMPLES = 10
+
 TEXT = pq.Format.TEXT
 BINARY = pq.Format.BINARY
 
@@ -28,12 +36,15 @@ TUPLES_OK = pq.ExecStatus.TUPLES_OK
 IDLE = pq.TransactionStatus.IDLE
 INTRANS = pq.TransactionStatus.INTRANS
 
+T = TypeVar("T")
+
 
 class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
     """Mixin to add ServerCursor behaviour and implementation a BaseCursor."""
 
     __slots__ = """_name _scrollable _withhold _described itersize _format
-        _iter_rows _page_pos
+        _iter_rows _page_pos _iter_more prefetch _prefetching _prefetched
+        _prefetched_pos itersize_bytes _fetch_stmt
     """.split()
 
     def __init__(self, name: str, scrollable: bool | None, withhold: bool):
@@ -44,9 +55,27 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self.itersize: int = DEFAULT_ITERSIZE
         self._format = TEXT
 
-        # Hold the state during iteration: a fetched page and position within it
+        # If set, adapt itersize to fetch pages of about this size.
+        self.itersize_bytes: int | None = None
+
+        # Hold the state during iteration: a fetched page and position within
+        # it, and whether the page was full, meaning there are likely more.
         self._iter_rows: list[Row] | None = None
         self._page_pos = 0
+        self._iter_more = False
+
+        # Number of pages to fetch ahead during iteration. If a FETCH is sent
+        # ahead, '_prefetching' is set until its results are received in
+        # '_prefetched'. The server position is past these records, so they
+        # must be returned before fetching more, by iteration or by fetch*():
+        # '_prefetched_pos' is the number of records already returned.
+        self.prefetch: int = 0
+        self._prefetching = False
+        self._prefetched: list[PGresult] | None = None
+        self._prefetched_pos = 0
+
+        # The last FETCH statement used, with the number of records fetched.
+        self._fetch_stmt: tuple[int | None, bytes] | None = None
 
     def __del__(self, __warn: Any = warn) -> None:
         if self.closed:
@@ -106,6 +135,8 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
 
         query = self._make_declare_statement(query)
 
+        yield from self._discard_prefetch_gen()
+
         # If the cursor is being reused, the previous one must be closed.
         if self._described:
             yield from self._close_gen()
@@ -137,6 +168,7 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         self._described = True
 
     def _close_gen(self) -> PQGen[None]:
+        yield from self._discard_prefetch_gen()
         ts = self._conn.pgconn.transaction_status
 
         # if the connection is not in a sane state, don't even try
@@ -163,28 +195,208 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         yield from self._conn._exec_command(query)
 
     def _fetch_gen(self, num: int | None) -> PQGen[list[Row]]:
+        chunks = yield from self._fetch_chunks_gen(num, self._load_rows)
+        rows = chunks[0][1]
+        for _, more in chunks[1:]:
+            rows.extend(more)
+        return rows
+
+    def _fetch_columns_gen(self, num: int | None) -> PQGen[tuple[int, list[list[Any]]]]:
+        chunks = yield from self._fetch_chunks_gen(num, self._load_columns)
+        nrows, columns = chunks[0]
+        for n, more in chunks[1:]:
+            nrows += n
+            for column, values in zip(columns, more):
+                column.extend(values)
+        return nrows, columns
+
+    def _fetch_numpy_gen(self, num: int | None) -> PQGen[tuple[int, list[Any]]]:
+        chunks = yield from self._fetch_chunks_gen(num, self._load_numpy)
+        if len(chunks) == 1:
+            return chunks[0]
+
+        nrows = sum(n for n, _ in chunks)
+        arrays = [concat_arrays(arrs) for arrs in zip(*(c[1] for c in chunks))]
+        return nrows, arrays
+
+    # The transformer may change during fetch: don't pass its bound methods.
+
+    def _load_rows(self, row0: int, row1: int) -> list[Row]:
+        return self._tx.load_rows(row0, row1, self._make_row)
+
+    def _load_columns(self, row0: int, row1: int) -> list[list[Any]]:
+        return self._tx.load_columns(row0, row1)
+
+    def _load_numpy(self, row0: int, row1: int) -> list[Any]:
+        return self._tx.load_numpy(row0, row1)
+
+    def _fetch_chunks_gen(
+        self, num: int | None, load: Callable[[int, int], T]
+    ) -> PQGen[list[tuple[int, T]]]:
+        """Fetch *num* records, all the remaining ones if `!None`.
+
+        Return the records fetched ahead during iteration first, and fetch
+        the missing ones from the server. Return the records of every result
+        used, loaded by `!load(row0, row1)`, together with their number.
+        """
+        if self.closed:
+            raise e.InterfaceError("the cursor is closed")
+        if self._prefetching:
+            yield from self._recv_prefetch_gen()
+
+        chunks: list[tuple[int, T]] = []
+        if taken := self._take_prefetched(num):
+            res, row0, row1 = taken
+            self.pgresult = res
+            self._tx.set_pgresult(res, set_loaders=False)
+            chunks.append((row1 - row0, load(row0, row1)))
+            if num is not None and not (num := num - (row1 - row0)):
+                return chunks
+
+        res = yield from self._fetch_result_gen(num)
+        chunks.append((res.ntuples, load(0, res.ntuples)))
+        return chunks
+
+    def _fetch_result_gen(self, num: int | None) -> PQGen[PGresult]:
+        """Fetch *num* records from the server.
+
+        The records fetched ahead must have been returned already.
+        """
         if self.closed:
             raise e.InterfaceError("the cursor is closed")
+
         # If we are stealing the cursor, make sure we know its shape
         if not self._described:
             yield from self._start_query()
             yield from self._describe_gen()
 
-        query = sql.SQL("FETCH FORWARD {} FROM {}").format(
-            sql.SQL("ALL") if num is None else sql.Literal(num),
-            sql.Identifier(self._name),
-        )
+        query = self._make_fetch_statement(num)
         res = yield from self._conn._exec_command(query, result_format=self._format)
         # pipeline mode otherwise, unsupported here.
         assert res is not None
 
         self.pgresult = res
         self._tx.set_pgresult(res, set_loaders=False)
-        return self._tx.load_rows(0, res.ntuples, self._make_row)
+        return res
+
+    def _iter_page_gen(self) -> PQGen[list[Row]]:
+        """Generator returning the next page of records during iteration.
+
+        If `prefetch` is set, send the FETCH for the following records before
+        returning, so that the server can process it while the records are
+        consumed.
+        """
+        if self._prefetching:
+            yield from self._recv_prefetch_gen()
+
+        if (taken := self._take_prefetched(None)) is None:
+            # Nothing fetched ahead: fetch the page now.
+            nrows = self.itersize
+            res = yield from self._fetch_result_gen(nrows)
+            row0, row1 = 0, res.ntuples
+        else:
+            res, row0, row1 = taken
+            self.pgresult = res
+            self._tx.set_pgresult(res, set_loaders=False)
+            nrows = self.prefetch * self.itersize
+
+        # If the page is full, there are likely more records to fetch.
+        self._iter_more = res.ntuples >= nrows
+        if self.itersize_bytes:
+            self._adapt_itersize(res, self.itersize_bytes)
+        if self._iter_more and self.prefetch > 0:
+            yield from self._send_prefetch_gen()
+
+        return self._load_rows(row0, row1)
+
+    def _adapt_itersize(
+        self, res: PGresult, nbytes: int, __nsamples: int = ITERSIZE_SAMPLES
+    ) -> None:
+        """Set `itersize` to fetch about 'nbytes' of data with every page.
+
+        Estimate the size of the records from a sample of the ones in 'res'.
+        """
+        if not (ntuples := res.ntuples):
+            return
+
+        rows = range(0, ntuples, max(ntuples // __nsamples, 1))[:__nsamples]
+        size = 0
+        for i in rows:
+            for j in range(res.nfields):
+                if v := res.get_value(i, j):
+                    size += len(v)
+
+        width = max(size // len(rows), 1)
+        self.itersize = max(nbytes // width, 1)
+
+    def _send_prefetch_gen(self) -> PQGen[None]:
+        """Send a FETCH for the next pages without waiting for its result."""
+        query = self._make_fetch_statement(self.prefetch * self.itersize)
+        self._pgconn.send_query_params(query, None, result_format=self._format)
+        self._prefetching = True
+        self._conn._prefetch_cursor = self
+        yield from send(self._pgconn)
+
+    def _recv_prefetch_gen(self, check: bool = True) -> PQGen[None]:
+        """Receive the result of the FETCH sent ahead.
+
+        This function is called by the connection too, if it needs to run
+        other commands while the FETCH result is pending.
+
+        If the FETCH failed raise the error, unless *check* is `!False`, in
+        which case the result is dropped.
+        """
+        self._prefetching = False
+        self._conn._prefetch_cursor = None
+        self._prefetched = None
+        results = yield from fetch_many(self._pgconn)
+        try:
+            self._check_results(results)
+        except e.Error:
+            if check:
+                raise
+        else:
+            self._prefetched = results
+            self._prefetched_pos = 0
+
+    def _take_prefetched(self, num: int | None) -> tuple[PGresult, int, int] | None:
+        """Take up to *num* records fetched ahead and not returned yet.
+
+        Return the result containing them and the range of the records taken,
+        `!None` if there is no record fetched ahead.
+        """
+        if (results := self._prefetched) is None:
+            return None
+
+        res = results[-1]
+        row0 = self._prefetched_pos
+        row1 = res.ntuples if num is None else min(row0 + num, res.ntuples)
+        if row1 >= res.ntuples:
+            self._prefetched = None
+        else:
+            self._prefetched_pos = row1
+        return res, row0, row1
+
+    def _discard_prefetch_gen(self) -> PQGen[None]:
+        """Drop the records fetched ahead and not returned yet."""
+        if self._prefetching:
+            yield from self._recv_prefetch_gen()
+        self._prefetched = None
 
     def _scroll_gen(self, value: int, mode: str) -> PQGen[None]:
         if mode not in ("relative", "absolute"):
             raise ValueError(f"bad mode: {mode}. It should be 'relative' or 'absolute'")
+        if self._prefetching:
+            yield from self._recv_prefetch_gen()
+        if mode == "relative" and (results := self._prefetched):
+            # The server is ahead of the position by the records fetched ahead.
+            nahead = results[-1].ntuples - self._prefetched_pos
+            if 0 <= value <= nahead:
+                self._take_prefetched(value)
+                return
+            value -= nahead
+        self._prefetched = None
+
         query = sql.SQL("MOVE{} {} FROM {}").format(
             sql.SQL(" ABSOLUTE" if mode == "absolute" else ""),
             sql.Literal(value),
@@ -192,6 +404,19 @@ class ServerCursorMixin(BaseCursor[ConnectionType, Row]):
         )
         yield from self._conn._exec_command(query)
 
+    def _make_fetch_statement(self, num: int | None) -> bytes:
+        # Iteration fetches the same number of records over and over: don't
+        # compose the same statement again on every page.
+        if self._fetch_stmt and self._fetch_stmt[0] == num:
+            return self._fetch_stmt[1]
+
+        query = sql.SQL("FETCH FORWARD {} FROM {}").format(
+            sql.SQL("ALL") if num is None else sql.Literal(num),
+            sql.Identifier(self._name),
+        )
+        self._fetch_stmt = (num, query.as_bytes(self._conn))
+        return self._fetch_stmt[1]
+
     def _make_declare_statement(self, query: Query) -> Query:
         parts = [sql.SQL("DECLARE"), sql.Identifier(self._name)]
         if self._scrollable is not None:
@@ -244,6 +244,10 @@ class Transformer(Protocol):
 
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Row: ...
 
+    def load_columns(self, row0: int, row1: int) -> list[list[Any]]: ...
+
+    def load_numpy(self, row0: int, row1: int) -> list[Any]: ...
+
     def load_sequence(self, record: Sequence[Buffer | None]) -> tuple[Any, ...]: ...
 
     def get_loader(self, oid: int, format: pq.Format) -> Loader: ...
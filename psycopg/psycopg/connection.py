@@ -30,6 +30,7 @@ from ._compat import Self, Template
 from ._acompat import Lock
 from .conninfo import conninfo_attempts, conninfo_to_dict, make_conninfo
 from .conninfo import timeout_from_conninfo
+from ._pipeline_base import PipelinedQuery
 from ._pipeline import Pipeline
 from .generators import notifies
 from .transaction import Transaction
@@ -85,6 +86,7 @@ class Connection(BaseConnection[Row]):
         *,
         autocommit: bool = False,
         prepare_threshold: int | None = 5,
+        auto_pipeline: bool = False,
         context: AdaptContext | None = None,
         row_factory: RowFactory[Row] | None = None,
         cursor_factory: type[Cursor[Row]] | None = None,
@@ -147,6 +149,8 @@ class Connection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        if auto_pipeline:
+            rv.auto_pipeline = auto_pipeline
         return rv
 
     def __enter__(self) -> Self:
@@ -434,19 +438,30 @@ class Connection(BaseConnection[Row]):
                 self._notifies_backlog = d
 
     @contextmanager
-    def pipeline(self) -> Iterator[Pipeline]:
+    def pipeline(
+        self,
+        *,
+        max_in_flight: int | None = None,
+        max_in_flight_bytes: int | None = None,
+    ) -> Iterator[Pipeline]:
         """Context manager to switch the connection into pipeline mode."""
         with self.lock:
             self._check_connection_ok()
 
             if (pipeline := self._pipeline) is None:
                 # WARNING: reference loop, broken ahead.
-                pipeline = self._pipeline = Pipeline(self)
+                pipeline = Pipeline(self)
+
+            # Limits set on a nested block only last until its end.
+            window = (pipeline.max_in_flight, pipeline.max_in_flight_bytes)
+            pipeline._set_window(max_in_flight, max_in_flight_bytes)
+            self._pipeline = pipeline
 
         try:
             with pipeline:
                 yield pipeline
         finally:
+            pipeline.max_in_flight, pipeline.max_in_flight_bytes = window
             if pipeline.level == 0:
                 with self.lock:
                     assert pipeline is self._pipeline
@@ -473,6 +488,68 @@ class Connection(BaseConnection[Row]):
             assert pipeline is self._pipeline
             self._pipeline = None
 
+    def _execute_pipelined(self, query: PipelinedQuery) -> None:
+        """Execute a query in automatic pipeline mode.
+
+        The query is queued, then executed by the first task obtaining the
+        lock, together with all the other queries queued in the meantime.
+        """
+        self._pipeline_queue.append(query)
+        try:
+            with self.lock:
+                if not query.done:
+                    self._execute_batch(self._take_pipeline_queue())
+        except BaseException:
+            if not query.done:
+                try:
+                    self._pipeline_queue.remove(query)
+                except ValueError:
+                    pass
+            raise
+
+        if query.error:
+            raise query.error
+
+    def _execute_batch(self, queries: list[PipelinedQuery]) -> None:
+        """Execute a batch of queries queued in automatic pipeline mode.
+
+        Assume that the caller is holding the lock.
+        """
+        try:
+            # If the connection is already in pipeline mode, because of a
+            # pipeline() block, just add the queries to it.
+            if len(queries) > 1 and (not self._pipeline):
+                # WARNING: reference loop, broken ahead.
+                pipeline = self._pipeline = Pipeline(self, _no_lock=True)
+                try:
+                    self.wait(pipeline._execute_batch_gen(queries))
+                finally:
+                    self._pipeline = None
+            else:
+                for query in queries:
+                    try:
+                        self.wait(
+                            query.cursor._execute_gen(
+                                query.query,
+                                query.params,
+                                prepare=query.prepare,
+                                binary=query.binary,
+                            )
+                        )
+                    except Exception as ex:
+                        query.error = ex
+        except BaseException as ex:
+            # Don't propagate a cancellation to the other tasks
+            if not isinstance(ex, Exception):
+                ex = e.OperationalError(f"query interrupted: {ex!r}")
+            for query in queries:
+                if query.error is None:
+                    query.error = ex
+            raise
+        finally:
+            for query in queries:
+                query.done = True
+
     def wait(self, gen: PQGen[RV], interval: float = _WAIT_INTERVAL) -> RV:
         """
         Consume a generator operating on the connection.
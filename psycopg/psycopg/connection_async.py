@@ -31,6 +31,7 @@ from .transaction import AsyncTransaction
 from .cursor_async import AsyncCursor
 from ._capabilities import capabilities
 from ._conninfo_utils import gssapi_requested
+from ._pipeline_base import PipelinedQuery
 from ._pipeline_async import AsyncPipeline
 from ._connection_base import BaseConnection, CursorRow, Notify
 from ._server_cursor_async import AsyncServerCursor
@@ -89,6 +90,7 @@ class AsyncConnection(BaseConnection[Row]):
         *,
         autocommit: bool = False,
         prepare_threshold: int | None = 5,
+        auto_pipeline: bool = False,
         context: AdaptContext | None = None,
         row_factory: AsyncRowFactory[Row] | None = None,
         cursor_factory: type[AsyncCursor[Row]] | None = None,
@@ -168,6 +170,8 @@ class AsyncConnection(BaseConnection[Row]):
         if context:
             rv._adapters = AdaptersMap(context.adapters)
         rv.prepare_threshold = prepare_threshold
+        if auto_pipeline:
+            rv.auto_pipeline = auto_pipeline
         return rv
 
     async def __aenter__(self) -> Self:
@@ -469,19 +473,30 @@ class AsyncConnection(BaseConnection[Row]):
                 self._notifies_backlog = d
 
     @asynccontextmanager
-    async def pipeline(self) -> AsyncIterator[AsyncPipeline]:
+    async def pipeline(
+        self,
+        *,
+        max_in_flight: int | None = None,
+        max_in_flight_bytes: int | None = None,
+    ) -> AsyncIterator[AsyncPipeline]:
         """Context manager to switch the connection into pipeline mode."""
         async with self.lock:
             self._check_connection_ok()
 
             if (pipeline := self._pipeline) is None:
                 # WARNING: reference loop, broken ahead.
-                pipeline = self._pipeline = AsyncPipeline(self)
+                pipeline = AsyncPipeline(self)
+
+            # Limits set on a nested block only last until its end.
+            window = (pipeline.max_in_flight, pipeline.max_in_flight_bytes)
+            pipeline._set_window(max_in_flight, max_in_flight_bytes)
+            self._pipeline = pipeline
 
         try:
             async with pipeline:
                 yield pipeline
         finally:
+            pipeline.max_in_flight, pipeline.max_in_flight_bytes = window
             if pipeline.level == 0:
                 async with self.lock:
                     assert pipeline is self._pipeline
@@ -508,6 +523,68 @@ class AsyncConnection(BaseConnection[Row]):
             assert pipeline is self._pipeline
             self._pipeline = None
 
+    async def _execute_pipelined(self, query: PipelinedQuery) -> None:
+        """Execute a query in automatic pipeline mode.
+
+        The query is queued, then executed by the first task obtaining the
+        lock, together with all the other queries queued in the meantime.
+        """
+        self._pipeline_queue.append(query)
+        try:
+            async with self.lock:
+                if not query.done:
+                    await self._execute_batch(self._take_pipeline_queue())
+        except BaseException:
+            if not query.done:
+                try:
+                    self._pipeline_queue.remove(query)
+                except ValueError:
+                    pass
+            raise
+
+        if query.error:
+            raise query.error
+
+    async def _execute_batch(self, queries: list[PipelinedQuery]) -> None:
+        """Execute a batch of queries queued in automatic pipeline mode.
+
+        Assume that the caller is holding the lock.
+        """
+        try:
+            # If the connection is already in pipeline mode, because of a
+            # pipeline() block, just add the queries to it.
+            if len(queries) > 1 and not self._pipeline:
+                # WARNING: reference loop, broken ahead.
+                pipeline = self._pipeline = AsyncPipeline(self, _no_lock=True)
+                try:
+                    await self.wait(pipeline._execute_batch_gen(queries))
+                finally:
+                    self._pipeline = None
+            else:
+                for query in queries:
+                    try:
+                        await self.wait(
+                            query.cursor._execute_gen(
+                                query.query,
+                                query.params,
+                                prepare=query.prepare,
+                                binary=query.binary,
+                            )
+                        )
+                    except Exception as ex:
+                        query.error = ex
+        except BaseException as ex:
+            # Don't propagate a cancellation to the other tasks
+            if not isinstance(ex, Exception):
+                ex = e.OperationalError(f"query interrupted: {ex!r}")
+            for query in queries:
+                if query.error is None:
+                    query.error = ex
+            raise
+        finally:
+            for query in queries:
+                query.done = True
+
     async def wait(self, gen: PQGen[RV], interval: float = _WAIT_INTERVAL) -> RV:
         """
         Consume a generator operating on the connection.
@@ -13,11 +13,13 @@ AsyncCopy = _copy_async.AsyncCopy
 AsyncWriter = _copy_async.AsyncWriter
 AsyncLibpqWriter = _copy_async.AsyncLibpqWriter
 AsyncQueuedLibpqWriter = _copy_async.AsyncQueuedLibpqWriter
+AsyncParallelCopy = _copy_async.AsyncParallelCopy
 
 Copy = _copy.Copy
 Writer = _copy.Writer
 LibpqWriter = _copy.LibpqWriter
 QueuedLibpqWriter = _copy.QueuedLibpqWriter
+ParallelCopy = _copy.ParallelCopy
 
 
 class FileWriter(Writer):
@@ -18,6 +18,7 @@ from .copy import AsyncCopy, AsyncWriter
 from .rows import AsyncRowFactory, Row, RowMaker
 from ._compat import Self, Template
 from ._cursor_base import BaseCursor
+from ._pipeline_base import PipelinedQuery
 from ._pipeline_async import AsyncPipeline
 
 if TYPE_CHECKING:
@@ -72,6 +73,7 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
     @row_factory.setter
     def row_factory(self, row_factory: AsyncRowFactory[Row]) -> None:
         self._row_factory = row_factory
+        self._row_cache = None
         if self.pgresult:
             self._make_row = row_factory(self)
 
@@ -109,16 +111,27 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         Execute a query or command to the database.
         """
         try:
-            async with self._conn.lock:
-                await self._conn.wait(
-                    self._execute_gen(query, params, prepare=prepare, binary=binary)
+            if self._conn._auto_pipeline:
+                await self._conn._execute_pipelined(
+                    PipelinedQuery(self, query, params, prepare=prepare, binary=binary)
                 )
+            else:
+                async with self._conn.lock:
+                    await self._conn.wait(
+                        self._execute_gen(query, params, prepare=prepare, binary=binary)
+                    )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
         return self
 
     async def executemany(
-        self, query: Query, params_seq: Iterable[Params], *, returning: bool = False
+        self,
+        query: Query,
+        params_seq: Iterable[Params],
+        *,
+        returning: bool = False,
+        batch: str | None = None,
+        batch_size: int = 1000,
     ) -> None:
         """
         Execute the same command with a sequence of input data.
@@ -130,19 +143,23 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
                     # sending unnecessary Sync.
                     if self._conn._pipeline:
                         await self._conn.wait(
-                            self._executemany_gen_pipeline(query, params_seq, returning)
+                            self._executemany_gen_pipeline(
+                                query, params_seq, returning, batch, batch_size
+                            )
                         )
                     # Otherwise, make a new one
                     else:
                         async with self._conn._pipeline_nolock():
                             await self._conn.wait(
                                 self._executemany_gen_pipeline(
-                                    query, params_seq, returning
+                                    query, params_seq, returning, batch, batch_size
                                 )
                             )
                 else:
                     await self._conn.wait(
-                        self._executemany_gen_no_pipeline(query, params_seq, returning)
+                        self._executemany_gen_no_pipeline(
+                            query, params_seq, returning, batch, batch_size
+                        )
                     )
         except e._NO_TRACEBACK as ex:
             raise ex.with_traceback(None)
@@ -178,24 +195,42 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
             except e._NO_TRACEBACK as ex:
                 raise ex.with_traceback(None)
             finally:
-                if self._pgconn.transaction_status == ACTIVE:
-                    # Try to cancel the query, then consume the results
-                    # already received.
-                    await self._conn._try_cancel()
-                    try:
-                        while await self._conn.wait(
-                            self._stream_fetchone_gen(first=False)
-                        ):
-                            pass
-                    except Exception:
-                        pass
-
-                    # Try to get out of ACTIVE state. Just do a single attempt, which
-                    # should work to recover from an error or query cancelled.
-                    try:
-                        await self._conn.wait(self._stream_fetchone_gen(first=False))
-                    except Exception:
-                        pass
+                await self._stream_end()
+
+    async def stream_batches(
+        self,
+        query: Query,
+        params: Params | None = None,
+        *,
+        binary: bool | None = None,
+        size: int = 1,
+    ) -> AsyncIterator[list[Row]]:
+        """
+        Iterate on a result from the database, a chunk of records at a time.
+
+        :param size: the number of records to retrieve from the server in each
+            chunk; if greater than 1, this is only available from version 17
+            of the libpq.
+
+        Yield a list of records for every chunk received. The parameters are
+        the same of `stream()`.
+        """
+        if self._pgconn.pipeline_status:
+            raise e.ProgrammingError("stream_batches() cannot be used in pipeline mode")
+
+        async with self._conn.lock:
+            try:
+                await self._conn.wait(
+                    self._stream_send_gen(query, params, binary=binary, size=size)
+                )
+                first = True
+                while res := await self._conn.wait(self._stream_fetchone_gen(first)):
+                    yield self._tx.load_rows(0, res.ntuples, self._make_row)
+                    first = False
+            except e._NO_TRACEBACK as ex:
+                raise ex.with_traceback(None)
+            finally:
+                await self._stream_end()
 
     async def results(self) -> AsyncIterator[Self]:
         """
@@ -285,6 +320,50 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         self._pos = res.ntuples
         return records
 
+    async def fetch_columns(self, size: int | None = None) -> list[list[Any]]:
+        """
+        Return the next records from the current result set, organised by column.
+
+        Return a list with one item per column, each one a list of the column
+        values. Return up to `!size` records, or all the remaining ones if
+        `!size` is not specified.
+        """
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        end = res.ntuples if size is None else min(self._pos + size, res.ntuples)
+        columns = self._tx.load_columns(self._pos, end)
+        self._pos = end
+        return columns
+
+    async def fetch_numpy(self, size: int | None = None) -> list[Any]:
+        """
+        Return the next records from the current result set as NumPy arrays.
+
+        Return a list with one `numpy.ma.MaskedArray` per column, with the
+        null values masked. Return up to `!size` records, or all the
+        remaining ones if `!size` is not specified.
+        """
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        end = res.ntuples if size is None else min(self._pos + size, res.ntuples)
+        arrays = self._tx.load_numpy(self._pos, end)
+        self._pos = end
+        return arrays
+
+    async def fetch_arrow(self, size: int | None = None) -> Any:
+        """
+        Return the next records from the current result set as an Arrow batch.
+
+        Return a `!pyarrow.RecordBatch` with up to `!size` records, or all the
+        remaining ones if `!size` is not specified.
+        """
+        await self._fetch_pipeline()
+        res = self._check_result_for_fetch()
+        end = res.ntuples if size is None else min(self._pos + size, res.ntuples)
+        arrays = self._tx.load_numpy(self._pos, end)
+        self._pos = end
+        return self._make_arrow_batch(arrays)
+
     def __aiter__(self) -> Self:
         return self
 
@@ -335,6 +414,27 @@ class AsyncCursor(BaseCursor["AsyncConnection[Any]", Row]):
         # read its properties (especially rowcount).
         self._select_current_result(0)
 
+    async def _stream_end(self) -> None:
+        """
+        Restore the connection state after a `stream()` interrupted early.
+        """
+        if self._pgconn.transaction_status == ACTIVE:
+            # Try to cancel the query, then consume the results
+            # already received.
+            await self._conn._try_cancel()
+            try:
+                while await self._conn.wait(self._stream_fetchone_gen(first=False)):
+                    pass
+            except Exception:
+                pass
+
+            # Try to get out of ACTIVE state. Just do a single attempt, which
+            # should work to recover from an error or query cancelled.
+            try:
+                await self._conn.wait(self._stream_fetchone_gen(first=False))
+            except Exception:
+                pass
+
     async def _fetch_pipeline(self) -> None:
         if (
             self._execmany_returning is not False
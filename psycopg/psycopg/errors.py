@@ -75,6 +75,11 @@ class FinishedPGconn:
     notice_handler: Callable[[PGresult], None] | None = None
     notify_handler: Callable[[PGnotify], None] | None = None
 
+    _nwaits: int = 0
+    _wait_time: float = 0.0
+    _nresults: int = 0
+    _nrows: int = 0
+
     @staticmethod
     def _raise() -> NoReturn:
         raise OperationalError("the connection is closed")
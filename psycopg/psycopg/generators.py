@@ -158,9 +158,10 @@ def _send(pgconn: PGconn) -> PQGen[None]:
     to retrieve the results available.
     """
     while pgconn.flush() != 0:
-
+        t0 = monotonic()
         while not (ready := (yield WAIT_RW)):
             continue
+        _waited(pgconn, t0)
 
         if ready & READY_R:
             # This call may read notifies: they will be saved in the
@@ -222,6 +223,7 @@ def _fetch(pgconn: PGconn) -> PQGen[PGresult | None]:
     Return a result from the database (whether success or error).
     """
     if pgconn.is_busy():
+        t0 = monotonic()
         while not (yield WAIT_R):
             continue
 
@@ -231,10 +233,13 @@ def _fetch(pgconn: PGconn) -> PQGen[PGresult | None]:
                 break
             while not (yield WAIT_R):
                 continue
+        _waited(pgconn, t0)
 
     _consume_notifies(pgconn)
 
-    return pgconn.get_result()
+    if result := pgconn.get_result():
+        _received(pgconn, result)
+    return result
 
 
 def _pipeline_communicate(
@@ -248,8 +253,10 @@ def _pipeline_communicate(
     results = []
 
     while True:
+        t0 = monotonic()
         while not (ready := (yield WAIT_RW)):
             continue
+        _waited(pgconn, t0)
 
         if ready & READY_R:
             pgconn.consume_input()
@@ -262,7 +269,10 @@ def _pipeline_communicate(
                         break
                     results.append(res)
                     res = []
-                elif (status := r.status) == PIPELINE_SYNC:
+                    continue
+
+                _received(pgconn, r)
+                if (status := r.status) == PIPELINE_SYNC:
                     assert not res
                     results.append([r])
                 elif status == COPY_IN or status == COPY_OUT or status == COPY_BOTH:
@@ -284,6 +294,18 @@ def _pipeline_communicate(
     return results
 
 
+def _waited(pgconn: PGconn, start: float) -> None:
+    # Account for a wait for the socket to be ready, started at 'start'.
+    pgconn._nwaits += 1
+    pgconn._wait_time += monotonic() - start
+
+
+def _received(pgconn: PGconn, result: PGresult) -> None:
+    # Account for a result received from the server.
+    pgconn._nresults += 1
+    pgconn._nrows += result.ntuples
+
+
 def _consume_notifies(pgconn: PGconn) -> None:
     # Consume notifies
     while n := pgconn.notifies():
@@ -311,8 +333,10 @@ def copy_from(pgconn: PGconn) -> PQGen[memoryview | PGresult]:
             break
 
         # would block
+        t0 = monotonic()
         while not (yield WAIT_R):
             continue
+        _waited(pgconn, t0)
         pgconn.consume_input()
 
     if nbytes > 0:
@@ -339,8 +363,10 @@ def copy_to(pgconn: PGconn, buffer: Buffer, flush: bool = True) -> PQGen[None]:
     # into smaller ones. We prefer to do it there instead of here in order to
     # do it upstream the queue decoupling the writer task from the producer one.
     while pgconn.put_copy_data(buffer) == 0:
+        t0 = monotonic()
         while not (yield WAIT_W):
             continue
+        _waited(pgconn, t0)
 
     # Flushing often has a good effect on macOS because memcpy operations
     # seem expensive on this platform so accumulating a large buffer has a
@@ -348,8 +374,10 @@ def copy_to(pgconn: PGconn, buffer: Buffer, flush: bool = True) -> PQGen[None]:
     if flush:
         # Repeat until it the message is flushed to the server
         while True:
+            t0 = monotonic()
             while not (yield WAIT_W):
                 continue
+            _waited(pgconn, t0)
 
             if pgconn.flush() == 0:
                 break
@@ -358,13 +386,17 @@ def copy_to(pgconn: PGconn, buffer: Buffer, flush: bool = True) -> PQGen[None]:
 def copy_end(pgconn: PGconn, error: bytes | None) -> PQGen[PGresult]:
     # Retry enqueuing end copy message until successful
     while pgconn.put_copy_end(error) == 0:
+        t0 = monotonic()
         while not (yield WAIT_W):
             continue
+        _waited(pgconn, t0)
 
     # Repeat until it the message is flushed to the server
     while True:
+        t0 = monotonic()
         while not (yield WAIT_W):
             continue
+        _waited(pgconn, t0)
 
         if pgconn.flush() == 0:
             break
@@ -23,6 +23,12 @@ class PGconn(Protocol):
     notice_handler: Callable[[PGresult], None] | None
     notify_handler: Callable[[PGnotify], None] | None
 
+    # Traffic counters, maintained by the generators.
+    _nwaits: int
+    _wait_time: float
+    _nresults: int
+    _nrows: int
+
     @classmethod
     def connect(cls, conninfo: bytes) -> Self: ...
 
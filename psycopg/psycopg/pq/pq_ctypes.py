@@ -82,6 +82,10 @@ class PGconn:
         "notify_handler",
         "_self_ptr",
         "_procpid",
+        "_nwaits",
+        "_wait_time",
+        "_nresults",
+        "_nrows",
         "__weakref__",
     )
 
@@ -96,6 +100,12 @@ class PGconn:
 
         self._procpid = getpid()
 
+        # Traffic counters, maintained by the generators.
+        self._nwaits = 0
+        self._wait_time = 0.0
+        self._nresults = 0
+        self._nrows = 0
+
     def __del__(self, __getpid: Callable[[], int] = getpid) -> None:
         # Close the connection only if it was created in this process,
         # not if this object is being GC'd after fork.
@@ -0,0 +1,110 @@
+"""
+Client-side statistics about the queries executed.
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from ._observe import QueryInfo
+
+
+class QueryStats:
+    """
+    Statistics about the executions of a query.
+    """
+
+    __slots__ = """
+        query calls errors total_time max_time rows bytes_sent
+        """.split()
+
+    def __init__(self, query: bytes):
+        self.query = query
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.bytes_sent = 0
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        return (
+            f"<{cls} {self.query!r} calls={self.calls}"
+            f" total_time={self.total_time:.6f} at 0x{id(self):x}>"
+        )
+
+    @property
+    def mean_time(self) -> float:
+        """The mean execution time of the query, in seconds."""
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def _add(self, info: QueryInfo) -> None:
+        elapsed = info.end - info.start
+        self.calls += 1
+        if info.error:
+            self.errors += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+        self.rows += info.rows
+        self.bytes_sent += info.bytes_sent
+
+
+class StatsCollector:
+    """
+    Aggregate statistics about the queries executed by one or more connections.
+
+    The object is a query observer: register it on the connections to monitor
+    using `~psycopg.Connection.add_query_observer()`.
+
+    :param max_queries: the maximum number of different queries to keep the
+        statistics of. When exceeded, the statistics of the query executed
+        least recently are discarded.
+    """
+
+    def __init__(self, max_queries: int = 1000):
+        if max_queries < 1:
+            raise ValueError(f"max_queries must be >= 1, got {max_queries}")
+        self.max_queries = max_queries
+        self._stats = OrderedDict[bytes, QueryStats]()
+        self._lock = threading.Lock()
+
+    def __call__(self, info: QueryInfo) -> None:
+        with self._lock:
+            if (stats := self._stats.get(info.query)) is not None:
+                self._stats.move_to_end(info.query)
+            else:
+                stats = self._stats[info.query] = QueryStats(info.query)
+                if len(self._stats) > self.max_queries:
+                    self._stats.popitem(last=False)
+            stats._add(info)
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def get_stats(self) -> list[QueryStats]:
+        """Return the statistics of all the queries observed."""
+        with self._lock:
+            return list(self._stats.values())
+
+    def top(self, n: int = 10, key: str = "total_time") -> list[QueryStats]:
+        """
+        Return the statistics of the `!n` queries with the greatest `!key`.
+
+        :param key: the `QueryStats` attribute to sort the queries by, for
+            instance ``calls``, ``mean_time``, ``max_time``.
+        """
+        if not hasattr(QueryStats, key):
+            raise ValueError(f"bad key: {key!r}. It should be a QueryStats attribute")
+        stats = self.get_stats()
+        stats.sort(key=lambda s: getattr(s, key), reverse=True)
+        return stats[:n]
+
+    def reset(self) -> None:
+        """Discard all the statistics collected."""
+        with self._lock:
+            self._stats.clear()
@@ -99,6 +99,7 @@ class BaseTransaction(Generic[ConnectionType]):
     def _enter_gen(self) -> PQGen[None]:
         if self.status != self.Status.NOT_STARTED:
             raise TypeError("transaction blocks can be used only once")
+        yield from self._conn._collect_prefetch_gen()
         self.status = self.Status.ACTIVE
 
         self._push_savepoint()
@@ -112,6 +113,12 @@ class BaseTransaction(Generic[ConnectionType]):
         exc_tb: TracebackType | None,
     ) -> PQGen[bool]:
         if not exc_val and not self.force_rollback:
+            try:
+                # Don't commit if a FETCH sent ahead in the block failed.
+                yield from self._conn._collect_prefetch_gen()
+            except Exception as ex:
+                yield from self._rollback_gen(ex)
+                raise
             yield from self._commit_gen()
             return False
         else:
@@ -153,6 +160,7 @@ class BaseTransaction(Generic[ConnectionType]):
         if ex:
             raise ex
 
+        yield from self._conn._collect_prefetch_gen(check=False)
         for command in self._get_rollback_commands():
             yield from self._conn._exec_command(command)
 
@@ -15,15 +15,25 @@ import sys
 import select
 import logging
 import selectors
+import threading
+from time import monotonic
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
 from asyncio import Event, TimeoutError, get_event_loop, wait_for
 from selectors import DefaultSelector
+from collections import deque
+from collections.abc import Callable, Hashable, Iterator
 
 from . import errors as e
 from .abc import RV, PQGen, PQGenConn, WaitFunc
 from ._enums import Ready as Ready
 from ._enums import Wait as Wait  # re-exported
+from ._compat import Self
 from ._cmodule import _psycopg
 
+if TYPE_CHECKING:
+    from .cursor import Cursor
+
 WAIT_R = Wait.R
 WAIT_W = Wait.W
 WAIT_RW = Wait.RW
@@ -126,6 +136,174 @@ def wait_conn(gen: PQGenConn[RV], interval: float = 0.0) -> RV:
         return rv
 
 
+class Reactor:
+    """
+    Drive several generators concurrently, each one on its own file descriptor.
+
+    Generators are added with `add()` and are consumed by iterating on
+    `run()`, which yields their results as they complete. All the file
+    descriptors are waited on by a single selector, which lives as long as the
+    reactor, so that many connections can be used at the same time from a
+    single thread.
+    """
+
+    def __init__(self) -> None:
+        self._sel = DefaultSelector()
+        # The generators running, with their key and completion callback,
+        # by file descriptor.
+        self._running: dict[
+            int, tuple[PQGen[Any], Hashable, Callable[[], None] | None]
+        ] = {}
+        self._done = deque[tuple[Hashable, Any]]()
+
+    def __len__(self) -> int:
+        """The number of generators added and not returned yet by `run()`."""
+        return len(self._running) + len(self._done)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the selector and drop the generators still running."""
+        for fileno in list(self._running):
+            self._remove(fileno)
+        self._done.clear()
+        self._sel.close()
+
+    def add(
+        self,
+        gen: PQGen[Any],
+        fileno: int,
+        key: Hashable = None,
+        *,
+        on_done: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Schedule `!gen` to run, waiting on `!fileno` when it would block.
+
+        :param key: the value returned by `run()` together with the result of
+            the generator. If not specified, `!fileno` is used.
+        :param on_done: a function to call when the generator terminates,
+            either successfully or not.
+        """
+        if fileno in self._running:
+            raise e.ProgrammingError(
+                f"the file descriptor {fileno} is already waited on by the reactor"
+            )
+        if key is None:
+            key = fileno
+
+        try:
+            s = next(gen)
+        except BaseException as ex:
+            if on_done:
+                on_done()
+            if isinstance(ex, StopIteration):
+                self._done.append((key, ex.value))
+                return
+            raise
+
+        self._running[fileno] = (gen, key, on_done)
+        self._sel.register(fileno, s)
+
+    def execute(
+        self, cursor: Cursor[Any], query: Any, params: Any = None, key: Hashable = None
+    ) -> None:
+        """
+        Schedule the execution of `!query` on `!cursor`.
+
+        :param key: the value returned by `run()` together with the cursor,
+            once the query is complete. If not specified, the cursor is used.
+
+        The cursor connection is locked until the query is complete, so every
+        query added must use a different connection.
+        """
+        conn = cursor.connection
+        if conn._pipeline:
+            raise e.ProgrammingError("the reactor cannot be used in pipeline mode")
+
+        if not conn.lock.acquire(blocking=False):
+            raise e.ProgrammingError(
+                "the connection is already in use: use a different connection"
+                " for every query added to the reactor"
+            )
+
+        def gen() -> PQGen[Cursor[Any]]:
+            yield from cursor._execute_gen(query, params)
+            return cursor
+
+        self.add(
+            gen(),
+            conn.pgconn.socket,
+            cursor if key is None else key,
+            on_done=conn.lock.release,
+        )
+
+    def run(self, interval: float = 0.1) -> Iterator[tuple[Hashable, Any]]:
+        """
+        Wait for the generators added and yield their results as they complete.
+
+        Yield `!(key, result)` pairs. If a generator raises an exception, it is
+        removed from the reactor and the exception is propagated; it is
+        possible to call `!run()` again to wait for the other generators.
+
+        :param interval: interval (in seconds) to check for other interrupt,
+            e.g. to allow Ctrl-C.
+        """
+        while True:
+            while self._done:
+                yield self._done.popleft()
+
+            if not self._running:
+                break
+
+            if not (rlist := self._sel.select(timeout=interval)):
+                # Check if it was a timeout or we were disconnected
+                for fileno in list(self._running):
+                    try:
+                        _check_fd_closed(fileno)
+                    except BaseException:
+                        self._remove(fileno)
+                        raise
+                    self._step(fileno, READY_NONE)
+                continue
+
+            for key, ready in rlist:
+                self._step(key.fd, ready)
+
+    def _step(self, fileno: int, ready: int) -> None:
+        gen, key, on_done = self._running[fileno]
+        try:
+            s = gen.send(ready)
+        except StopIteration as ex:
+            self._remove(fileno)
+            self._done.append((key, ex.value))
+        except BaseException:
+            self._remove(fileno)
+            raise
+        else:
+            if s != self._sel.get_key(fileno).events:
+                self._sel.modify(fileno, s)
+
+    def _remove(self, fileno: int) -> None:
+        gen, _, on_done = self._running.pop(fileno)
+        try:
+            self._sel.unregister(fileno)
+        except (KeyError, ValueError, OSError):
+            pass
+        gen.close()
+        if on_done:
+            on_done()
+
+
 async def wait_async(gen: PQGen[RV], fileno: int, interval: float = 0.0) -> RV:
     """
     Coroutine waiting for a generator to complete.
@@ -348,6 +526,67 @@ def wait_epoll(gen: PQGen[RV], fileno: int, interval: float = 0.0) -> RV:
         return rv
 
 
+# An epoll object for every thread, reused by wait_epoll_persistent()
+_epoll_local = threading.local()
+
+
+def wait_epoll_persistent(gen: PQGen[RV], fileno: int, interval: float = 0.0) -> RV:
+    """
+    Wait for a generator using an epoll object kept across calls.
+
+    Parameters are like for `wait()`. Work like `wait_epoll()`, but the epoll
+    object is created only once per thread, and the file descriptors waited on
+    stay registered with it, saving the syscalls to create the epoll object,
+    to register the file descriptor and to close the object on every call.
+    """
+    if interval is None:
+        raise ValueError("indefinite wait not supported anymore")
+    try:
+        s = next(gen)
+
+        if interval < 0:
+            interval = 0.0
+
+        if not (epoll := getattr(_epoll_local, "epoll", None)):
+            epoll = _epoll_local.epoll = select.epoll()
+
+        # If the file descriptor is not registered (or it was closed since,
+        # which unregisters it) register it now.
+        evmask = _epoll_evmasks[s]
+        try:
+            epoll.modify(fileno, evmask)
+        except FileNotFoundError:
+            epoll.register(fileno, evmask)
+
+        while True:
+            if not (fileevs := epoll.poll(interval)):
+                _check_fd_closed(fileno)
+                gen.send(READY_NONE)
+                continue
+
+            # Drop the events of other file descriptors registered by
+            # previous calls, which might have been left armed.
+            ev = 0
+            for fd, fev in fileevs:
+                if fd == fileno:
+                    ev = fev
+            if not ev:
+                continue
+
+            ready = 0
+            if ev & select.EPOLLIN:
+                ready = READY_R
+            if ev & select.EPOLLOUT:
+                ready |= READY_W
+            s = gen.send(ready)
+            evmask = _epoll_evmasks[s]
+            epoll.modify(fileno, evmask)
+
+    except StopIteration as ex:
+        rv: RV = ex.value
+        return rv
+
+
 if hasattr(selectors, "PollSelector"):
     _poll_evmasks = {
         WAIT_R: select.POLLIN,
@@ -405,6 +644,68 @@ def wait_poll(gen: PQGen[RV], fileno: int, interval: float = 0.0) -> RV:
         return rv
 
 
+# Default time (in seconds) to busy-poll before blocking in wait_spin()
+WAIT_SPIN_TIME = 50e-6
+
+
+def wait_spin(
+    gen: PQGen[RV], fileno: int, interval: float = 0.0, spin: float = WAIT_SPIN_TIME
+) -> RV:
+    """
+    Wait for a generator using poll, busy-polling before blocking.
+
+    Parameters are like for `wait()`. Every time the generator would block,
+    poll the file descriptor without blocking for up to `!spin` seconds, and
+    only block waiting for it if it doesn't become ready. On very fast networks
+    this avoids the latency of putting the thread to sleep and waking it up,
+    at the expense of burning CPU while waiting.
+    """
+    if interval is None:
+        raise ValueError("indefinite wait not supported anymore")
+    try:
+        s = next(gen)
+
+        if interval < 0:
+            interval = 0
+        else:
+            interval = int(interval * 1000.0)
+
+        poll = select.poll()
+        evmask = _poll_evmasks[s]
+        poll.register(fileno, evmask)
+        while True:
+            if not (fileevs := poll.poll(0)):
+                deadline = monotonic() + spin
+                while monotonic() < deadline:
+                    if fileevs := poll.poll(0):
+                        break
+                else:
+                    if not (fileevs := poll.poll(interval)):
+                        gen.send(READY_NONE)
+                        continue
+
+            ev = fileevs[0][1]
+
+            ready = 0
+            if ev & select.POLLIN:
+                ready = READY_R
+            if ev & select.POLLOUT:
+                ready |= READY_W
+
+            if not ready and ev & POLL_BAD:
+                _check_fd_closed(fileno)
+                # Unlikely: the exception should have been raised above
+                raise e.OperationalError("connection socket closed")
+
+            s = gen.send(ready)
+            evmask = _poll_evmasks[s]
+            poll.modify(fileno, evmask)
+
+    except StopIteration as ex:
+        rv: RV = ex.value
+        return rv
+
+
 def _is_select_patched() -> bool:
     """
     Detect if some greenlet library has patched the select library.
@@ -427,6 +728,7 @@ def _is_select_patched() -> bool:
 
 if _psycopg:
     wait_c = _psycopg.wait_c
+    wait_spin_c = _psycopg.wait_spin_c
 
 
 # Choose the best wait strategy for the platform.
@@ -47,6 +47,8 @@ class Transformer(abc.AdaptContext):
     def get_dumper(self, obj: Any, format: PyFormat) -> abc.Dumper: ...
     def load_rows(self, row0: int, row1: int, make_row: RowMaker[Row]) -> list[Row]: ...
     def load_row(self, row: int, make_row: RowMaker[Row]) -> Row: ...
+    def load_columns(self, row0: int, row1: int) -> list[list[Any]]: ...
+    def load_numpy(self, row0: int, row1: int) -> list[Any]: ...
     def load_sequence(self, record: Sequence[abc.Buffer | None]) -> tuple[Any, ...]: ...
     def get_loader(self, oid: int, format: pq.Format) -> abc.Loader: ...
 
@@ -65,6 +67,12 @@ def pipeline_communicate(
 def wait_c(
     gen: abc.PQGen[abc.RV], fileno: int, interval: float | None = None
 ) -> abc.RV: ...
+def wait_spin_c(
+    gen: abc.PQGen[abc.RV],
+    fileno: int,
+    interval: float | None = None,
+    spin: float = 50e-6,
+) -> abc.RV: ...
 
 # Copy support
 def format_row_text(
@@ -73,6 +81,9 @@ def format_row_text(
 def format_row_binary(
     row: Sequence[Any], tx: abc.Transformer, out: bytearray
 ) -> None: ...
+def format_columns_binary(
+    arrays: Sequence[Any], masks: Sequence[Any], out: bytearray
+) -> None: ...
 def parse_row_text(data: abc.Buffer, tx: abc.Transformer) -> tuple[Any, ...]: ...
 def parse_row_binary(data: abc.Buffer, tx: abc.Transformer) -> tuple[Any, ...]: ...
 
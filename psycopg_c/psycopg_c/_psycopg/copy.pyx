@@ -5,8 +5,10 @@ C optimised functions for the copy system.
 
 # Copyright (C) 2020 The Psycopg Team
 
-from libc.stdint cimport int32_t, uint16_t, uint32_t
-from libc.string cimport memcpy
+from libc.stdint cimport int32_t, uint16_t, uint32_t, uint64_t
+from libc.string cimport memcpy, memset
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+from cpython.buffer cimport PyBUF_ND, PyBuffer_Release, PyObject_GetBuffer
 from cpython.sequence cimport PySequence_Fast, PySequence_Fast_GET_ITEM
 from cpython.sequence cimport PySequence_Fast_GET_SIZE
 from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_FromStringAndSize
@@ -104,6 +106,116 @@ def format_row_binary(row: Sequence[Any], tx: Transformer, out: bytearray) -> No
         raise e
 
 
+def format_columns_binary(
+    arrays: Sequence[Any], masks: Sequence[Any], out: bytearray
+) -> None:
+    cdef Py_ssize_t size = PyByteArray_GET_SIZE(out)
+
+    try:
+        _format_columns_binary(arrays, masks, out)
+    except Exception as e:
+        # Restore the input bytearray to the size it was before entering here
+        # to avoid potentially passing junk to copy.
+        PyByteArray_Resize(out, size)
+        raise e
+
+
+cdef object _format_columns_binary(object arrays, object masks, bytearray out):
+    """Convert columns of fixed-size values to the data to send for binary copy"""
+    cdef Py_ssize_t ncols = len(arrays)
+    if len(masks) != ncols:
+        raise e.ProgrammingError(f"got {ncols} columns but {len(masks)} masks")
+    if not ncols:
+        return
+
+    # One buffer per column for the values, one for the nulls
+    cdef Py_buffer *bufs = <Py_buffer *>PyMem_Malloc(2 * ncols * sizeof(Py_buffer))
+    if bufs == NULL:
+        raise MemoryError()
+    cdef Py_buffer *nullbufs = bufs + ncols
+    cdef Py_ssize_t nbufs = 0, nnullbufs = 0
+
+    cdef Py_ssize_t nrows = -1
+    cdef Py_ssize_t rowsize = 2
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t pos = PyByteArray_GET_SIZE(out)
+    cdef char *target
+    cdef uint16_t bencols = endian.htobe16(<int16_t>ncols)
+    cdef uint32_t besize
+    cdef uint16_t val2
+    cdef uint32_t val4
+    cdef uint64_t val8
+    cdef Py_ssize_t itemsize
+    cdef char *ptr
+
+    try:
+        for i in range(ncols):
+            PyObject_GetBuffer(arrays[i], &bufs[i], PyBUF_ND)
+            nbufs += 1
+            if bufs[i].ndim != 1 or bufs[i].itemsize not in (1, 2, 4, 8):
+                raise e.DataError("columns must be arrays of fixed-size values")
+            if nrows < 0:
+                nrows = bufs[i].shape[0]
+            elif nrows != bufs[i].shape[0]:
+                raise e.ProgrammingError("all the columns must have the same length")
+            rowsize += 4 + bufs[i].itemsize
+
+            if masks[i] is not None:
+                PyObject_GetBuffer(masks[i], &nullbufs[i], PyBUF_ND)
+                nnullbufs += 1
+                if nullbufs[i].shape[0] != nrows or nullbufs[i].itemsize != 1:
+                    raise e.DataError("invalid null mask")
+            else:
+                memset(&nullbufs[i], 0, sizeof(Py_buffer))
+                nnullbufs += 1
+
+        # Allocate the space for the worst case, with no null value
+        target = CDumper.ensure_size(out, pos, nrows * rowsize)
+
+        for j in range(nrows):
+            memcpy(target, <void *>&bencols, sizeof(bencols))
+            target += sizeof(bencols)
+
+            for i in range(ncols):
+                if nullbufs[i].buf != NULL and (<char *>nullbufs[i].buf)[j]:
+                    memcpy(target, <void *>&_binary_null, sizeof(_binary_null))
+                    target += sizeof(_binary_null)
+                    continue
+
+                itemsize = bufs[i].itemsize
+                besize = endian.htobe32(<int32_t>itemsize)
+                memcpy(target, <void *>&besize, sizeof(besize))
+                target += sizeof(besize)
+
+                ptr = <char *>bufs[i].buf + j * itemsize
+                if itemsize == 1:
+                    target[0] = ptr[0]
+                elif itemsize == 2:
+                    memcpy(&val2, ptr, 2)
+                    val2 = endian.htobe16(val2)
+                    memcpy(target, &val2, 2)
+                elif itemsize == 4:
+                    memcpy(&val4, ptr, 4)
+                    val4 = endian.htobe32(val4)
+                    memcpy(target, &val4, 4)
+                else:
+                    memcpy(&val8, ptr, 8)
+                    val8 = endian.htobe64(val8)
+                    memcpy(target, &val8, 8)
+                target += itemsize
+
+        # Resize to the final size
+        PyByteArray_Resize(out, target - PyByteArray_AS_STRING(out))
+
+    finally:
+        for i in range(nbufs):
+            PyBuffer_Release(&bufs[i])
+        for i in range(nnullbufs):
+            if masks[i] is not None:
+                PyBuffer_Release(&nullbufs[i])
+        PyMem_Free(bufs)
+
+
 cdef int _append_binary_none(bytearray out, Py_ssize_t *pos) except -1:
     cdef char *target
     target = CDumper.ensure_size(out, pos[0], sizeof(_binary_null))
@@ -142,15 +142,18 @@ def send(pq.PGconn pgconn) -> PQGen[None]:
     cdef libpq.PGconn *pgconn_ptr = pgconn._pgconn_ptr
     cdef int ready
     cdef int cires
+    cdef double t0
 
     while True:
         if pgconn.flush() == 0:
             break
 
+        t0 = monotonic()
         while True:
             ready = yield WAIT_RW
             if ready:
                 break
+        _waited(pgconn, t0)
 
         if ready & READY_R:
             with nogil:
@@ -227,10 +230,12 @@ def fetch(pq.PGconn pgconn) -> PQGen[PGresult | None]:
     cdef int cires, ibres
     cdef libpq.PGresult *pgres
     cdef object ready
+    cdef double t0
 
     with nogil:
         ibres = libpq.PQisBusy(pgconn_ptr)
     if ibres:
+        t0 = monotonic()
         while True:
             ready = yield WAIT_R
             if ready:
@@ -251,6 +256,7 @@ def fetch(pq.PGconn pgconn) -> PQGen[PGresult | None]:
                 ready = yield WAIT_R
                 if ready:
                     break
+        _waited(pgconn, t0)
 
     _consume_notifies(pgconn)
 
@@ -258,6 +264,7 @@ def fetch(pq.PGconn pgconn) -> PQGen[PGresult | None]:
         pgres = libpq.PQgetResult(pgconn_ptr)
     if pgres is NULL:
         return None
+    _received(pgconn, pgres)
     return pq.PGresult._from_ptr(pgres)
 
 
@@ -277,8 +284,10 @@ def pipeline_communicate(
     cdef list res = []
     cdef list results = []
     cdef pq.PGresult r
+    cdef double t0
 
     while True:
+        t0 = monotonic()
         while True:
             # I don't quite get why, but we can receive a None upon async
             # task cancellation. See #1005.
@@ -289,6 +298,7 @@ def pipeline_communicate(
             cready = ready
             if cready:
                 break
+        _waited(pgconn, t0)
 
         if cready & READY_R:
             with nogil:
@@ -313,6 +323,7 @@ def pipeline_communicate(
                     results.append(res)
                     res = []
                 else:
+                    _received(pgconn, pgres)
                     status = libpq.PQresultStatus(pgres)
                     r = pq.PGresult._from_ptr(pgres)
                     if status == libpq.PGRES_PIPELINE_SYNC:
@@ -342,6 +353,19 @@ def pipeline_communicate(
     return results
 
 
+cdef inline int _waited(pq.PGconn pgconn, double start) except -1:
+    # Account for a wait for the socket to be ready, started at 'start'.
+    pgconn._nwaits += 1
+    pgconn._wait_time += monotonic() - start
+    return 0
+
+
+cdef inline void _received(pq.PGconn pgconn, libpq.PGresult *pgres) noexcept:
+    # Account for a result received from the server.
+    pgconn._nresults += 1
+    pgconn._nrows += libpq.PQntuples(pgres)
+
+
 cdef int _consume_notifies(pq.PGconn pgconn) except -1:
     cdef object notify_handler = pgconn.notify_handler
     cdef libpq.PGconn *pgconn_ptr
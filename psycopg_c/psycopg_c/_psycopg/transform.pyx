@@ -9,7 +9,11 @@ too many temporary Python objects and performing less memory copying.
 # Copyright (C) 2020 The Psycopg Team
 
 cimport cython
+from libc.stdint cimport INT32_MAX, INT32_MIN, INT64_MAX, INT64_MIN
+from libc.stdint cimport int16_t, int32_t, int64_t, uint16_t, uint32_t, uint64_t
+from libc.string cimport memcpy
 from cpython.ref cimport Py_INCREF
+from cpython.buffer cimport PyBUF_WRITABLE, PyBuffer_Release, PyObject_GetBuffer
 from cpython.dict cimport PyDict_GetItem, PyDict_SetItem
 from cpython.list cimport PyList_GET_ITEM, PyList_GET_SIZE, PyList_New, PyList_SET_ITEM
 from cpython.bytes cimport PyBytes_AS_STRING
@@ -20,13 +24,20 @@ from cpython.sequence cimport PySequence_Fast_GET_SIZE
 
 from typing import Sequence
 
+from psycopg_c._psycopg cimport endian
+
 from psycopg import errors as e
 from psycopg.pq import Format as PqFormat
 from psycopg.rows import Row
+from psycopg._columns import NUMPY_DTYPES, masked_array, values_to_array
 from psycopg._encodings import conn_encoding
 
 NoneType = type(None)
 
+# Distance between the PostgreSQL epoch (2000-01-01) and the Unix epoch
+cdef int64_t PG_EPOCH_DAYS = 10957
+cdef int64_t PG_EPOCH_USECS = PG_EPOCH_DAYS * 86400 * 1000000
+
 # internal structure: you are not supposed to know this. But it's worth some
 # 10% of the innermost loop, so I'm willing to ask for forgiveness later...
 
@@ -530,6 +541,184 @@ cdef class Transformer:
                 make_row, <PyObject *>record, NULL)
         return record
 
+    def load_columns(self, int row0, int row1) -> list[list[Any]]:
+        if self._pgresult is None:
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        cdef int col
+        cdef list columns = PyList_New(self._nfields)
+        for col in range(self._nfields):
+            column = self._load_column(col, row0, row1)
+            Py_INCREF(column)
+            PyList_SET_ITEM(columns, col, column)
+
+        return columns
+
+    def load_numpy(self, int row0, int row1) -> list[Any]:
+        import numpy as np
+
+        if self._pgresult is None:
+            raise e.InterfaceError("result not set")
+
+        if not (0 <= row0 <= self._ntuples and 0 <= row1 <= self._ntuples):
+            raise e.InterfaceError(
+                f"rows must be included between 0 and {self._ntuples}"
+            )
+
+        cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
+        cdef int nrows = max(row1 - row0, 0)
+        cdef int col
+        cdef libpq.Oid oid
+        cdef list arrays = []
+
+        for col in range(self._nfields):
+            oid = libpq.PQftype(res, col)
+            nulls = np.zeros(nrows, dtype=bool)
+            if libpq.PQfformat(res, col) == 1 and oid in NUMPY_DTYPES:
+                dtype = NUMPY_DTYPES[oid][0]
+                # numpy doesn't export datetime64 buffers: fill an int64 array.
+                if dtype[0] == "M":
+                    arr = np.empty(nrows, dtype="i8")
+                    self._fill_numpy_binary(col, row0, row1, oid, arr, nulls)
+                    arr = arr.view(dtype)
+                else:
+                    arr = np.empty(nrows, dtype=dtype)
+                    self._fill_numpy_binary(col, row0, row1, oid, arr, nulls)
+            else:
+                arr = values_to_array(self._load_column(col, row0, row1), oid)
+                self._fill_numpy_nulls(col, row0, row1, nulls)
+
+            arrays.append(masked_array(arr, nulls))
+
+        return arrays
+
+    cdef list _load_column(self, int col, int row0, int row1):
+        cdef libpq.PGresult *res = self._pgresult._pgresult_ptr
+        # cheeky access to the internal PGresult structure
+        cdef pg_result_int *ires = <pg_result_int*>res
+
+        cdef int row
+        cdef PGresAttValue *attval
+        cdef list column = PyList_New(max(row1 - row0, 0))
+        cdef PyObject *loader = PyList_GET_ITEM(self._row_loaders, col)
+
+        for row in range(row0, row1):
+            attval = &(ires.tuples[row][col])
+            if attval.len == -1:  # NULL_LEN
+                pyval = None
+            elif (<RowLoader>loader).cloader is not None:
+                pyval = (<RowLoader>loader).cloader.cload(attval.value, attval.len)
+            else:
+                b = PyMemoryView_FromObject(
+                    ViewBuffer._from_buffer(
+                        self._pgresult,
+                        <unsigned char *>attval.value, attval.len))
+                pyval = PyObject_CallFunctionObjArgs(
+                    (<RowLoader>loader).loadfunc, <PyObject *>b, NULL)
+
+            Py_INCREF(pyval)
+            PyList_SET_ITEM(column, row - row0, pyval)
+
+        return column
+
+    cdef int _fill_numpy_nulls(
+        self, int col, int row0, int row1, object nulls
+    ) except -1:
+        cdef pg_result_int *ires = <pg_result_int*>self._pgresult._pgresult_ptr
+        cdef Py_buffer nbuf
+        cdef int row
+
+        PyObject_GetBuffer(nulls, &nbuf, PyBUF_WRITABLE)
+        try:
+            for row in range(row0, row1):
+                (<char *>nbuf.buf)[row - row0] = ires.tuples[row][col].len == -1
+        finally:
+            PyBuffer_Release(&nbuf)
+
+        return 0
+
+    cdef int _fill_numpy_binary(
+        self, int col, int row0, int row1, libpq.Oid oid, object arr, object nulls
+    ) except -1:
+        cdef pg_result_int *ires = <pg_result_int*>self._pgresult._pgresult_ptr
+        cdef Py_buffer abuf, nbuf
+        cdef PGresAttValue *attval
+        cdef int row, i
+        cdef Py_ssize_t size
+        cdef uint32_t bits4
+        cdef uint64_t bits8
+        cdef int32_t days
+        cdef int64_t usecs
+
+        if oid == oids.BOOL_OID:
+            size = 1
+        elif oid == oids.INT2_OID:
+            size = 2
+        elif oid in (oids.INT4_OID, oids.FLOAT4_OID, oids.DATE_OID):
+            size = 4
+        else:
+            size = 8
+
+        PyObject_GetBuffer(arr, &abuf, PyBUF_WRITABLE)
+        try:
+            PyObject_GetBuffer(nulls, &nbuf, PyBUF_WRITABLE)
+            try:
+                for row in range(row0, row1):
+                    i = row - row0
+                    attval = &(ires.tuples[row][col])
+                    if attval.len == -1:  # NULL_LEN
+                        (<char *>nbuf.buf)[i] = 1
+                        bits8 = 0
+                    elif attval.len != size:
+                        raise e.DataError(
+                            f"unexpected data size for oid {oid}: {attval.len}")
+                    elif size == 1:
+                        bits8 = attval.value[0] != 0
+                    elif size == 2:
+                        bits8 = endian.be16toh((<uint16_t *>attval.value)[0])
+                    elif size == 4:
+                        memcpy(&bits4, attval.value, 4)
+                        bits8 = endian.be32toh(bits4)
+                    else:
+                        memcpy(&bits8, attval.value, 8)
+                        bits8 = endian.be64toh(bits8)
+
+                    if oid == oids.BOOL_OID:
+                        (<char *>abuf.buf)[i] = <char>bits8
+                    elif oid == oids.INT2_OID:
+                        (<int16_t *>abuf.buf)[i] = <int16_t>bits8
+                    elif oid == oids.INT4_OID:
+                        (<int32_t *>abuf.buf)[i] = <int32_t>bits8
+                    elif oid == oids.FLOAT4_OID:
+                        bits4 = <uint32_t>bits8
+                        memcpy(&(<float *>abuf.buf)[i], &bits4, 4)
+                    elif oid == oids.DATE_OID:
+                        days = <int32_t>bits8
+                        if days == INT32_MAX or days == INT32_MIN:
+                            raise e.DataError(
+                                "infinity dates can't be loaded into numpy arrays")
+                        (<int64_t *>abuf.buf)[i] = days + PG_EPOCH_DAYS
+                    elif oid == oids.TIMESTAMP_OID or oid == oids.TIMESTAMPTZ_OID:
+                        usecs = <int64_t>bits8
+                        if usecs == INT64_MAX or usecs == INT64_MIN:
+                            raise e.DataError(
+                                "infinity timestamps can't be loaded into numpy arrays")
+                        (<int64_t *>abuf.buf)[i] = usecs + PG_EPOCH_USECS
+                    else:
+                        # int8, float8
+                        memcpy(&(<int64_t *>abuf.buf)[i], &bits8, 8)
+            finally:
+                PyBuffer_Release(&nbuf)
+        finally:
+            PyBuffer_Release(&abuf)
+
+        return 0
+
     cpdef object load_sequence(self, record: Sequence[Buffer | None]):
         cdef record_fast = PySequence_Fast(record, "'record' is not a valid sequence")
         cdef Py_ssize_t nfields = PySequence_Fast_GET_SIZE(record_fast)
@@ -7,6 +7,7 @@ C implementation of waiting functions
 from cpython.object cimport PyObject_CallFunctionObjArgs
 
 from os import fstat
+from time import monotonic
 from typing import TypeVar
 
 from psycopg import errors as e
@@ -204,7 +205,6 @@ def wait_c(gen: PQGen[RV], int fileno, interval = 0.0) -> RV:
     """
     cdef float cinterval
     cdef int wait, ready
-    cdef PyObject *pyready
 
     if interval is None:
         raise ValueError("indefinite wait not supported anymore")
@@ -220,26 +220,69 @@ def wait_c(gen: PQGen[RV], int fileno, interval = 0.0) -> RV:
 
         while True:
             ready = wait_c_impl(fileno, wait, cinterval)
+            wait = PyObject_CallFunctionObjArgs(send, _py_ready(ready, fileno), NULL)
+
+    except StopIteration as ex:
+        rv: RV = ex.value
+        return rv
+
+
+def wait_spin_c(
+    gen: PQGen[RV], int fileno, interval = 0.0, spin = 50e-6
+) -> RV:
+    """
+    Wait for a generator using poll or select, busy-polling before blocking.
+    """
+    cdef float cinterval
+    cdef double cspin, deadline
+    cdef int wait, ready
+
+    if interval is None:
+        raise ValueError("indefinite wait not supported anymore")
+
+    cinterval = <float>float(interval)
+    if cinterval < 0.0:
+        cinterval = 0.0
+    cspin = float(spin)
+
+    send = gen.send
+
+    try:
+        wait = next(gen)
+
+        while True:
+            ready = wait_c_impl(fileno, wait, 0.0)
+            if ready == READY_NONE and cspin > 0.0:
+                deadline = monotonic() + cspin
+                while ready == READY_NONE and monotonic() < deadline:
+                    ready = wait_c_impl(fileno, wait, 0.0)
             if ready == READY_NONE:
-                pyready = <PyObject *>PY_READY_NONE
-            elif ready == READY_R:
-                pyready = <PyObject *>PY_READY_R
-            elif ready == READY_RW:
-                pyready = <PyObject *>PY_READY_RW
-            elif ready == READY_W:
-                pyready = <PyObject *>PY_READY_W
-            elif ready == CWAIT_SOCKET_ERROR:  # FD closed?
-                try:
-                    fstat(fileno)
-                except Exception as ex:
-                    raise e.OperationalError("connection socket closed") from ex
-                else:
-                    raise e.OperationalError("connection socket closed")
-            else:
-                raise AssertionError(f"unexpected ready value: {ready}")
-
-            wait = PyObject_CallFunctionObjArgs(send, pyready, NULL)
+                ready = wait_c_impl(fileno, wait, cinterval)
+            wait = PyObject_CallFunctionObjArgs(send, _py_ready(ready, fileno), NULL)
 
     except StopIteration as ex:
         rv: RV = ex.value
         return rv
+
+
+cdef PyObject *_py_ready(int ready, int fileno) except NULL:
+    """
+    Return the Ready value to send to a generator, or raise an error.
+    """
+    if ready == READY_NONE:
+        return <PyObject *>PY_READY_NONE
+    elif ready == READY_R:
+        return <PyObject *>PY_READY_R
+    elif ready == READY_RW:
+        return <PyObject *>PY_READY_RW
+    elif ready == READY_W:
+        return <PyObject *>PY_READY_W
+    elif ready == CWAIT_SOCKET_ERROR:  # FD closed?
+        try:
+            fstat(fileno)
+        except Exception as ex:
+            raise e.OperationalError("connection socket closed") from ex
+        else:
+            raise e.OperationalError("connection socket closed")
+    else:
+        raise AssertionError(f"unexpected ready value: {ready}")
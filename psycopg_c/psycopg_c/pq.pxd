@@ -27,6 +27,10 @@ cdef class PGconn:
     cdef public object notice_handler
     cdef public object notify_handler
     cdef pid_t _procpid
+    cdef public long long _nwaits
+    cdef public double _wait_time
+    cdef public long long _nresults
+    cdef public long long _nrows
 
     @staticmethod
     cdef PGconn _from_ptr(libpq.PGconn *ptr)
@@ -4,19 +4,29 @@ psycopg connection pool package
 
 # Copyright (C) 2021 The Psycopg Team
 
+from .base import Histogram
 from .pool import ConnectionPool
 from .errors import PoolClosed, PoolTimeout, TooManyRequests
 from .version import __version__ as __version__  # noqa: F401
+from .keyed_pool import KeyedConnectionPool
 from .null_pool import NullConnectionPool
 from .pool_async import AsyncConnectionPool
+from .routing_pool import RoutingConnectionPool
 from .null_pool_async import AsyncNullConnectionPool
+from .keyed_pool_async import AsyncKeyedConnectionPool
+from .routing_pool_async import AsyncRoutingConnectionPool
 
 __all__ = [
     "AsyncConnectionPool",
+    "AsyncKeyedConnectionPool",
     "AsyncNullConnectionPool",
+    "AsyncRoutingConnectionPool",
     "ConnectionPool",
+    "Histogram",
+    "KeyedConnectionPool",
     "NullConnectionPool",
     "PoolClosed",
     "PoolTimeout",
+    "RoutingConnectionPool",
     "TooManyRequests",
 ]
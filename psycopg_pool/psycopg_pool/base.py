@@ -6,14 +6,19 @@ psycopg connection pool base class and functionalities.
 
 from __future__ import annotations
 
+import threading
 from time import monotonic
+from bisect import bisect_left
 from random import random
 from typing import TYPE_CHECKING, Any
-from collections import Counter, deque
+from collections import Counter, OrderedDict, deque
+from collections.abc import Sequence
 
 from .errors import PoolClosed
+from ._compat import PSYCOPG_VERSION
 
 if TYPE_CHECKING:
+    from psycopg._preparing import Key
     from psycopg._connection_base import BaseConnection
 
 
@@ -37,6 +42,29 @@ class BasePool:
     _CONNECTIONS_MS = "connections_ms"
     _CONNECTIONS_ERRORS = "connections_errors"
     _CONNECTIONS_LOST = "connections_lost"
+    _PREPARED_HITS = "prepared_hits"
+    _PREPARED_MISSES = "prepared_misses"
+    _PREPARED_NUM = "prepared_num"
+
+    # Histograms keys
+    _REQUESTS_WAIT = "requests_wait"
+    _USAGE = "usage"
+    _CONNECTIONS = "connections"
+    _RESETS = "resets"
+
+    _HISTOGRAMS_HELP = {
+        _REQUESTS_WAIT: "Time to obtain a connection from the pool.",
+        _USAGE: "Time the connections are used outside the pool.",
+        _CONNECTIONS: "Time to establish a connection with the server.",
+        _RESETS: "Time to reset a connection returned to the pool.",
+    }
+
+    # Adaptive sizing: check for unused connections this many times in
+    # max_idle, close this fraction of them, unless this quantile of the wait
+    # time is greater than the connection time.
+    _ADAPTIVE_SHRINK_STEPS = 10
+    _ADAPTIVE_DECAY = 0.5
+    _ADAPTIVE_WAIT_QUANTILE = 0.9
 
     _pool: deque[Any]
 
@@ -53,6 +81,9 @@ class BasePool:
         max_idle: float,
         reconnect_timeout: float,
         num_workers: int,
+        share_prepared: bool = False,
+        checkout: str = "fifo",
+        adaptive: bool = False,
     ):
         min_size, max_size = self._check_size(min_size, max_size)
 
@@ -63,6 +94,15 @@ class BasePool:
         if num_workers < 1:
             raise ValueError("num_workers must be at least 1")
 
+        if checkout not in ("fifo", "lifo", "prepared"):
+            raise ValueError(
+                f"bad checkout: {checkout!r}. It should be 'fifo', 'lifo', or"
+                " 'prepared'"
+            )
+
+        if share_prepared and PSYCOPG_VERSION < (3, 4):
+            raise TypeError("share_prepared requires psycopg 3.4 or greater")
+
         self.name = name
         self.close_returns = close_returns
         self._min_size = min_size
@@ -73,10 +113,14 @@ class BasePool:
         self.max_lifetime = max_lifetime
         self.max_idle = max_idle
         self.num_workers = num_workers
+        self.checkout = checkout
+        self.adaptive = adaptive
+        self._prepared = PreparedRegistry() if share_prepared else None
 
         self._nconns = min_size  # currently in the pool, out, being prepared
         self._pool = deque()
         self._stats = Counter[str]()
+        self._histograms = {key: Histogram() for key in self._HISTOGRAMS_HELP}
         self._drained_at = 0.0
 
         # Min number of connections in the pool in a max_idle unit of time.
@@ -86,11 +130,15 @@ class BasePool:
         # max_idle interval they weren't all used.
         self._nconns_min = min_size
 
-        # Flag to allow the pool to grow only one connection at time. In case
-        # of spike, if threads are allowed to grow in parallel and connection
-        # time is slow, there won't be any thread available to return the
-        # connections to the pool.
-        self._growing = False
+        # Number of connections being created to grow the pool. Unless the
+        # pool is adaptive, allow the pool to grow only one connection at time.
+        # In case of spike, if threads are allowed to grow in parallel and
+        # connection time is slow, there won't be any thread available to
+        # return the connections to the pool.
+        self._growing = 0
+
+        # The wait times observed at the last ShrinkPool run.
+        self._shrink_waits = Histogram()
 
         self._opened = False
         self._closed = True
@@ -181,6 +229,71 @@ class BasePool:
             self._POOL_AVAILABLE: len(self._pool),
         }
 
+    def get_histograms(self) -> dict[str, Histogram]:
+        """
+        Return the distribution of the times measured by the pool.
+
+        The histograms are not reset by `pop_stats()`.
+        """
+        return {key: h.copy() for key, h in self._histograms.items()}
+
+    def get_metrics(self) -> str:
+        """
+        Return the pool stats and histograms in OpenMetrics text format.
+        """
+        labels = f'pool="{_escape_label(self.name)}"'
+        lines = []
+        for key, value in self._get_measures().items():
+            name = (
+                f"psycopg_{key}" if key.startswith("pool_") else f"psycopg_pool_{key}"
+            )
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"{name}{{{labels}}} {value}")
+
+        for key, value in self._stats.items():
+            if key.endswith("_ms"):
+                # Exposed by the histograms instead, in seconds.
+                continue
+            name = f"psycopg_pool_{key}"
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"{name}_total{{{labels}}} {value}")
+
+        for key, h in self._histograms.items():
+            name = f"psycopg_pool_{key}_seconds"
+            lines.append(f"# TYPE {name} histogram")
+            lines.append(f"# UNIT {name} seconds")
+            lines.append(f"# HELP {name} {self._HISTOGRAMS_HELP[key]}")
+            for bound, count in h.buckets():
+                le = bound if bound != float("inf") else "+Inf"
+                lines.append(f'{name}_bucket{{{labels},le="{le}"}} {count}')
+            lines.append(f"{name}_count{{{labels}}} {h.count}")
+            lines.append(f"{name}_sum{{{labels}}} {h.sum}")
+
+        lines.append("# EOF\n")
+        return "\n".join(lines)
+
+    def _pop_connection(self) -> Any:
+        """
+        Take a connection out of the pool, according to the checkout policy.
+
+        The connections are added to the right of the pool as they are
+        returned, so the connection on the left is the one idle for longer.
+        """
+        if self.checkout == "fifo":
+            return self._pool.popleft()
+        elif self.checkout == "lifo":
+            return self._pool.pop()
+
+        # Choose the connection with more statements prepared; on equal
+        # number, the one returned most recently.
+        i = max(
+            range(len(self._pool) - 1, -1, -1),
+            key=lambda j: len(self._pool[j]._prepared._names),
+        )
+        conn = self._pool[i]
+        del self._pool[i]
+        return conn
+
     @classmethod
     def _jitter(cls, value: float, min_pc: float, max_pc: float) -> float:
         """
@@ -188,6 +301,59 @@ class BasePool:
         """
         return value * (1.0 + ((max_pc - min_pc) * random()) + min_pc)
 
+    def _growth_wanted(self, nwaiting: int) -> int:
+        """Return the number of connections to create to serve the clients.
+
+        Unless the pool is adaptive, only create one connection at time.
+        Otherwise create enough connections for the clients *nwaiting*, minus
+        the connections expected to be returned while new ones are created.
+        """
+        nwanted = 0 if self._growing else 1
+        if not self.adaptive or not nwaiting:
+            return nwanted
+
+        # Fraction of the connections in use returning before a new one is
+        # ready, estimated from the mean usage and connection time.
+        nused = self._nconns - len(self._pool) - self._growing
+        connect = self._histograms[self._CONNECTIONS]
+        usage = self._histograms[self._USAGE]
+        if connect.count and usage.count and usage.sum:
+            ratio = (connect.sum / connect.count) / (usage.sum / usage.count)
+            nwaiting -= int(nused * min(ratio, 1.0))
+
+        return max(nwanted, nwaiting - self._growing)
+
+    def _shrink_wanted(self, nunused: int) -> int:
+        """Return the number of connections to close.
+
+        *nunused* is the number of connections not used since the last time
+        the pool was checked. Unless the pool is adaptive, only close one
+        connection. Otherwise close a fraction of the unused connections, but
+        only if the clients haven't had to wait long for a connection.
+        """
+        waits = self._histograms[self._REQUESTS_WAIT]
+        last_waits, self._shrink_waits = self._shrink_waits, waits.copy()
+        if not nunused:
+            return 0
+        if not self.adaptive:
+            return 1
+
+        # If the clients had to wait longer than a connection takes to be
+        # created, the connections will be needed again soon.
+        connect = self._histograms[self._CONNECTIONS]
+        if connect.count:
+            wait = waits.diff(last_waits).quantile(self._ADAPTIVE_WAIT_QUANTILE)
+            if wait > connect.sum / connect.count:
+                return 0
+
+        return max(1, round(nunused * self._ADAPTIVE_DECAY))
+
+    def _shrink_interval(self) -> float:
+        """Return the time between checks for unused connections."""
+        if self.adaptive:
+            return self.max_idle / self._ADAPTIVE_SHRINK_STEPS
+        return self.max_idle
+
     def _set_connection_expiry_date(self, conn: BaseConnection[Any]) -> None:
         """Set an expiry date on a connection.
 
@@ -197,6 +363,158 @@ class BasePool:
         conn._expire_at = t + self._jitter(self.max_lifetime, -0.05, 0.0)
 
 
+class Histogram:
+    """
+    The distribution of a measure, counted in buckets of fixed bounds.
+
+    :param bounds: the upper bounds of the buckets, in increasing order. A
+        last bucket with no upper bound is added.
+    """
+
+    # fmt: off
+    DEFAULT_BOUNDS = (
+        0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+        0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+    )
+    # fmt: on
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_BOUNDS):
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError("the histogram bounds must be increasing")
+        self.bounds = tuple(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def __repr__(self) -> str:
+        cls = f"{self.__class__.__module__}.{self.__class__.__qualname__}"
+        return f"<{cls} count={self.count} sum={self.sum:.6f} at 0x{id(self):x}>"
+
+    def observe(self, value: float) -> None:
+        """Add a value to the distribution."""
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """
+        Return the cumulative count of the values less than or equal to every
+        bound, the last bound being infinity.
+        """
+        rv = []
+        count = 0
+        for bound, n in zip((*self.bounds, float("inf")), self.counts):
+            count += n
+            rv.append((bound, count))
+        return rv
+
+    def quantile(self, q: float) -> float:
+        """
+        Return an estimate of the `!q` quantile (between 0 and 1) of the values.
+
+        The estimate is interpolated linearly inside the bucket the quantile
+        falls in. If it falls in the last bucket, return its lower bound.
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"the quantile must be between 0 and 1, got {q}")
+        if not self.count:
+            return 0.0
+
+        rank = q * self.count
+        count = 0
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            if n and count + n >= rank:
+                if i == len(self.bounds):
+                    return lower
+                upper = self.bounds[i]
+                return lower + (upper - lower) * (rank - count) / n
+            count += n
+            if i < len(self.bounds):
+                lower = self.bounds[i]
+        return lower
+
+    def diff(self, other: Histogram) -> Histogram:
+        """
+        Return the distribution of the values observed since `!other` was a
+        copy of the histogram.
+        """
+        if other.bounds != self.bounds:
+            raise ValueError("the histograms have different bounds")
+        rv = Histogram(self.bounds)
+        rv.counts[:] = [a - b for a, b in zip(self.counts, other.counts)]
+        rv.count = self.count - other.count
+        rv.sum = self.sum - other.sum
+        return rv
+
+    def copy(self) -> Histogram:
+        """Return a copy of the histogram."""
+        rv = Histogram(self.bounds)
+        rv.counts[:] = self.counts
+        rv.count = self.count
+        rv.sum = self.sum
+        return rv
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PreparedRegistry:
+    """
+    Keep track of the statements prepared by the connections of a pool.
+
+    The statements are kept in order of use, the most recent last, so that the
+    statements no more used are eventually dropped.
+    """
+
+    def __init__(self, maxsize: int = 100):
+        self.maxsize = maxsize
+        self._keys: OrderedDict[Key, None] = OrderedDict()
+        # Connections are returned and prepared concurrently by the clients
+        # and the workers threads. Never held while waiting.
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(self, conn: BaseConnection[Any]) -> None:
+        """Add to the registry the statements prepared by a connection."""
+        names = list(conn._prepared._names)
+        with self._lock:
+            for key in names:
+                if key in self._keys:
+                    self._keys.move_to_end(key)
+                else:
+                    self._keys[key] = None
+
+            while len(self._keys) > self.maxsize:
+                self._keys.popitem(last=False)
+
+    def missing(self, conn: BaseConnection[Any]) -> list[Key]:
+        """Return the statements in the registry not prepared on a connection.
+
+        Return the most recently used first, and no more than the free slots
+        of the connection, so that preparing them doesn't evict anything.
+        """
+        prepared = conn._prepared
+        if prepared.prepare_threshold is None:
+            return []
+        if (nfree := prepared.prepared_max - len(prepared._names)) <= 0:
+            return []
+
+        with self._lock:
+            keys = list(self._keys)
+
+        rv = [key for key in reversed(keys) if key not in prepared._names]
+        return rv[:nfree]
+
+    def discard(self, key: Key) -> None:
+        """Remove a statement from the registry, if present."""
+        with self._lock:
+            self._keys.pop(key, None)
+
+
 class AttemptWithBackoff:
     """
     Keep the state of a repeated operation attempt with exponential backoff.
@@ -0,0 +1,416 @@
+"""
+Psycopg keyed connection pool module (async version).
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+import threading
+from time import monotonic
+from types import TracebackType
+from typing import Any, Generic, cast
+from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable, Hashable
+
+from psycopg import AsyncConnection
+
+from .abc import ACT, AsyncConnectionCB
+from .errors import PoolClosed
+from ._compat import Self
+from ._acompat import AQueue, AWorker, agather, aspawn
+from .pool_async import AsyncConnectionPool, MaintenanceTask, Schedule, StopWorker
+from .sched_async import AsyncScheduler
+
+logger = logging.getLogger("psycopg.pool")
+
+
+class AsyncKeyedConnectionPool(Generic[ACT]):
+    """
+    A pool of connections to several databases, or as several users.
+
+    The connections are requested specifying a key. The connections of every
+    key are managed by a separate pool, created on the first request, but all
+    the pools share the same maintenance workers and the same `!max_size`.
+    """
+
+    # Used to generate pool names
+    _num_pool = 0
+
+    def __init__(
+        self,
+        conninfo: Callable[[Any], str] | None = None,
+        *,
+        connection_class: type[ACT] = cast(type[ACT], AsyncConnection),
+        kwargs: dict[str, Any] | None = None,
+        max_size: int = 20,
+        key_min_size: int = 0,
+        key_max_size: int | None = None,
+        configure: AsyncConnectionCB[ACT] | None = None,
+        check: AsyncConnectionCB[ACT] | None = None,
+        reset: AsyncConnectionCB[ACT] | None = None,
+        name: str | None = None,
+        timeout: float = 30.0,
+        max_waiting: int = 0,
+        max_lifetime: float = 60 * 60.0,
+        max_idle: float = 10 * 60.0,
+        key_max_idle: float = 10 * 60.0,
+        reconnect_timeout: float = 5 * 60.0,
+        num_workers: int = 3,
+    ):
+        if key_max_size is None:
+            key_max_size = max_size
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0")
+        if key_min_size < 0:
+            raise ValueError("key_min_size cannot be negative")
+        if not key_min_size <= key_max_size <= max_size or key_max_size < 1:
+            raise ValueError(
+                "key_max_size must be between key_min_size and max_size,"
+                " and greater than 0"
+            )
+        if key_max_idle <= 0:
+            raise ValueError("key_max_idle must be greater than 0")
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+
+        if not name:
+            num = AsyncKeyedConnectionPool._num_pool = (
+                AsyncKeyedConnectionPool._num_pool + 1
+            )
+            name = f"keyed-pool-{num}"
+
+        self.conninfo = conninfo
+        self.kwargs = kwargs
+        self.connection_class = connection_class
+        self.name = name
+        self.max_size = max_size
+        self.key_min_size = key_min_size
+        self.key_max_size = key_max_size
+        self.timeout = timeout
+        self.max_waiting = max_waiting
+        self.max_lifetime = max_lifetime
+        self.max_idle = max_idle
+        self.key_max_idle = key_max_idle
+        self.reconnect_timeout = reconnect_timeout
+        self.num_workers = num_workers
+        self._configure = configure
+        self._check = check
+        self._reset = reset
+
+        # Protect the pools map and the connections budget. It is never held
+        # while acquiring the lock of a key pool.
+        self._lock = threading.RLock()
+        self._pools: dict[Hashable, _AsyncKeyedSubPool[ACT]] = {}
+
+        self._tasks: AQueue[MaintenanceTask]
+        self._sched: AsyncScheduler
+        self._sched_runner: AWorker | None = None
+        self._workers: list[AWorker] = []
+
+        self._opened = False
+        self._closed = True
+
+    def __repr__(self) -> str:
+        return (
+            f"<{self.__class__.__module__}.{self.__class__.__name__}"
+            f" {self.name!r} at 0x{id(self):x}>"
+        )
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the pool is closed."""
+        return self._closed
+
+    def keys(self) -> list[Hashable]:
+        """Return the keys currently managed by the pool."""
+        with self._lock:
+            return list(self._pools)
+
+    async def open(self) -> None:
+        """Open the pool by starting the workers shared by all the keys.
+
+        It is safe to call `!open()` again on a pool already open, but you
+        cannot currently re-open a closed pool.
+        """
+        with self._lock:
+            if not self._closed:
+                return
+            if self._opened:
+                raise PoolClosed(
+                    "pool has already been opened/closed and cannot be reused"
+                )
+
+            self._tasks = AQueue()
+            self._sched = AsyncScheduler()
+            self._sched_runner = aspawn(self._sched.run, name=f"{self.name}-scheduler")
+            for i in range(self.num_workers):
+                t = aspawn(
+                    AsyncConnectionPool.worker,
+                    args=(self._tasks,),
+                    name=f"{self.name}-worker-{i}",
+                )
+                self._workers.append(t)
+
+            self._closed = False
+            self._opened = True
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """Close the pools of all the keys and stop the workers.
+
+        Wait *timeout* seconds for threads to terminate their job, if positive.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            pools = list(self._pools.values())
+            self._pools.clear()
+
+        for pool in pools:
+            await pool.close(timeout=timeout)
+
+        # Stop the scheduler and the workers
+        await self._sched.enter(0, None)
+        workers, self._workers = self._workers[:], []
+        for _ in workers:
+            # The worker only checks the task type: no pool is needed.
+            self.run_task(StopWorker(self))  # type: ignore[arg-type]
+        if self._sched_runner:
+            workers.append(self._sched_runner)
+            self._sched_runner = None
+
+        await agather(*workers, timeout=timeout)
+
+    async def __aenter__(self) -> Self:
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @asynccontextmanager
+    async def connection(
+        self, key: Hashable, timeout: float | None = None
+    ) -> AsyncIterator[ACT]:
+        """Context manager to obtain a connection for *key* from the pool.
+
+        See `AsyncConnectionPool.connection()` for details.
+        """
+        async with self._get_pool(key).connection(timeout=timeout) as conn:
+            yield conn
+
+    async def getconn(self, key: Hashable, timeout: float | None = None) -> ACT:
+        """Obtain a connection for *key* from the pool.
+
+        After using this function you *must* call a corresponding `putconn()`.
+        """
+        return await self._get_pool(key).getconn(timeout=timeout)
+
+    async def putconn(self, conn: ACT) -> None:
+        """Return a connection obtained with `getconn()` to the pool."""
+        pool = getattr(conn, "_pool", None)
+        if not (isinstance(pool, _AsyncKeyedSubPool) and pool._keyed is self):
+            raise ValueError(
+                f"can't return connection to pool {self.name!r},"
+                f" it doesn't come from it: {conn}"
+            )
+        await pool.putconn(conn)
+
+    def get_stats(self) -> dict[Hashable, dict[str, int]]:
+        """
+        Return the stats about the pool usage, for every key.
+        """
+        with self._lock:
+            pools = list(self._pools.items())
+        return {key: pool.get_stats() for key, pool in pools}
+
+    def run_task(self, task: MaintenanceTask) -> None:
+        """Run a maintenance task in a worker."""
+        self._tasks.put_nowait(task)
+
+    def _get_pool(self, key: Hashable) -> _AsyncKeyedSubPool[ACT]:
+        """Return the pool of a key, creating it if needed."""
+        with self._lock:
+            if self._closed:
+                if self._opened:
+                    raise PoolClosed(f"the pool {self.name!r} is already closed")
+                else:
+                    raise PoolClosed(f"the pool {self.name!r} is not open yet")
+
+            if not (pool := self._pools.get(key)):
+                if self.conninfo:
+                    conninfo = self.conninfo(key)
+                elif isinstance(key, str):
+                    conninfo = key
+                else:
+                    raise TypeError(
+                        f"the key must be a conninfo string if no conninfo"
+                        f" function is specified; got {type(key).__name__}"
+                    )
+                logger.info("adding key %r to pool %r", key, self.name)
+                pool = self._pools[key] = _AsyncKeyedSubPool(self, key, conninfo)
+                pool._open()
+
+            # Setting this under lock prevents the key to be evicted.
+            pool._last_used = monotonic()
+            return pool
+
+    def _get_nconns(self) -> int:
+        """Return the number of connections managed by all the keys."""
+        with self._lock:
+            return sum(pool._nconns for pool in self._pools.values())
+
+    def _release_idle(self, requester: _AsyncKeyedSubPool[ACT]) -> None:
+        """Ask the key used least recently to close an idle connection.
+
+        Called when the pool is full and *requester* has clients waiting.
+        """
+        with self._lock:
+            pools = [p for p in self._pools.values() if p._can_release(requester)]
+        if pools:
+            pool = min(pools, key=lambda p: p._last_used)
+            self.run_task(ReleaseConnection(pool, requester))
+
+    async def _grow_starved(self) -> None:
+        """Grow the pools with clients waiting, if there is room left."""
+        with self._lock:
+            pools = [p for p in self._pools.values() if p._waiting]
+        for pool in pools:
+            async with pool._lock:
+                pool._maybe_grow_pool()
+
+    async def _maybe_evict(self, pool: _AsyncKeyedSubPool[ACT]) -> None:
+        """Close the pool of a key if it wasn't used for `key_max_idle`."""
+        with self._lock:
+            if (
+                self._pools.get(pool.key) is not pool
+                or monotonic() - pool._last_used < self.key_max_idle
+                or pool._waiting
+                or len(pool._pool) < pool._nconns
+            ):
+                return
+            del self._pools[pool.key]
+
+        logger.info("evicting idle key %r from pool %r", pool.key, self.name)
+        await pool.close()
+        await self._grow_starved()
+
+
+class _AsyncKeyedSubPool(AsyncConnectionPool[ACT]):
+    """The pool of the connections of a key of a keyed pool."""
+
+    def __init__(
+        self, keyed: AsyncKeyedConnectionPool[ACT], key: Hashable, conninfo: str
+    ):
+        self._keyed = keyed
+        self.key = key
+        self._last_used = monotonic()
+        super().__init__(
+            conninfo,
+            connection_class=keyed.connection_class,
+            kwargs=keyed.kwargs,
+            min_size=keyed.key_min_size,
+            max_size=keyed.key_max_size,
+            open=False,
+            configure=keyed._configure,
+            check=keyed._check,
+            reset=keyed._reset,
+            name=f"{keyed.name}[{key!r}]",
+            timeout=keyed.timeout,
+            max_waiting=keyed.max_waiting,
+            max_lifetime=keyed.max_lifetime,
+            max_idle=keyed.max_idle,
+            reconnect_timeout=keyed.reconnect_timeout,
+            num_workers=keyed.num_workers,
+        )
+
+    def _start_workers(self) -> None:
+        # Use the scheduler and the workers of the keyed pool.
+        self._tasks = self._keyed._tasks
+        self._sched = self._keyed._sched
+
+    async def _signal_stop_worker(self) -> list[AWorker]:
+        # The workers are shared with the other keys: leave them running.
+        return []
+
+    def _start_initial_tasks(self) -> None:
+        # Create only the initial connections which fit in the keyed pool.
+        self._nconns = 0
+        for i in range(self._min_size):
+            if not self._reserve_connection():
+                break
+        super()._start_initial_tasks()
+        self.run_task(Schedule(self, EvictKey(self), self._keyed.key_max_idle))
+
+    def _reserve_connection(self) -> bool:
+        keyed = self._keyed
+        with keyed._lock:
+            if keyed._get_nconns() < keyed.max_size:
+                return super()._reserve_connection()
+
+        # The keyed pool is full: if clients are waiting, make room by closing
+        # a connection idle in another key.
+        if self._waiting and self._nconns < self._max_size:
+            keyed._release_idle(self)
+        return False
+
+    def _can_release(self, requester: _AsyncKeyedSubPool[ACT]) -> bool:
+        """Return `!True` if the pool can give up an idle connection."""
+        return (
+            self is not requester and bool(self._pool) and self._nconns > self._min_size
+        )
+
+    async def _release_connection(self, requester: _AsyncKeyedSubPool[ACT]) -> None:
+        """Close an idle connection, if *requester* is still waiting for one."""
+        keyed = self._keyed
+        conn: ACT | None = None
+        async with self._lock:
+            if (
+                requester._waiting
+                and self._can_release(requester)
+                and keyed._get_nconns() >= keyed.max_size
+            ):
+                conn = self._pool.popleft()
+                self._nconns -= 1
+                self._nconns_min = min(self._nconns_min, len(self._pool))
+
+        if conn:
+            logger.info(
+                "closing connection in %r to make room for %r",
+                self.name,
+                requester.name,
+            )
+            await self._close_connection(conn)
+            await keyed._grow_starved()
+
+
+class ReleaseConnection(MaintenanceTask):
+    """Close an idle connection of a key to make room for another key."""
+
+    def __init__(
+        self, pool: _AsyncKeyedSubPool[Any], requester: _AsyncKeyedSubPool[Any]
+    ):
+        super().__init__(pool)
+        self.requester = requester
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        await cast(_AsyncKeyedSubPool[Any], pool)._release_connection(self.requester)
+
+
+class EvictKey(MaintenanceTask):
+    """Remove a key from its keyed pool if it wasn't used for a while.
+
+    Re-schedule periodically.
+    """
+
+    async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
+        sub = cast(_AsyncKeyedSubPool[Any], pool)
+        await sub.schedule_task(self, sub._keyed.key_max_idle)
+        await sub._keyed._maybe_evict(sub)
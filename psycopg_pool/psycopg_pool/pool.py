@@ -61,6 +61,9 @@ class ConnectionPool(Generic[CT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: ConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        checkout: str = "fifo",
+        adaptive: bool = False,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is Connection:
@@ -103,6 +106,9 @@ class ConnectionPool(Generic[CT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            checkout=checkout,
+            adaptive=adaptive,
         )
 
         # Construct the lock during single-threaded `__init__` so that
@@ -190,6 +196,7 @@ class ConnectionPool(Generic[CT], BasePool):
             self.putconn(conn)
             t1 = monotonic()
             self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._histograms[self._USAGE].observe(t1 - t0)
 
     def getconn(self, timeout: float | None = None) -> CT:
         """Obtain a connection from the pool.
@@ -203,7 +210,8 @@ class ConnectionPool(Generic[CT], BasePool):
         """
         if timeout is None:
             timeout = self.timeout
-        deadline = monotonic() + timeout
+        t0 = monotonic()
+        deadline = t0 + timeout
 
         logger.info("connection requested from %r", self.name)
         self._stats[self._REQUESTS_NUM] += 1
@@ -219,6 +227,9 @@ class ConnectionPool(Generic[CT], BasePool):
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
+        finally:
+            self._histograms[self._REQUESTS_WAIT].observe(monotonic() - t0)
+
     def _getconn_with_check_loop(self, deadline: float) -> CT:
         attempt: AttemptWithBackoff | None = None
 
@@ -230,6 +241,11 @@ class ConnectionPool(Generic[CT], BasePool):
                 self._putconn(conn, from_getconn=True)
             else:
                 logger.info("connection given by %r", self.name)
+                if self._prepared is not None:
+                    if self._prepared.missing(conn):
+                        self._stats[self._PREPARED_MISSES] += 1
+                    else:
+                        self._stats[self._PREPARED_HITS] += 1
                 return conn
 
             # Delay further checks to avoid a busy loop, using the same
@@ -287,7 +303,7 @@ class ConnectionPool(Generic[CT], BasePool):
         conn: CT | None = None
         if self._pool:
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pop_connection()
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -306,15 +322,37 @@ class ConnectionPool(Generic[CT], BasePool):
             logger.info("connection failed check: %s", e)
             raise
 
-    def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+    def _prepare_connection(self, conn: CT) -> None:
+        """Prepare on a connection the statements prepared by the other ones."""
+        if not self._prepared or not (keys := self._prepared.missing(conn)):
             return
+
+        with conn.lock:
+            prepared = conn.wait(conn._prepared.prepare_gen(conn, keys))
+        self._stats[self._PREPARED_NUM] += len(prepared)
+
+        # Don't try again to prepare statements failing.
+        for key in set(keys).difference(prepared):
+            if key not in conn._prepared._names:
+                self._prepared.discard(key)
+
+    def _maybe_grow_pool(self) -> None:
+        for i in range(self._growth_wanted(len(self._waiting))):
+            if not self._reserve_connection():
+                break
+            logger.info("growing pool %r to %s", self.name, self._nconns)
+            self._growing += 1
+            self.run_task(AddConnection(self, growing=True))
+
+    def _reserve_connection(self) -> bool:
+        """Account for a new connection to create, if the pool can grow.
+
+        Return `!False` if the pool cannot grow.
+        """
+        if self._nconns >= self._max_size:
+            return False
         self._nconns += 1
-        logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
-        self.run_task(AddConnection(self, growing=True))
+        return True
 
     def putconn(self, conn: CT) -> None:
         """Return a connection to the loving hands of its pool.
@@ -326,6 +364,8 @@ class ConnectionPool(Generic[CT], BasePool):
         self._check_pool_putconn(conn)
 
         logger.info("returning connection to %r", self.name)
+        if self._prepared is not None:
+            self._prepared.update(conn)
         if self._maybe_close_connection(conn):
             return
 
@@ -353,7 +393,7 @@ class ConnectionPool(Generic[CT], BasePool):
 
     def _putconn(self, conn: CT, from_getconn: bool) -> None:
         # Use a worker to perform eventual maintenance work in a separate task
-        if self._reset:
+        if self._reset or self._prepared is not None:
             self.run_task(ReturnConnection(self, conn, from_getconn=from_getconn))
         else:
             self._return_connection(conn, from_getconn=from_getconn)
@@ -422,7 +462,7 @@ class ConnectionPool(Generic[CT], BasePool):
 
         # Schedule a task to shrink the pool if connections over min_size have
         # remained unused.
-        self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
+        self.run_task(Schedule(self, ShrinkPool(self), self._shrink_interval()))
 
     def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
@@ -621,6 +661,7 @@ class ConnectionPool(Generic[CT], BasePool):
         else:
             t1 = monotonic()
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            self._histograms[self._CONNECTIONS].observe(t1 - t0)
 
         conn._pool = self
 
@@ -632,6 +673,8 @@ class ConnectionPool(Generic[CT], BasePool):
                     f"connection left in status {sname} by configure function {self._configure}: discarded"
                 )
 
+        self._prepare_connection(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -680,8 +723,8 @@ class ConnectionPool(Generic[CT], BasePool):
                 with self._lock:
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
-                    if growing and self._growing:
-                        self._growing = False
+                    if growing:
+                        self._growing -= 1
                 self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -694,22 +737,19 @@ class ConnectionPool(Generic[CT], BasePool):
         self._add_to_pool(conn)
         if growing:
             with self._lock:
+                self._growing -= 1
                 # Keep on growing if the pool is not full yet, or if there are
                 # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
-                ):
-                    self._nconns += 1
-                    logger.info("growing pool %r to %s", self.name, self._nconns)
-                    self.run_task(AddConnection(self, growing=True))
-                else:
-                    self._growing = False
+                if self._nconns < self._min_size or self._waiting:
+                    self._maybe_grow_pool()
 
     def _return_connection(self, conn: CT, from_getconn: bool) -> None:
         """
         Return a connection to the pool after usage.
         """
+        t0 = monotonic()
         self._reset_connection(conn)
+        self._histograms[self._RESETS].observe(monotonic() - t0)
         if from_getconn:
             if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
                 self._stats[self._CONNECTIONS_LOST] += 1
@@ -731,6 +771,14 @@ class ConnectionPool(Generic[CT], BasePool):
             self.run_task(AddConnection(self))
             return
 
+        try:
+            self._prepare_connection(conn)
+        except CLIENT_EXCEPTIONS as ex:
+            logger.warning("error preparing statements: %s", ex)
+            self._close_connection(conn)
+            self.run_task(AddConnection(self))
+            return
+
         self._add_to_pool(conn)
 
     def _add_to_pool(self, conn: CT) -> None:
@@ -824,16 +872,21 @@ class ConnectionPool(Generic[CT], BasePool):
         conn.close()
 
     def _shrink_pool(self) -> None:
-        to_close: CT | None = None
+        to_close: list[CT] = []
 
         with self._lock:
             # Reset the min number of connections used
             nconns_min = self._nconns_min
             self._nconns_min = len(self._pool)
 
-            # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
-                to_close = self._pool.popleft()
+            # If the pool can shrink and connections were unused, drop some
+            nclose = min(
+                self._shrink_wanted(nconns_min),
+                self._nconns - self._min_size,
+                len(self._pool),
+            )
+            for i in range(nclose):
+                to_close.append(self._pool.popleft())
                 self._nconns -= 1
                 self._nconns_min -= 1
 
@@ -843,9 +896,10 @@ class ConnectionPool(Generic[CT], BasePool):
                 self.name,
                 self._nconns,
                 nconns_min,
-                self.max_idle,
+                self._shrink_interval(),
             )
-            self._close_connection(to_close)
+            for conn in to_close:
+                self._close_connection(conn)
 
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
@@ -1008,7 +1062,7 @@ class ShrinkPool(MaintenanceTask):
     def _run(self, pool: ConnectionPool[Any]) -> None:
         # Reschedule the task now so that in case of any error we don't lose
         # the periodic run.
-        pool.schedule_task(self, pool.max_idle)
+        pool.schedule_task(self, pool._shrink_interval())
         pool._shrink_pool()
 
 
@@ -67,6 +67,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         reconnect_timeout: float = 5 * 60.0,
         reconnect_failed: AsyncConnectFailedCB | None = None,
         num_workers: int = 3,
+        share_prepared: bool = False,
+        checkout: str = "fifo",
+        adaptive: bool = False,
     ):
         if close_returns and PSYCOPG_VERSION < (3, 3):
             if connection_class is AsyncConnection:
@@ -112,6 +115,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             max_idle=max_idle,
             reconnect_timeout=reconnect_timeout,
             num_workers=num_workers,
+            share_prepared=share_prepared,
+            checkout=checkout,
+            adaptive=adaptive,
         )
 
         if True:  # ASYNC
@@ -226,6 +232,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             await self.putconn(conn)
             t1 = monotonic()
             self._stats[self._USAGE_MS] += int(1000.0 * (t1 - t0))
+            self._histograms[self._USAGE].observe(t1 - t0)
 
     async def getconn(self, timeout: float | None = None) -> ACT:
         """Obtain a connection from the pool.
@@ -239,7 +246,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         """
         if timeout is None:
             timeout = self.timeout
-        deadline = monotonic() + timeout
+        t0 = monotonic()
+        deadline = t0 + timeout
 
         logger.info("connection requested from %r", self.name)
         self._stats[self._REQUESTS_NUM] += 1
@@ -256,6 +264,9 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 f"couldn't get a connection after {timeout:.2f} sec"
             ) from None
 
+        finally:
+            self._histograms[self._REQUESTS_WAIT].observe(monotonic() - t0)
+
     async def _getconn_with_check_loop(self, deadline: float) -> ACT:
         attempt: AttemptWithBackoff | None = None
 
@@ -267,6 +278,11 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 await self._putconn(conn, from_getconn=True)
             else:
                 logger.info("connection given by %r", self.name)
+                if self._prepared is not None:
+                    if self._prepared.missing(conn):
+                        self._stats[self._PREPARED_MISSES] += 1
+                    else:
+                        self._stats[self._PREPARED_HITS] += 1
                 return conn
 
             # Delay further checks to avoid a busy loop, using the same
@@ -324,7 +340,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         conn: ACT | None = None
         if self._pool:
             # Take a connection ready out of the pool
-            conn = self._pool.popleft()
+            conn = self._pop_connection()
             if len(self._pool) < self._nconns_min:
                 self._nconns_min = len(self._pool)
         elif self.max_waiting and len(self._waiting) >= self.max_waiting:
@@ -344,15 +360,37 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             logger.info("connection failed check: %s", e)
             raise
 
-    def _maybe_grow_pool(self) -> None:
-        # Allow only one task at time to grow the pool (or returning
-        # connections might be starved).
-        if self._nconns >= self._max_size or self._growing:
+    async def _prepare_connection(self, conn: ACT) -> None:
+        """Prepare on a connection the statements prepared by the other ones."""
+        if not self._prepared or not (keys := self._prepared.missing(conn)):
             return
+
+        async with conn.lock:
+            prepared = await conn.wait(conn._prepared.prepare_gen(conn, keys))
+        self._stats[self._PREPARED_NUM] += len(prepared)
+
+        # Don't try again to prepare statements failing.
+        for key in set(keys).difference(prepared):
+            if key not in conn._prepared._names:
+                self._prepared.discard(key)
+
+    def _maybe_grow_pool(self) -> None:
+        for i in range(self._growth_wanted(len(self._waiting))):
+            if not self._reserve_connection():
+                break
+            logger.info("growing pool %r to %s", self.name, self._nconns)
+            self._growing += 1
+            self.run_task(AddConnection(self, growing=True))
+
+    def _reserve_connection(self) -> bool:
+        """Account for a new connection to create, if the pool can grow.
+
+        Return `!False` if the pool cannot grow.
+        """
+        if self._nconns >= self._max_size:
+            return False
         self._nconns += 1
-        logger.info("growing pool %r to %s", self.name, self._nconns)
-        self._growing = True
-        self.run_task(AddConnection(self, growing=True))
+        return True
 
     async def putconn(self, conn: ACT) -> None:
         """Return a connection to the loving hands of its pool.
@@ -364,6 +402,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         self._check_pool_putconn(conn)
 
         logger.info("returning connection to %r", self.name)
+        if self._prepared is not None:
+            self._prepared.update(conn)
         if await self._maybe_close_connection(conn):
             return
 
@@ -391,7 +431,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
 
     async def _putconn(self, conn: ACT, from_getconn: bool) -> None:
         # Use a worker to perform eventual maintenance work in a separate task
-        if self._reset:
+        if self._reset or self._prepared is not None:
             self.run_task(ReturnConnection(self, conn, from_getconn=from_getconn))
         else:
             await self._return_connection(conn, from_getconn=from_getconn)
@@ -487,7 +527,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
 
         # Schedule a task to shrink the pool if connections over min_size have
         # remained unused.
-        self.run_task(Schedule(self, ShrinkPool(self), self.max_idle))
+        self.run_task(Schedule(self, ShrinkPool(self), self._shrink_interval()))
 
     async def close(self, timeout: float = 5.0) -> None:
         """Close the pool and make it unavailable to new clients.
@@ -696,6 +736,7 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         else:
             t1 = monotonic()
             self._stats[self._CONNECTIONS_MS] += int(1000.0 * (t1 - t0))
+            self._histograms[self._CONNECTIONS].observe(t1 - t0)
 
         conn._pool = self
 
@@ -708,6 +749,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                     f" {self._configure}: discarded"
                 )
 
+        await self._prepare_connection(conn)
+
         # Set an expiry date, with some randomness to avoid mass reconnection
         self._set_connection_expiry_date(conn)
         return conn
@@ -756,8 +799,8 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 async with self._lock:
                     self._nconns -= 1
                     # If we have given up with a growing attempt, allow a new one.
-                    if growing and self._growing:
-                        self._growing = False
+                    if growing:
+                        self._growing -= 1
                 await self.reconnect_failed()
             else:
                 attempt.update_delay(now)
@@ -770,22 +813,19 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         await self._add_to_pool(conn)
         if growing:
             async with self._lock:
+                self._growing -= 1
                 # Keep on growing if the pool is not full yet, or if there are
                 # clients waiting and the pool can extend.
-                if self._nconns < self._min_size or (
-                    self._nconns < self._max_size and self._waiting
-                ):
-                    self._nconns += 1
-                    logger.info("growing pool %r to %s", self.name, self._nconns)
-                    self.run_task(AddConnection(self, growing=True))
-                else:
-                    self._growing = False
+                if self._nconns < self._min_size or self._waiting:
+                    self._maybe_grow_pool()
 
     async def _return_connection(self, conn: ACT, from_getconn: bool) -> None:
         """
         Return a connection to the pool after usage.
         """
+        t0 = monotonic()
         await self._reset_connection(conn)
+        self._histograms[self._RESETS].observe(monotonic() - t0)
         if from_getconn:
             if conn.pgconn.transaction_status == TransactionStatus.UNKNOWN:
                 self._stats[self._CONNECTIONS_LOST] += 1
@@ -809,6 +849,14 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
             self.run_task(AddConnection(self))
             return
 
+        try:
+            await self._prepare_connection(conn)
+        except CLIENT_EXCEPTIONS as ex:
+            logger.warning("error preparing statements: %s", ex)
+            await self._close_connection(conn)
+            self.run_task(AddConnection(self))
+            return
+
         await self._add_to_pool(conn)
 
     async def _add_to_pool(self, conn: ACT) -> None:
@@ -906,16 +954,21 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
         await conn.close()
 
     async def _shrink_pool(self) -> None:
-        to_close: ACT | None = None
+        to_close: list[ACT] = []
 
         async with self._lock:
             # Reset the min number of connections used
             nconns_min = self._nconns_min
             self._nconns_min = len(self._pool)
 
-            # If the pool can shrink and connections were unused, drop one
-            if self._nconns > self._min_size and nconns_min > 0 and self._pool:
-                to_close = self._pool.popleft()
+            # If the pool can shrink and connections were unused, drop some
+            nclose = min(
+                self._shrink_wanted(nconns_min),
+                self._nconns - self._min_size,
+                len(self._pool),
+            )
+            for i in range(nclose):
+                to_close.append(self._pool.popleft())
                 self._nconns -= 1
                 self._nconns_min -= 1
 
@@ -926,9 +979,10 @@ class AsyncConnectionPool(Generic[ACT], BasePool):
                 self.name,
                 self._nconns,
                 nconns_min,
-                self.max_idle,
+                self._shrink_interval(),
             )
-            await self._close_connection(to_close)
+            for conn in to_close:
+                await self._close_connection(conn)
 
     def _get_measures(self) -> dict[str, int]:
         rv = super()._get_measures()
@@ -1090,7 +1144,7 @@ class ShrinkPool(MaintenanceTask):
     async def _run(self, pool: AsyncConnectionPool[Any]) -> None:
         # Reschedule the task now so that in case of any error we don't lose
         # the periodic run.
-        await pool.schedule_task(self, pool.max_idle)
+        await pool.schedule_task(self, pool._shrink_interval())
         await pool._shrink_pool()
 
 
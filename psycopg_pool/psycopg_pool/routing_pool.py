@@ -0,0 +1,328 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'routing_pool_async.py'
+# DO NOT CHANGE! Change the original file instead.
+"""
+Psycopg read/write routing connection pool module (sync version).
+"""
+
+# Copyright (C) 2026 The Psycopg Team
+
+from __future__ import annotations
+
+import logging
+import threading
+from types import TracebackType
+from typing import Any, Generic
+from weakref import ref
+from contextlib import contextmanager
+from collections.abc import Iterator, Sequence
+
+from psycopg.rows import tuple_row
+
+from .abc import CT
+from .pool import CLIENT_EXCEPTIONS, ConnectionPool, MaintenanceTask
+from ._compat import Self
+
+logger = logging.getLogger("psycopg.pool")
+
+# The time the replica is behind the primary, 0 if not a replica. If the
+# replica has replayed everything it received, consider it not lagging,
+# otherwise an idle primary would make it look as lagging more and more. This
+# only holds if the replica is receiving the WAL: if not, it lags forever.
+# The status of the WAL receiver is only visible to pg_read_all_stats members:
+# for the other users, check that the process is running.
+LAG_QUERY = """SELECT CASE
+    WHEN NOT pg_is_in_recovery() THEN 0
+    WHEN NOT EXISTS (
+        SELECT FROM pg_stat_wal_receiver
+        WHERE coalesce(status, 'streaming') = 'streaming'
+    ) THEN 'Infinity'::float8
+    WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+END"""
+
+
+class RoutingConnectionPool(Generic[CT]):
+    """
+    A pool sending write operations to a primary and read ones to replicas.
+
+    The connections are obtained from the pools passed as parameters, which
+    are opened and closed together with the routing pool.
+    """
+
+    # Used to generate pool names
+    _num_pool = 0
+
+    def __init__(
+        self,
+        primary: ConnectionPool[CT],
+        replicas: Sequence[ConnectionPool[CT]] = (),
+        *,
+        max_lag: float | None = None,
+        lag_check_interval: float = 10.0,
+        name: str | None = None,
+    ):
+        pools = [primary, *replicas]
+        if len(set(map(id, pools))) < len(pools):
+            raise ValueError("the same pool cannot be used more than once")
+        if max_lag is not None and max_lag < 0:
+            raise ValueError("max_lag cannot be negative")
+        if lag_check_interval <= 0:
+            raise ValueError("lag_check_interval must be greater than 0")
+
+        if not name:
+            num = RoutingConnectionPool._num_pool = RoutingConnectionPool._num_pool + 1
+            name = f"routing-pool-{num}"
+
+        self.name = name
+        self.primary = primary
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self._replicas = [_Replica(pool) for pool in replicas]
+
+        # Protect the replicas state. Never held while waiting.
+        self._lock = threading.Lock()
+        # Rotate the replicas to choose among the ones equally loaded.
+        self._nchoices = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__module__}.{self.__class__.__name__} {self.name!r} at 0x{id(self):x}>"
+
+    @property
+    def replicas(self) -> list[ConnectionPool[CT]]:
+        """The pools of the replicas."""
+        return [r.pool for r in self._replicas]
+
+    @property
+    def closed(self) -> bool:
+        """`!True` if the pool is closed."""
+        return self.primary.closed
+
+    def open(self, wait: bool = False, timeout: float = 30.0) -> None:
+        """Open the primary and replica pools.
+
+        See `ConnectionPool.open()` for the meaning of the parameters.
+        If `!max_lag` is set, start checking periodically the replicas lag.
+        """
+        opened = not self.primary.closed
+        for pool in [self.primary, *self.replicas]:
+            pool.open(wait=wait, timeout=timeout)
+
+        if self.max_lag is not None and (not opened):
+            for r in self._replicas:
+                r.pool.run_task(CheckLag(r.pool, self))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Close the primary and replica pools.
+
+        See `ConnectionPool.close()` for details.
+        """
+        for pool in [self.primary, *self.replicas]:
+            pool.close(timeout=timeout)
+
+        for r in self._replicas:
+            if r.conn:
+                conn, r.conn = (r.conn, None)
+                conn.close()
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @contextmanager
+    def connection(
+        self, readonly: bool = False, timeout: float | None = None
+    ) -> Iterator[CT]:
+        """Context manager to obtain a connection from the pool.
+
+        If *readonly* is `!True`, return a connection from the replica with
+        the least requests outstanding, excluding the ones lagging more than
+        `!max_lag`. If there is no replica available, or if *readonly* is
+        `!False`, return a connection from the primary.
+
+        See `ConnectionPool.connection()` for details.
+        """
+        replica = self._choose_replica() if readonly else None
+        pool = replica.pool if replica else self.primary
+        try:
+            with pool.connection(timeout=timeout) as conn:
+                yield conn
+        finally:
+            if replica:
+                self._release_replica(replica)
+
+    def getconn(self, readonly: bool = False, timeout: float | None = None) -> CT:
+        """Obtain a connection from the primary or from a replica.
+
+        See `connection()` for the choice of the pool. After using this
+        function you *must* call a corresponding `putconn()`.
+        """
+        replica = self._choose_replica() if readonly else None
+        pool = replica.pool if replica else self.primary
+        try:
+            return pool.getconn(timeout=timeout)
+        except BaseException:
+            if replica:
+                self._release_replica(replica)
+            raise
+
+    def putconn(self, conn: CT) -> None:
+        """Return a connection obtained with `getconn()` to its pool."""
+        pool = getattr(conn, "_pool", None)
+        if pool is None or pool is self.primary:
+            # If the pool is None, let the primary complain appropriately.
+            self.primary.putconn(conn)
+            return
+
+        for replica in self._replicas:
+            if replica.pool is pool:
+                self._release_replica(replica)
+                pool.putconn(conn)
+                return
+
+        raise ValueError(
+            f"can't return connection to pool {self.name!r}, it doesn't come from it: {conn}"
+        )
+
+    def get_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Return the stats about the usage of the primary and the replica pools.
+        """
+        return {pool.name: pool.get_stats() for pool in [self.primary, *self.replicas]}
+
+    def get_lags(self) -> dict[str, float | None]:
+        """Return the replication lag measured on the replicas, in seconds.
+
+        The lag is `!None` if it wasn't measured yet, infinite if the last
+        measure failed.
+        """
+        with self._lock:
+            return {r.pool.name: r.lag for r in self._replicas}
+
+    def _choose_replica(self) -> _Replica[CT] | None:
+        """Return the available replica with the least outstanding requests."""
+        if not (n := len(self._replicas)):
+            return None
+
+        with self._lock:
+            self._nchoices += 1
+            replicas = [self._replicas[(self._nchoices + i) % n] for i in range(n)]
+            if self.max_lag is not None:
+                max_lag = self.max_lag
+                replicas = [r for r in replicas if r.lag is None or r.lag <= max_lag]
+            if not replicas:
+                logger.debug("no replica available in %r: using primary", self.name)
+                return None
+
+            replica = min(replicas, key=lambda r: r.outstanding)
+            replica.outstanding += 1
+            return replica
+
+    def _release_replica(self, replica: _Replica[CT]) -> None:
+        with self._lock:
+            replica.outstanding -= 1
+
+    def _check_lag(self, pool: ConnectionPool[Any]) -> None:
+        """Measure the replication lag of a replica."""
+        for replica in self._replicas:
+            if replica.pool is pool:
+                break
+        else:
+            return
+
+        lag: float
+        try:
+            lag = self._measure_lag(replica)
+        except CLIENT_EXCEPTIONS as ex:
+            logger.warning("error checking replica lag in %r: %s", pool.name, ex)
+            lag = float("inf")
+            if replica.conn:
+                conn, replica.conn = (replica.conn, None)
+                conn.close()
+
+        if pool.closed and replica.conn:
+            # The router was closed during the check.
+            conn, replica.conn = (replica.conn, None)
+            conn.close()
+            return
+
+        with self._lock:
+            was_lagging = self._is_lagging(replica.lag)
+            replica.lag = lag
+
+        if (lagging := self._is_lagging(lag)) != was_lagging:
+            if lagging:
+                logger.warning(
+                    "replica %r lagging %s sec: excluded from %r",
+                    pool.name,
+                    lag,
+                    self.name,
+                )
+            else:
+                logger.info("replica %r back in %r", pool.name, self.name)
+
+    def _measure_lag(self, replica: _Replica[CT]) -> float:
+        """Run the lag query on the replica.
+
+        The check runs in a worker of the replica pool: use a connection of
+        the router, so that the worker doesn't wait for one from the pool,
+        blocking the tasks needed to grow it. Don't wait for the replica
+        longer than the check interval either.
+        """
+        if not (conn := replica.conn):
+            pool = replica.pool
+            conninfo = pool._resolve_conninfo()
+            kwargs = pool._resolve_kwargs().copy()
+            kwargs["autocommit"] = True
+            kwargs["connect_timeout"] = max(round(self.lag_check_interval), 1)
+            conn = replica.conn = pool.connection_class.connect(conninfo, **kwargs)
+            timeout = max(int(self.lag_check_interval * 1000), 1)
+            conn.execute(
+                "SELECT set_config('statement_timeout', %s, false)", [str(timeout)]
+            )
+
+        cur = conn.cursor(row_factory=tuple_row)
+        cur.execute(LAG_QUERY)
+        row = cur.fetchone()
+        return float(row[0]) if row and row[0] is not None else 0.0
+
+    def _is_lagging(self, lag: float | None) -> bool:
+        return self.max_lag is not None and lag is not None and (lag > self.max_lag)
+
+
+class _Replica(Generic[CT]):
+    """The state of a replica in a routing pool."""
+
+    __slots__ = ("pool", "outstanding", "lag", "conn")
+
+    def __init__(self, pool: ConnectionPool[CT]):
+        self.pool = pool
+        self.outstanding = 0
+        self.lag: float | None = None
+        # The connection used to check the lag.
+        self.conn: CT | None = None
+
+
+class CheckLag(MaintenanceTask):
+    """Measure the replication lag of a replica of a routing pool.
+
+    Re-schedule periodically.
+    """
+
+    def __init__(self, pool: ConnectionPool[Any], router: RoutingConnectionPool[Any]):
+        super().__init__(pool)
+        self.router = ref(router)
+
+    def _run(self, pool: ConnectionPool[Any]) -> None:
+        if not (router := self.router()):
+            return
+        pool.schedule_task(self, router.lag_check_interval)
+        router._check_lag(pool)
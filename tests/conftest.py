@@ -38,6 +38,7 @@ def pytest_configure(config):
         "dns: the test requires dnspython to run",
         "postgis: the test requires the PostGIS extension to run",
         "numpy: the test requires numpy module to be installed",
+        "pyarrow: the test requires pyarrow module to be installed",
     ]
 
     for marker in markers:
@@ -0,0 +1,67 @@
+import pytest
+
+try:
+    from psycopg_pool import Histogram
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def test_observe():
+    h = Histogram([0.1, 1.0, 10.0])
+    for v in [0.05, 0.1, 0.5, 2.0, 20.0, 30.0]:
+        h.observe(v)
+    assert h.count == 6
+    assert h.sum == pytest.approx(52.65)
+    assert h.counts == [2, 1, 1, 2]
+    assert h.buckets() == [(0.1, 2), (1.0, 3), (10.0, 4), (float("inf"), 6)]
+
+
+def test_bad_bounds():
+    with pytest.raises(ValueError):
+        Histogram([1.0, 0.1])
+    with pytest.raises(ValueError):
+        Histogram([0.1, 0.1])
+
+
+def test_quantile():
+    h = Histogram([1.0, 2.0, 4.0])
+    assert h.quantile(0.5) == 0.0
+
+    for v in [0.5, 0.5, 1.5, 3.0]:
+        h.observe(v)
+    assert h.quantile(0.0) == 0.0
+    assert h.quantile(0.5) == 1.0
+    assert h.quantile(0.75) == 2.0
+    assert h.quantile(1.0) == 4.0
+
+    h.observe(10.0)
+    assert h.quantile(1.0) == 4.0
+
+    with pytest.raises(ValueError):
+        h.quantile(1.5)
+
+
+def test_copy():
+    h = Histogram()
+    h.observe(0.2)
+    h2 = h.copy()
+    h.observe(0.3)
+    assert h2.count == 1
+    assert h2.sum == 0.2
+    assert sum(h2.counts) == 1
+
+
+def test_diff():
+    h = Histogram([1.0, 2.0])
+    h.observe(0.5)
+    h0 = h.copy()
+    h.observe(1.5)
+    h.observe(3.0)
+    d = h.diff(h0)
+    assert d.count == 2
+    assert d.sum == pytest.approx(4.5)
+    assert d.counts == [0, 1, 1]
+
+    with pytest.raises(ValueError):
+        h.diff(Histogram([1.0]))
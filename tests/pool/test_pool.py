@@ -13,6 +13,7 @@ import pytest
 
 import psycopg
 from psycopg.pq import TransactionStatus
+from psycopg.copy import ParallelCopy
 from psycopg.rows import Row, TupleRow, class_row
 
 from .. import acompat
@@ -157,6 +158,25 @@ def test_concurrent_filling(dsn, monkeypatch):
             assert got == pytest.approx(want, 0.1), times
 
 
+def test_parallel_copy(dsn):
+    with pool.ConnectionPool(dsn, min_size=3) as p:
+        with p.connection() as conn:
+            conn.execute("drop table if exists copy_in")
+            conn.execute(
+                "create table copy_in (id int, pid int default pg_backend_pid())"
+            )
+
+        with ParallelCopy(p, "copy copy_in (id) from stdin", chunk_size=10) as copy:
+            for i in range(100):
+                copy.write_row((i,))
+
+        assert copy.rowcount == 100
+        assert p.get_stats()["pool_available"] == 3
+        with p.connection() as conn:
+            cur = conn.execute("select count(*), count(distinct pid) from copy_in")
+            assert cur.fetchone() == (100, 3)
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 def test_wait_ready(dsn, monkeypatch):
@@ -481,6 +501,73 @@ def test_shrink(dsn, monkeypatch):
     assert results == [(4, 4), (4, 3), (3, 2), (2, 2), (2, 2)]
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+def test_grow_adaptive(dsn, monkeypatch):
+    delay_connection(monkeypatch, 0.1)
+
+    def worker(n):
+        t0 = time()
+        with p.connection() as conn:
+            conn.execute("select 1 from pg_sleep(0.25)")
+        t1 = time()
+        results.append((n, t1 - t0))
+
+    with pool.ConnectionPool(
+        dsn, min_size=0, max_size=4, num_workers=4, adaptive=True
+    ) as p:
+        results: list[tuple[int, float]] = []
+        ts = [spawn(worker, args=(i,)) for i in range(4)]
+        gather(*ts)
+
+    # The connections are created in parallel.
+    times = [item[1] for item in results]
+    for got in times:
+        assert got == pytest.approx(0.35, 0.1), times
+
+
+def test_growth_wanted():
+    p = pool.ConnectionPool(open=False, min_size=0, max_size=10)
+    assert p._growth_wanted(5) == 1
+    p._growing = 1
+    assert p._growth_wanted(5) == 0
+
+    p = pool.ConnectionPool(open=False, min_size=0, max_size=10, adaptive=True)
+    assert p._growth_wanted(0) == 1
+    assert p._growth_wanted(5) == 5
+    p._growing = 2
+    assert p._growth_wanted(5) == 3
+
+    # Half of the connections in use return while a new one is created.
+    p._growing = 0
+    p._nconns = 4
+    p._histograms[p._CONNECTIONS].observe(0.1)
+    p._histograms[p._USAGE].observe(0.2)
+    assert p._growth_wanted(5) == 3
+
+
+def test_shrink_wanted():
+    p = pool.ConnectionPool(open=False, max_size=10)
+    assert p._shrink_interval() == p.max_idle
+    assert p._shrink_wanted(0) == 0
+    assert p._shrink_wanted(4) == 1
+
+    p = pool.ConnectionPool(open=False, max_size=10, max_idle=60, adaptive=True)
+    assert p._shrink_interval() == 6.0
+    assert p._shrink_wanted(0) == 0
+    assert p._shrink_wanted(1) == 1
+    assert p._shrink_wanted(4) == 2
+
+    # The clients waited longer than a connection takes: don't shrink.
+    p._histograms[p._CONNECTIONS].observe(0.01)
+    for i in range(10):
+        p._histograms[p._REQUESTS_WAIT].observe(0.5)
+    assert p._shrink_wanted(4) == 0
+
+    # No client waited since the last check.
+    assert p._shrink_wanted(4) == 2
+
+
 @pytest.mark.slow
 @pytest.mark.timing
 def test_reconnect(proxy, caplog, monkeypatch):
@@ -682,6 +769,35 @@ def test_resize(dsn):
     assert size == [2, 1, 3, 4, 3, 2, 2]
 
 
+@pytest.mark.parametrize("checkout, same", [("fifo", False), ("lifo", True)])
+def test_checkout(dsn, checkout, same):
+    with pool.ConnectionPool(dsn, min_size=2, checkout=checkout) as p:
+        p.wait()
+        with p.connection() as conn:
+            pid = conn.info.backend_pid
+        with p.connection() as conn:
+            assert (conn.info.backend_pid == pid) is same
+
+
+def test_checkout_prepared(dsn):
+    with pool.ConnectionPool(dsn, min_size=2, checkout="prepared") as p:
+        p.wait()
+        with p.connection() as conn2:
+            with p.connection() as conn:
+                pid = conn.info.backend_pid
+                conn.execute("select 1", prepare=True)
+            assert conn2.info.backend_pid != pid
+
+        # conn2 was returned last, but conn has a statement prepared.
+        with p.connection() as conn:
+            assert conn.info.backend_pid == pid
+
+
+def test_checkout_bad():
+    with pytest.raises(ValueError):
+        pool.ConnectionPool(open=False, checkout="random")
+
+
 @pytest.mark.parametrize("min_size, max_size", [(0, 0), (-1, None), (4, 2)])
 def test_bad_resize(dsn, min_size, max_size):
     with pool.ConnectionPool() as p:
@@ -898,6 +1014,122 @@ def test_stats_check(dsn):
         assert stats["connections_lost"] == 1
 
 
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 behaviour")
+def test_share_prepared(dsn):
+    with pool.ConnectionPool(dsn, min_size=2, share_prepared=True) as p:
+        p.wait()
+        with p.connection() as conn:
+            pid = conn.info.backend_pid
+            conn.execute("select 'a'", prepare=True)
+
+        with p.connection() as conn:
+            # The statement is prepared when the connection is returned.
+            assert conn.info.backend_pid != pid
+            pid2 = conn.info.backend_pid
+
+        with p.connection() as conn:
+            assert conn.info.backend_pid == pid
+
+        with p.connection() as conn:
+            assert conn.info.backend_pid == pid2
+            cur = conn.execute(
+                "select statement from pg_prepared_statements", prepare=False
+            )
+            assert cur.fetchall() == [("select 'a'",)]
+
+        stats = p.get_stats()
+        assert stats["prepared_num"] == 1
+        assert stats["prepared_misses"] == 1
+        assert stats["prepared_hits"] == 2
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 behaviour")
+def test_share_prepared_no_eviction(dsn):
+
+    def configure(conn):
+        conn.prepared_max = 2
+
+    with pool.ConnectionPool(
+        dsn, min_size=2, share_prepared=True, configure=configure
+    ) as p:
+        p.wait()
+        with p.connection() as conn:
+            pid = conn.info.backend_pid
+            conn.execute("select 'a'", prepare=True)
+            conn.execute("select 'b'", prepare=True)
+
+        with p.connection() as conn:
+            assert conn.info.backend_pid != pid
+            conn.execute("select 'c'", prepare=True)
+
+        with p.connection() as conn:
+            assert conn.info.backend_pid == pid
+
+        with p.connection() as conn:
+            # Only the free slot is used: the own statement is not evicted.
+            assert conn.info.backend_pid != pid
+            cur = conn.execute(
+                "select statement from pg_prepared_statements order by 1", prepare=False
+            )
+            assert cur.fetchall() == [("select 'b'",), ("select 'c'",)]
+
+
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 behaviour")
+def test_share_prepared_new_conn(dsn):
+    with pool.ConnectionPool(dsn, min_size=1, share_prepared=True) as p:
+        with p.connection() as conn:
+            conn.execute("select 'a'", prepare=True)
+
+        p.drain()
+        with p.connection() as conn:
+            cur = conn.execute(
+                "select statement from pg_prepared_statements", prepare=False
+            )
+            assert cur.fetchall() == [("select 'a'",)]
+
+        stats = p.get_stats()
+        assert stats["prepared_num"] == 1
+        assert stats["prepared_hits"] == 1
+        assert "prepared_misses" not in stats
+
+
+def test_share_prepared_disabled(dsn):
+    with pool.ConnectionPool(dsn, min_size=2) as p:
+        p.wait()
+        with p.connection() as conn:
+            conn.execute("select 'a'", prepare=True)
+
+        with p.connection() as conn:
+            cur = conn.execute(
+                "select statement from pg_prepared_statements", prepare=False
+            )
+            assert cur.fetchall() == []
+
+        assert "prepared_num" not in p.get_stats()
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(PSYCOPG_VERSION < (3, 4), reason="psycopg >= 3.4 behaviour")
+def test_share_prepared_concurrent(dsn):
+
+    def worker(n):
+        for i in range(20):
+            with p.connection() as conn:
+                conn.execute(f"select {n * 100 + i}", prepare=True)
+
+    with pool.ConnectionPool(
+        dsn, min_size=4, share_prepared=True, max_lifetime=0.2
+    ) as p:
+        p.wait()
+        # Connections are returned while others are checked out and prepared.
+        ts = [spawn(worker, args=(i,)) for i in range(8)]
+        gather(*ts)
+
+        stats = p.get_stats()
+        assert "requests_errors" not in stats
+        assert stats["prepared_num"] > 0
+
+
 @pytest.mark.slow
 def test_spike(dsn, monkeypatch):
     # Inspired to https://github.com/brettwooldridge/HikariCP/blob/dev/
@@ -576,6 +576,29 @@ def test_stats_usage(pool_cls, dsn):
         assert p.get_stats()["requests_num"] == 1
 
 
+def test_histograms(pool_cls, dsn):
+    with pool_cls(dsn, min_size=min_size(pool_cls)) as p:
+        for i in range(3):
+            with p.connection() as conn:
+                conn.execute("select 1")
+
+        hs = p.get_histograms()
+        assert hs["requests_wait"].count == 3
+        assert hs["usage"].count == 3
+        assert hs["connections"].count >= 1
+        assert hs["connections"].sum > 0
+
+        metrics = p.get_metrics()
+        assert f'psycopg_pool_max{{pool="{p.name}"}} ' in metrics
+        assert f'psycopg_pool_requests_num_total{{pool="{p.name}"}} 3' in metrics
+        assert (
+            f'psycopg_pool_usage_seconds_bucket{{pool="{p.name}",le="+Inf"}} 3'
+            in metrics
+        )
+        assert f'psycopg_pool_usage_seconds_count{{pool="{p.name}"}} 3' in metrics
+        assert metrics.endswith("\n# EOF\n")
+
+
 def test_debug_deadlock(pool_cls, dsn):
     # https://github.com/psycopg/psycopg/issues/230
     logger = logging.getLogger("psycopg")
@@ -0,0 +1,144 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'test_pool_keyed_async.py'
+# DO NOT CHANGE! Change the original file instead.
+from __future__ import annotations
+
+import pytest
+
+import psycopg
+
+from ..acompat import sleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+@pytest.mark.parametrize(
+    "max_size, key_min_size, key_max_size",
+    [(0, 0, None), (4, -1, None), (4, 3, 2), (4, 0, 5), (4, 0, 0)],
+)
+def test_bad_size(max_size, key_min_size, key_max_size):
+    with pytest.raises(ValueError):
+        pool.KeyedConnectionPool(
+            max_size=max_size, key_min_size=key_min_size, key_max_size=key_max_size
+        )
+
+
+def test_bad_key_max_idle():
+    with pytest.raises(ValueError):
+        pool.KeyedConnectionPool(key_max_idle=0)
+
+
+def test_not_open():
+    p = pool.KeyedConnectionPool()
+    assert p.closed
+    with pytest.raises(pool.PoolClosed, match="not open yet"):
+        p.getconn("dbname=test")
+
+
+def test_bad_key():
+    with pool.KeyedConnectionPool() as p:
+        with pytest.raises(TypeError):
+            p.getconn(42)
+        assert p.keys() == []
+
+
+def test_connection(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn) as p:
+        with p.connection("a") as conn1:
+            cur = conn1.execute("select 1")
+            assert cur.fetchone() == (1,)
+        with p.connection("b") as conn2:
+            assert conn2 is not conn1
+        with p.connection("a") as conn3:
+            assert conn3 is conn1
+
+        assert set(p.keys()) == {"a", "b"}
+        stats = p.get_stats()
+        assert stats["a"]["requests_num"] == 2
+        assert stats["b"]["requests_num"] == 1
+
+
+def test_key_as_conninfo(dsn):
+    with pool.KeyedConnectionPool() as p:
+        conn = p.getconn(dsn)
+        assert conn.info.status == psycopg.pq.ConnStatus.OK
+        p.putconn(conn)
+        assert p.keys() == [dsn]
+
+
+def test_putconn_bad(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn) as p:
+        with psycopg.Connection.connect(dsn) as conn:
+            with pytest.raises(ValueError):
+                p.putconn(conn)
+
+
+def test_key_min_size(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn, max_size=3, key_min_size=2) as p:
+        with p.connection("a"):
+            pass
+        with p.connection("b"):
+            pass
+        sleep(0.5)
+        stats = p.get_stats()
+        assert stats["a"]["pool_size"] == 2
+        assert stats["b"]["pool_size"] == 1
+
+
+def test_max_size_shared(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn, max_size=2, timeout=2.0) as p:
+        conns = [p.getconn("a") for i in range(2)]
+        for conn in conns:
+            p.putconn(conn)
+
+        # The pool is full: a connection of 'a' is closed to make room for 'b'
+        with p.connection("b") as conn:
+            assert conn not in conns
+
+        stats = p.get_stats()
+        assert stats["a"]["pool_size"] == 1
+        assert stats["b"]["pool_size"] == 1
+
+
+def test_max_size_timeout(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn, max_size=2, timeout=0.5) as p:
+        with p.connection("a"), p.connection("a"):
+            with pytest.raises(pool.PoolTimeout):
+                p.getconn("b")
+
+
+@pytest.mark.slow
+def test_evict(dsn):
+    with pool.KeyedConnectionPool(lambda key: dsn, key_max_idle=0.2) as p:
+        with p.connection("a"):
+            sleep(0.5)
+            assert p.keys() == ["a"]
+
+        sleep(0.5)
+        assert p.keys() == []
+
+        with p.connection("a") as conn:
+            assert not conn.closed
+        assert p.keys() == ["a"]
+
+
+def test_close(dsn):
+    p = pool.KeyedConnectionPool(lambda key: dsn)
+    p.open()
+    conn = p.getconn("a")
+    p.close()
+    assert p.closed
+    assert p.keys() == []
+
+    with pytest.raises(pool.PoolClosed, match="already closed"):
+        p.getconn("a")
+    with pytest.raises(pool.PoolClosed):
+        p.open()
+
+    # Returning the connection to a closed pool closes it
+    p.putconn(conn)
+    assert conn.closed
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import pytest
+
+import psycopg
+
+from ..acompat import asleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+if True:  # ASYNC
+    pytestmark = [pytest.mark.anyio]
+
+
+@pytest.mark.parametrize(
+    "max_size, key_min_size, key_max_size",
+    [(0, 0, None), (4, -1, None), (4, 3, 2), (4, 0, 5), (4, 0, 0)],
+)
+async def test_bad_size(max_size, key_min_size, key_max_size):
+    with pytest.raises(ValueError):
+        pool.AsyncKeyedConnectionPool(
+            max_size=max_size, key_min_size=key_min_size, key_max_size=key_max_size
+        )
+
+
+async def test_bad_key_max_idle():
+    with pytest.raises(ValueError):
+        pool.AsyncKeyedConnectionPool(key_max_idle=0)
+
+
+async def test_not_open():
+    p = pool.AsyncKeyedConnectionPool()
+    assert p.closed
+    with pytest.raises(pool.PoolClosed, match="not open yet"):
+        await p.getconn("dbname=test")
+
+
+async def test_bad_key():
+    async with pool.AsyncKeyedConnectionPool() as p:
+        with pytest.raises(TypeError):
+            await p.getconn(42)
+        assert p.keys() == []
+
+
+async def test_connection(dsn):
+    async with pool.AsyncKeyedConnectionPool(lambda key: dsn) as p:
+        async with p.connection("a") as conn1:
+            cur = await conn1.execute("select 1")
+            assert await cur.fetchone() == (1,)
+        async with p.connection("b") as conn2:
+            assert conn2 is not conn1
+        async with p.connection("a") as conn3:
+            assert conn3 is conn1
+
+        assert set(p.keys()) == {"a", "b"}
+        stats = p.get_stats()
+        assert stats["a"]["requests_num"] == 2
+        assert stats["b"]["requests_num"] == 1
+
+
+async def test_key_as_conninfo(dsn):
+    async with pool.AsyncKeyedConnectionPool() as p:
+        conn = await p.getconn(dsn)
+        assert conn.info.status == psycopg.pq.ConnStatus.OK
+        await p.putconn(conn)
+        assert p.keys() == [dsn]
+
+
+async def test_putconn_bad(dsn):
+    async with pool.AsyncKeyedConnectionPool(lambda key: dsn) as p:
+        async with await psycopg.AsyncConnection.connect(dsn) as conn:
+            with pytest.raises(ValueError):
+                await p.putconn(conn)
+
+
+async def test_key_min_size(dsn):
+    async with pool.AsyncKeyedConnectionPool(
+        lambda key: dsn, max_size=3, key_min_size=2
+    ) as p:
+        async with p.connection("a"):
+            pass
+        async with p.connection("b"):
+            pass
+        await asleep(0.5)
+        stats = p.get_stats()
+        assert stats["a"]["pool_size"] == 2
+        assert stats["b"]["pool_size"] == 1
+
+
+async def test_max_size_shared(dsn):
+    async with pool.AsyncKeyedConnectionPool(
+        lambda key: dsn, max_size=2, timeout=2.0
+    ) as p:
+        conns = [await p.getconn("a") for i in range(2)]
+        for conn in conns:
+            await p.putconn(conn)
+
+        # The pool is full: a connection of 'a' is closed to make room for 'b'
+        async with p.connection("b") as conn:
+            assert conn not in conns
+
+        stats = p.get_stats()
+        assert stats["a"]["pool_size"] == 1
+        assert stats["b"]["pool_size"] == 1
+
+
+async def test_max_size_timeout(dsn):
+    async with pool.AsyncKeyedConnectionPool(
+        lambda key: dsn, max_size=2, timeout=0.5
+    ) as p:
+        async with p.connection("a"), p.connection("a"):
+            with pytest.raises(pool.PoolTimeout):
+                await p.getconn("b")
+
+
+@pytest.mark.slow
+async def test_evict(dsn):
+    async with pool.AsyncKeyedConnectionPool(lambda key: dsn, key_max_idle=0.2) as p:
+        async with p.connection("a"):
+            await asleep(0.5)
+            assert p.keys() == ["a"]
+
+        await asleep(0.5)
+        assert p.keys() == []
+
+        async with p.connection("a") as conn:
+            assert not conn.closed
+        assert p.keys() == ["a"]
+
+
+async def test_close(dsn):
+    p = pool.AsyncKeyedConnectionPool(lambda key: dsn)
+    await p.open()
+    conn = await p.getconn("a")
+    await p.close()
+    assert p.closed
+    assert p.keys() == []
+
+    with pytest.raises(pool.PoolClosed, match="already closed"):
+        await p.getconn("a")
+    with pytest.raises(pool.PoolClosed):
+        await p.open()
+
+    # Returning the connection to a closed pool closes it
+    await p.putconn(conn)
+    assert conn.closed
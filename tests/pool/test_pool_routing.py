@@ -0,0 +1,164 @@
+# WARNING: this file is auto-generated by 'async_to_sync.py'
+# from the original file 'test_pool_routing_async.py'
+# DO NOT CHANGE! Change the original file instead.
+from __future__ import annotations
+
+import pytest
+
+from ..acompat import sleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+
+def make_pools(dsn, nreplicas, **kwargs):
+    primary = pool.ConnectionPool(dsn, name="primary", open=False, **kwargs)
+    replicas = [
+        pool.ConnectionPool(dsn, name=f"replica{i}", open=False, **kwargs)
+        for i in range(nreplicas)
+    ]
+    return (primary, replicas)
+
+
+def test_bad_params():
+    primary, replicas = make_pools("", 2)
+    with pytest.raises(ValueError):
+        pool.RoutingConnectionPool(primary, [replicas[0], replicas[0]])
+    with pytest.raises(ValueError):
+        pool.RoutingConnectionPool(primary, [primary])
+    with pytest.raises(ValueError):
+        pool.RoutingConnectionPool(primary, replicas, max_lag=-1)
+    with pytest.raises(ValueError):
+        pool.RoutingConnectionPool(primary, replicas, lag_check_interval=0)
+
+
+def test_choose_least_outstanding():
+    primary, replicas = make_pools("", 3)
+    p = pool.RoutingConnectionPool(primary, replicas)
+    chosen = []
+    for i in range(3):
+        assert (r := p._choose_replica())
+        chosen.append(r)
+    assert {r.pool for r in chosen} == set(replicas)
+
+    p._release_replica(chosen[1])
+    assert (r := p._choose_replica()) is chosen[1]
+    assert r.outstanding == 1
+    assert [r.outstanding for r in p._replicas] == [1, 1, 1]
+
+
+def test_choose_no_replica():
+    primary, replicas = make_pools("", 0)
+    p = pool.RoutingConnectionPool(primary, replicas)
+    assert p._choose_replica() is None
+
+
+def test_choose_exclude_lagging():
+    primary, replicas = make_pools("", 2)
+    p = pool.RoutingConnectionPool(primary, replicas, max_lag=1.0)
+    p._replicas[0].lag = 10.0
+    p._replicas[1].lag = 0.5
+    for i in range(3):
+        r = p._choose_replica()
+        assert r and r.pool is replicas[1]
+
+    p._replicas[1].lag = float("inf")
+    assert p._choose_replica() is None
+
+
+def test_connection(dsn):
+    primary, replicas = make_pools(dsn, 2)
+    with pool.RoutingConnectionPool(primary, replicas) as p:
+        with p.connection() as conn:
+            assert conn._pool is primary
+        with p.connection(readonly=True) as conn1:
+            assert conn1._pool in replicas
+            with p.connection(readonly=True) as conn2:
+                assert conn2._pool in replicas
+                assert conn2._pool is not conn1._pool
+
+        assert [r.outstanding for r in p._replicas] == [0, 0]
+        stats = p.get_stats()
+        assert stats["primary"]["requests_num"] == 1
+        assert stats["replica0"]["requests_num"] == 1
+        assert stats["replica1"]["requests_num"] == 1
+
+    assert p.closed
+    assert all((r.closed for r in replicas))
+
+
+def test_getconn_putconn(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    with pool.RoutingConnectionPool(primary, replicas) as p:
+        conn = p.getconn(readonly=True)
+        assert conn._pool is replicas[0]
+        assert p._replicas[0].outstanding == 1
+        p.putconn(conn)
+        assert p._replicas[0].outstanding == 0
+
+        conn = p.getconn()
+        assert conn._pool is primary
+        p.putconn(conn)
+
+
+def test_putconn_bad(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    with pool.RoutingConnectionPool(primary, replicas) as p:
+        with pool.ConnectionPool(dsn) as other:
+            conn = other.getconn()
+            with pytest.raises(ValueError):
+                p.putconn(conn)
+            other.putconn(conn)
+
+
+def test_check_lag(dsn):
+    primary, replicas = make_pools(dsn, 2)
+    with pool.RoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.2
+    ) as p:
+        sleep(0.5)
+        # The test database is not a replica: no lag.
+        assert p.get_lags() == {"replica0": 0.0, "replica1": 0.0}
+        with p.connection(readonly=True) as conn:
+            assert conn._pool in replicas
+
+        # The check can't block on a hung replica.
+        for r in p._replicas:
+            assert r.conn
+            cur = r.conn.execute("show statement_timeout")
+            assert cur.fetchone() == ("200ms",)
+
+    assert all((r.conn is None for r in p._replicas))
+
+
+def test_check_lag_pool_busy(dsn):
+    primary, replicas = make_pools(dsn, 1, min_size=1, max_size=1)
+    with pool.RoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.2
+    ) as p:
+        with replicas[0].connection():
+            sleep(0.5)
+            # The check doesn't wait for a connection from the pool.
+            assert p.get_lags() == {"replica0": 0.0}
+
+        assert replicas[0].get_stats()["requests_num"] == 1
+
+
+def test_check_lag_error(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    replicas.append(
+        pool.ConnectionPool(
+            "dbname=nosuchdb", name="bad", min_size=0, max_size=1, open=False
+        )
+    )
+    with pool.RoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.5
+    ) as p:
+        sleep(1.0)
+        assert p.get_lags()["bad"] == float("inf")
+        for i in range(3):
+            with p.connection(readonly=True) as conn:
+                assert conn._pool is replicas[0]
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import pytest
+
+from ..acompat import asleep
+
+try:
+    import psycopg_pool as pool
+except ImportError:
+    # Tests should have been skipped if the package is not available
+    pass
+
+if True:  # ASYNC
+    pytestmark = [pytest.mark.anyio]
+
+
+def make_pools(dsn, nreplicas, **kwargs):
+    primary = pool.AsyncConnectionPool(dsn, name="primary", open=False, **kwargs)
+    replicas = [
+        pool.AsyncConnectionPool(dsn, name=f"replica{i}", open=False, **kwargs)
+        for i in range(nreplicas)
+    ]
+    return primary, replicas
+
+
+async def test_bad_params():
+    primary, replicas = make_pools("", 2)
+    with pytest.raises(ValueError):
+        pool.AsyncRoutingConnectionPool(primary, [replicas[0], replicas[0]])
+    with pytest.raises(ValueError):
+        pool.AsyncRoutingConnectionPool(primary, [primary])
+    with pytest.raises(ValueError):
+        pool.AsyncRoutingConnectionPool(primary, replicas, max_lag=-1)
+    with pytest.raises(ValueError):
+        pool.AsyncRoutingConnectionPool(primary, replicas, lag_check_interval=0)
+
+
+async def test_choose_least_outstanding():
+    primary, replicas = make_pools("", 3)
+    p = pool.AsyncRoutingConnectionPool(primary, replicas)
+    chosen = []
+    for i in range(3):
+        assert (r := p._choose_replica())
+        chosen.append(r)
+    assert {r.pool for r in chosen} == set(replicas)
+
+    p._release_replica(chosen[1])
+    assert (r := p._choose_replica()) is chosen[1]
+    assert r.outstanding == 1
+    assert [r.outstanding for r in p._replicas] == [1, 1, 1]
+
+
+async def test_choose_no_replica():
+    primary, replicas = make_pools("", 0)
+    p = pool.AsyncRoutingConnectionPool(primary, replicas)
+    assert p._choose_replica() is None
+
+
+async def test_choose_exclude_lagging():
+    primary, replicas = make_pools("", 2)
+    p = pool.AsyncRoutingConnectionPool(primary, replicas, max_lag=1.0)
+    p._replicas[0].lag = 10.0
+    p._replicas[1].lag = 0.5
+    for i in range(3):
+        r = p._choose_replica()
+        assert r and r.pool is replicas[1]
+
+    p._replicas[1].lag = float("inf")
+    assert p._choose_replica() is None
+
+
+async def test_connection(dsn):
+    primary, replicas = make_pools(dsn, 2)
+    async with pool.AsyncRoutingConnectionPool(primary, replicas) as p:
+        async with p.connection() as conn:
+            assert conn._pool is primary
+        async with p.connection(readonly=True) as conn1:
+            assert conn1._pool in replicas
+            async with p.connection(readonly=True) as conn2:
+                assert conn2._pool in replicas
+                assert conn2._pool is not conn1._pool
+
+        assert [r.outstanding for r in p._replicas] == [0, 0]
+        stats = p.get_stats()
+        assert stats["primary"]["requests_num"] == 1
+        assert stats["replica0"]["requests_num"] == 1
+        assert stats["replica1"]["requests_num"] == 1
+
+    assert p.closed
+    assert all(r.closed for r in replicas)
+
+
+async def test_getconn_putconn(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    async with pool.AsyncRoutingConnectionPool(primary, replicas) as p:
+        conn = await p.getconn(readonly=True)
+        assert conn._pool is replicas[0]
+        assert p._replicas[0].outstanding == 1
+        await p.putconn(conn)
+        assert p._replicas[0].outstanding == 0
+
+        conn = await p.getconn()
+        assert conn._pool is primary
+        await p.putconn(conn)
+
+
+async def test_putconn_bad(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    async with pool.AsyncRoutingConnectionPool(primary, replicas) as p:
+        async with pool.AsyncConnectionPool(dsn) as other:
+            conn = await other.getconn()
+            with pytest.raises(ValueError):
+                await p.putconn(conn)
+            await other.putconn(conn)
+
+
+async def test_check_lag(dsn):
+    primary, replicas = make_pools(dsn, 2)
+    async with pool.AsyncRoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.2
+    ) as p:
+        await asleep(0.5)
+        # The test database is not a replica: no lag.
+        assert p.get_lags() == {"replica0": 0.0, "replica1": 0.0}
+        async with p.connection(readonly=True) as conn:
+            assert conn._pool in replicas
+
+        # The check can't block on a hung replica.
+        for r in p._replicas:
+            assert r.conn
+            cur = await r.conn.execute("show statement_timeout")
+            assert await cur.fetchone() == ("200ms",)
+
+    assert all(r.conn is None for r in p._replicas)
+
+
+async def test_check_lag_pool_busy(dsn):
+    primary, replicas = make_pools(dsn, 1, min_size=1, max_size=1)
+    async with pool.AsyncRoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.2
+    ) as p:
+        async with replicas[0].connection():
+            await asleep(0.5)
+            # The check doesn't wait for a connection from the pool.
+            assert p.get_lags() == {"replica0": 0.0}
+
+        assert replicas[0].get_stats()["requests_num"] == 1
+
+
+async def test_check_lag_error(dsn):
+    primary, replicas = make_pools(dsn, 1)
+    replicas.append(
+        pool.AsyncConnectionPool(
+            "dbname=nosuchdb", name="bad", min_size=0, max_size=1, open=False
+        )
+    )
+    async with pool.AsyncRoutingConnectionPool(
+        primary, replicas, max_lag=1.0, lag_check_interval=0.5
+    ) as p:
+        await asleep(1.0)
+        assert p.get_lags()["bad"] == float("inf")
+        for i in range(3):
+            async with p.connection(readonly=True) as conn:
+                assert conn._pool is replicas[0]
@@ -14,6 +14,7 @@ import multiprocessing
 import pytest
 
 import psycopg
+from psycopg import generators, waiting
 from psycopg import errors as e
 from psycopg.conninfo import conninfo_to_dict, make_conninfo
 
@@ -37,6 +38,63 @@ def test_concurrent_execution(conn_cls, dsn):
     assert time.time() - t0 < 0.8, "something broken in concurrency"
 
 
+@pytest.mark.slow
+@pytest.mark.timing
+def test_reactor(conn_cls, dsn):
+    conns = [conn_cls.connect(dsn, autocommit=True) for i in range(3)]
+    try:
+        t0 = time.time()
+        with waiting.Reactor() as reactor:
+            for i, conn in enumerate(conns):
+                cur = conn.cursor()
+                reactor.execute(cur, "select pg_sleep(%s), %s", (0.2 * (3 - i), i))
+            assert len(reactor) == 3
+            got = [(cur.connection, cur.fetchone()[1]) for _, cur in reactor.run()]
+            assert len(reactor) == 0
+
+        assert time.time() - t0 < 0.8, "queries not executed concurrently"
+        assert got == [(conns[2], 2), (conns[1], 1), (conns[0], 0)]
+    finally:
+        for conn in conns:
+            conn.close()
+
+
+def test_reactor_error(conn_cls, dsn):
+    with conn_cls.connect(dsn) as conn1, conn_cls.connect(dsn) as conn2:
+        with waiting.Reactor() as reactor:
+            reactor.execute(conn1.cursor(), "select 1 / 0", key="bad")
+            reactor.execute(conn2.cursor(), "select 2", key="good")
+            keys = []
+            with pytest.raises(e.DivisionByZero):
+                for key, _ in reactor.run():
+                    keys.append(key)
+            keys.extend(key for key, _ in reactor.run())
+            assert keys == ["good"]
+
+        # The connection is usable again after the error
+        conn1.rollback()
+        assert conn1.execute("select 1").fetchone() == (1,)
+
+
+def test_reactor_same_conn(conn):
+    with waiting.Reactor() as reactor:
+        reactor.execute(conn.cursor(), "select 1", key=1)
+        with pytest.raises(psycopg.ProgrammingError):
+            reactor.execute(conn.cursor(), "select 2", key=2)
+        assert [(key, cur.fetchone()) for key, cur in reactor.run()] == [(1, (1,))]
+
+    assert conn.execute("select 3").fetchone() == (3,)
+
+
+def test_reactor_gen(pgconn):
+    with waiting.Reactor() as reactor:
+        pgconn.send_query(b"select 1")
+        reactor.add(generators.execute(pgconn), pgconn.socket)
+        ((key, (res,)),) = list(reactor.run())
+        assert key == pgconn.socket
+        assert res.get_value(0, 0) == b"1"
+
+
 @pytest.mark.slow
 def test_commit_concurrency(conn):
     # Check the condition reported in psycopg2#103
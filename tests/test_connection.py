@@ -602,6 +602,79 @@ def test_notice_handlers(conn, caplog):
         conn.remove_notice_handler(cb1)
 
 
+def test_query_observers(conn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg")
+    infos: list[psycopg.QueryInfo] = []
+
+    def cb(info):
+        raise Exception("hello from cb")
+
+    conn.add_query_observer(infos.append)
+    conn.add_query_observer(cb)
+
+    cur = conn.cursor()
+    cur.execute("select generate_series(1, 3)")
+    (info,) = infos
+    assert info.query == b"select generate_series(1, 3)"
+    assert info.nparams == 0
+    assert not info.prepared
+    assert info.start <= info.sent <= info.end
+    assert info.rows == 3
+    assert info.bytes_sent == len(info.query)
+    assert info.error is None
+
+    assert len(caplog.records) == 1
+    assert "hello from cb" in caplog.records[0].message
+
+    with pytest.raises(e.DivisionByZero):
+        cur.execute("select 1 / 0")
+    assert isinstance(infos[-1].error, e.DivisionByZero)
+
+    conn.remove_query_observer(infos.append)
+    conn.remove_query_observer(cb)
+    cur.execute("select 1")
+    assert len(infos) == 2
+
+    with pytest.raises(ValueError):
+        conn.remove_query_observer(cb)
+
+
+def test_query_observers_prepared(conn):
+    infos: list[psycopg.QueryInfo] = []
+    conn.add_query_observer(infos.append)
+    conn.execute("select 1", prepare=True)
+    conn.execute("select 1", prepare=False)
+    assert [info.prepared for info in infos] == [True, False]
+
+
+@pytest.mark.pipeline
+def test_query_observers_pipeline(conn):
+    infos: list[psycopg.QueryInfo] = []
+    conn.add_query_observer(infos.append)
+    with conn.pipeline():
+        conn.execute("select 1")
+        conn.execute("select generate_series(1, 2)")
+    assert [(info.query, info.rows) for info in infos] == [
+        (b"select 1", 1),
+        (b"select generate_series(1, 2)", 2),
+    ]
+
+
+def test_query_observers_stream_copy(conn):
+    infos: list[psycopg.QueryInfo] = []
+    conn.add_query_observer(infos.append)
+    cur = conn.cursor()
+    assert len(list(cur.stream("select generate_series(1, 3)"))) == 3
+    with cur.copy("copy (select generate_series(1, 4)) to stdout") as copy:
+        for data in copy:
+            pass
+
+    assert [(info.query, info.rows) for info in infos] == [
+        (b"select generate_series(1, 3)", 3),
+        (b"copy (select generate_series(1, 4)) to stdout", 4),
+    ]
+
+
 def test_execute(conn):
     cur = conn.execute("select %s, %s", [10, 20])
     assert cur.fetchone() == (10, 20)
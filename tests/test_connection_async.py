@@ -16,7 +16,7 @@ from psycopg.rows import tuple_row
 from psycopg.conninfo import conninfo_to_dict, make_conninfo, timeout_from_conninfo
 from psycopg._conninfo_utils import get_param
 
-from .acompat import asleep, skip_async, skip_sync
+from .acompat import alist, asleep, skip_async, skip_sync
 from .test_adapt import make_bin_dumper, make_dumper
 from ._test_cursor import my_row_factory
 from ._test_connection import testctx  # noqa: F401  # fixture
@@ -607,6 +607,79 @@ async def test_notice_handlers(aconn, caplog):
         aconn.remove_notice_handler(cb1)
 
 
+async def test_query_observers(aconn, caplog):
+    caplog.set_level(logging.WARNING, logger="psycopg")
+    infos: list[psycopg.QueryInfo] = []
+
+    def cb(info):
+        raise Exception("hello from cb")
+
+    aconn.add_query_observer(infos.append)
+    aconn.add_query_observer(cb)
+
+    cur = aconn.cursor()
+    await cur.execute("select generate_series(1, 3)")
+    (info,) = infos
+    assert info.query == b"select generate_series(1, 3)"
+    assert info.nparams == 0
+    assert not info.prepared
+    assert info.start <= info.sent <= info.end
+    assert info.rows == 3
+    assert info.bytes_sent == len(info.query)
+    assert info.error is None
+
+    assert len(caplog.records) == 1
+    assert "hello from cb" in caplog.records[0].message
+
+    with pytest.raises(e.DivisionByZero):
+        await cur.execute("select 1 / 0")
+    assert isinstance(infos[-1].error, e.DivisionByZero)
+
+    aconn.remove_query_observer(infos.append)
+    aconn.remove_query_observer(cb)
+    await cur.execute("select 1")
+    assert len(infos) == 2
+
+    with pytest.raises(ValueError):
+        aconn.remove_query_observer(cb)
+
+
+async def test_query_observers_prepared(aconn):
+    infos: list[psycopg.QueryInfo] = []
+    aconn.add_query_observer(infos.append)
+    await aconn.execute("select 1", prepare=True)
+    await aconn.execute("select 1", prepare=False)
+    assert [info.prepared for info in infos] == [True, False]
+
+
+@pytest.mark.pipeline
+async def test_query_observers_pipeline(aconn):
+    infos: list[psycopg.QueryInfo] = []
+    aconn.add_query_observer(infos.append)
+    async with aconn.pipeline():
+        await aconn.execute("select 1")
+        await aconn.execute("select generate_series(1, 2)")
+    assert [(info.query, info.rows) for info in infos] == [
+        (b"select 1", 1),
+        (b"select generate_series(1, 2)", 2),
+    ]
+
+
+async def test_query_observers_stream_copy(aconn):
+    infos: list[psycopg.QueryInfo] = []
+    aconn.add_query_observer(infos.append)
+    cur = aconn.cursor()
+    assert len(await alist(cur.stream("select generate_series(1, 3)"))) == 3
+    async with cur.copy("copy (select generate_series(1, 4)) to stdout") as copy:
+        async for data in copy:
+            pass
+
+    assert [(info.query, info.rows) for info in infos] == [
+        (b"select generate_series(1, 3)", 3),
+        (b"copy (select generate_series(1, 4)) to stdout", 4),
+    ]
+
+
 async def test_execute(aconn):
     cur = await aconn.execute("select %s, %s", [10, 20])
     assert await cur.fetchone() == (10, 20)
@@ -271,3 +271,38 @@ def test_set_encoding_unsupported(conn):
 
 def test_vendor(conn):
     assert conn.info.vendor
+
+
+def test_traffic(conn):
+    # In a transaction, the BEGIN result would be counted too.
+    conn.autocommit = True
+    info = conn.info
+    waits = info.waits
+    results = info.results_received
+    rows = info.rows_received
+
+    conn.execute("select generate_series(1, 10)")
+    assert info.waits > waits
+    assert info.wait_time > 0
+    assert info.results_received == results + 1
+    assert info.rows_received == rows + 10
+
+    with conn.pipeline():
+        for i in range(3):
+            conn.execute("select %s", [i])
+    assert info.results_received == results + 5  # 3 results + sync
+    assert info.rows_received == rows + 13
+
+
+def test_traffic_bytes(conn):
+    if conn.info.bytes_sent is None:
+        pytest.skip("bytes counters not available")
+
+    sent = conn.info.bytes_sent
+    received = conn.info.bytes_received
+    conn.execute("select repeat('x', 10000)")
+    assert conn.info.bytes_sent > sent
+    assert conn.info.bytes_received > received + 10000
+
+    conn.close()
+    assert conn.info.bytes_sent is None
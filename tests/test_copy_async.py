@@ -1,5 +1,6 @@
 import string
 import hashlib
+import datetime as dt
 from io import BytesIO, StringIO
 from random import choice, randrange
 from itertools import cycle
@@ -10,7 +11,8 @@ import psycopg
 from psycopg import errors as e
 from psycopg import pq, sql
 from psycopg.abc import Buffer
-from psycopg.copy import AsyncCopy, AsyncLibpqWriter, AsyncQueuedLibpqWriter
+from psycopg.copy import AsyncCopy, AsyncLibpqWriter, AsyncParallelCopy
+from psycopg.copy import AsyncQueuedLibpqWriter
 from psycopg.adapt import Dumper, PyFormat
 from psycopg.types import TypeInfo
 from psycopg.types.hstore import register_hstore
@@ -119,6 +121,46 @@ async def test_rows(aconn, format):
     assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
 
 
+@pytest.mark.pyarrow
+@pytest.mark.parametrize("format", pq.Format)
+async def test_read_arrow_batches(aconn, format):
+    pa = pytest.importorskip("pyarrow")
+    query = """
+        select x, nullif(x, 3)::float8, x::text, '2042-01-01'::date + x
+        from generate_series(1, 5) x
+        """
+    cur = aconn.cursor()
+    async with cur.copy(f"copy ({query}) to stdout (format {format.name})") as copy:
+        copy.set_types(["int4", "float8", "text", "date"])
+        batches = await alist(copy.read_arrow_batches(2, names=["a", "b", "c", "d"]))
+
+    assert [b.num_rows for b in batches] == [2, 2, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.schema.types == [pa.int32(), pa.float64(), pa.string(), pa.date32()]
+    assert table.column_names == ["a", "b", "c", "d"]
+    assert table.to_pydict()["a"] == [1, 2, 3, 4, 5]
+    assert table.to_pydict()["b"] == [1.0, 2.0, None, 4.0, 5.0]
+    assert table.to_pydict()["c"] == ["1", "2", "3", "4", "5"]
+    assert table.to_pydict()["d"][0] == dt.date(2042, 1, 2)
+    assert aconn.info.transaction_status == pq.TransactionStatus.INTRANS
+
+
+@pytest.mark.pyarrow
+@pytest.mark.parametrize("format", pq.Format)
+async def test_read_arrow_batches_notypes(aconn, format):
+    pytest.importorskip("pyarrow")
+    cur = aconn.cursor()
+    async with cur.copy(
+        f"copy ({sample_values}) to stdout (format {format.name})"
+    ) as copy:
+        batches = await alist(copy.read_arrow_batches())
+
+    assert len(batches) == 1
+    assert batches[0].schema.names == ["column1", "column2", "column3"]
+    want = [[py_to_raw(v, format) for v in col] for col in zip(*sample_records)]
+    assert [c.to_pylist() for c in batches[0].columns] == want
+
+
 @pytest.mark.parametrize("format", pq.Format)
 async def test_set_types(aconn, format):
     sample = ({"foo": "bar"}, 123)
@@ -500,6 +542,250 @@ async def test_copy_in_records_binary(aconn, format):
     assert data == [(1, None, "hello"), (2, None, "world")]
 
 
+@pytest.mark.numpy
+@pytest.mark.parametrize("format", pq.Format)
+async def test_write_columns(aconn, format):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(
+        cur, "a int2, b int4, c int8, d float8, e bool, f date, g timestamp"
+    )
+    cols = [
+        np.array([1, -2, 3], dtype="i2"),
+        np.ma.masked_array(np.array([10, 20, 30], dtype="i4"), [False, True, False]),
+        np.array([2**40, 0, -1], dtype="i8"),
+        np.array([0.5, np.nan, -1.5]),
+        np.array([True, False, True]),
+        np.array(["2042-01-01", "NaT", "1970-01-01"], dtype="M8[D]"),
+        np.array(["2042-01-01T12:34:56.789", "1999-12-31T23:59:59", "NaT"], "M8[us]"),
+    ]
+    async with cur.copy(
+        f"copy copy_in (a, b, c, d, e, f, g) from stdin (format {format.name})"
+    ) as copy:
+        nulls = [None, None, None, [False, True, False], None, None, None]
+        await copy.write_columns(cols, nulls)
+
+    await cur.execute("select * from copy_in order by a")
+    data = await cur.fetchall()
+    assert data == [
+        (-2, None, 0, None, False, None, dt.datetime(1999, 12, 31, 23, 59, 59)),
+        (
+            1,
+            10,
+            2**40,
+            0.5,
+            True,
+            dt.date(2042, 1, 1),
+            dt.datetime(2042, 1, 1, 12, 34, 56, 789000),
+        ),  # noqa: E501
+        (3, 30, -1, -1.5, True, dt.date(1970, 1, 1), None),
+    ]
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("format", pq.Format)
+async def test_write_columns_set_types(aconn, format):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "a int2, b float4, c text")
+    cols = [np.arange(100), np.arange(100) / 4, np.array([str(i) for i in range(100)])]
+    async with cur.copy(
+        f"copy copy_in (a, b, c) from stdin (format {format.name})"
+    ) as copy:
+        copy.set_types(["int2", "float4", "text"])
+        await copy.write_columns(cols)
+
+    await cur.execute("select count(*), sum(a), sum(b), max(c::int) from copy_in")
+    assert await cur.fetchone() == (100, 4950, 1237.5, 99)
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("format", pq.Format)
+async def test_write_columns_big(aconn, format):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "a int4, b int8")
+    n = 100000
+    cols = [np.arange(n, dtype="i4"), np.arange(n, dtype="i8") * 3]
+    async with cur.copy(
+        f"copy copy_in (a, b) from stdin (format {format.name})"
+    ) as copy:
+        await copy.write_columns(cols, [np.arange(n) % 10 == 0, None])
+
+    await cur.execute("select count(*), count(a), sum(b) from copy_in")
+    assert await cur.fetchone() == (n, n - n // 10, 3 * n * (n - 1) // 2)
+
+
+@pytest.mark.pyarrow
+@pytest.mark.parametrize("format", pq.Format)
+async def test_write_columns_arrow(aconn, format):
+    pa = pytest.importorskip("pyarrow")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "a int8, b float8, c text")
+    cols = [
+        pa.array([1, None, 3]),
+        pa.array([None, 2.5, 3.5]),
+        pa.array(["x", "y", None]),
+    ]
+    async with cur.copy(
+        f"copy copy_in (a, b, c) from stdin (format {format.name})"
+    ) as copy:
+        copy.set_types(["int8", "float8", "text"])
+        await copy.write_columns(cols)
+
+    await cur.execute("select * from copy_in order by b nulls first")
+    data = await cur.fetchall()
+    assert data == [(1, None, "x"), (None, 2.5, "y"), (3, 3.5, None)]
+
+
+@pytest.mark.numpy
+async def test_write_columns_length_mismatch(aconn):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "a int4, b int4")
+    with pytest.raises(e.ProgrammingError):
+        async with cur.copy("copy copy_in (a, b) from stdin (format binary)") as copy:
+            await copy.write_columns([np.arange(3), np.arange(4)])
+
+    assert aconn.info.transaction_status == pq.TransactionStatus.INERROR
+
+
+@pytest.mark.numpy
+async def test_write_columns_out_of_range(aconn):
+    np = pytest.importorskip("numpy")
+    cur = aconn.cursor()
+    await ensure_table_async(cur, "a int2")
+    with pytest.raises(e.DataError):
+        async with cur.copy("copy copy_in (a) from stdin (format binary)") as copy:
+            copy.set_types(["int2"])
+            await copy.write_columns([np.array([1, 2**20])])
+
+
+@pytest.fixture
+async def pconns(aconn_cls, dsn):
+    conns = [await aconn_cls.connect(dsn) for _ in range(3)]
+    yield conns
+    for pconn in conns:
+        await pconn.close()
+
+
+async def ensure_parallel_table(aconn, tabledef="id int, data text"):
+    await ensure_table_async(
+        aconn.cursor(), f"{tabledef}, pid int default pg_backend_pid()"
+    )
+    await aconn.commit()
+
+
+@pytest.mark.parametrize("format", pq.Format)
+async def test_parallel_copy(aconn, pconns, format):
+    await ensure_parallel_table(aconn)
+    async with AsyncParallelCopy(
+        pconns,
+        f"copy copy_in (id, data) from stdin (format {format.name})",
+        chunk_size=100,
+    ) as copy:
+        copy.set_types(["int4", "text"])
+        for i in range(5000):
+            await copy.write_row((i, str(i)))
+
+    assert copy.rowcount == 5000
+    for pconn in pconns:
+        assert pconn.info.transaction_status == pq.TransactionStatus.IDLE
+
+    query = "select count(*), count(distinct pid), sum(id) from copy_in"
+    cur = await aconn.execute(f"{query} where data = id::text")
+    assert await cur.fetchone() == (5000, 3, 5000 * 4999 // 2)
+
+
+async def test_parallel_copy_workers(aconn, pconns):
+    await ensure_parallel_table(aconn)
+    async with AsyncParallelCopy(
+        pconns, "copy copy_in (id, data) from stdin", workers=2, chunk_size=10
+    ) as copy:
+        for i in range(100):
+            await copy.write_row((i, None))
+
+    cur = await aconn.execute("select count(*), count(distinct pid) from copy_in")
+    assert await cur.fetchone() == (100, 2)
+
+    with pytest.raises(e.ProgrammingError):
+        AsyncParallelCopy(pconns, "copy copy_in from stdin", workers=4)
+    with pytest.raises(e.ProgrammingError):
+        AsyncParallelCopy(pconns, "copy copy_in from stdin", chunk_size=0)
+
+
+async def test_parallel_copy_blocks(aconn, pconns):
+    await ensure_parallel_table(aconn)
+    async with AsyncParallelCopy(pconns, "copy copy_in (id, data) from stdin") as copy:
+        for i in range(0, 30, 3):
+            await copy.write("".join(f"{j}\t{j}\n" for j in range(i, i + 3)))
+
+    cur = await aconn.execute("select count(*), count(distinct pid) from copy_in")
+    assert await cur.fetchone() == (30, 3)
+
+    with pytest.raises(e.NotSupportedError):
+        async with AsyncParallelCopy(
+            pconns, "copy copy_in (id, data) from stdin (format binary)"
+        ) as copy:
+            await copy.write(sample_binary_rows[0])
+
+
+async def test_parallel_copy_server_error(aconn, pconns):
+    await ensure_parallel_table(aconn, "id int check (id < 900), data text")
+    with pytest.raises(e.CheckViolation):
+        async with AsyncParallelCopy(
+            pconns, "copy copy_in (id, data) from stdin", chunk_size=100
+        ) as copy:
+            for i in range(1000):
+                await copy.write_row((i, "x"))
+
+    for pconn in pconns:
+        assert pconn.info.transaction_status == pq.TransactionStatus.IDLE
+    cur = await aconn.execute("select count(*) from copy_in")
+    assert await cur.fetchone() == (0,)
+
+
+async def test_parallel_copy_python_error(aconn, pconns):
+    await ensure_parallel_table(aconn)
+    with pytest.raises(ZeroDivisionError):
+        async with AsyncParallelCopy(
+            pconns, "copy copy_in (id, data) from stdin", chunk_size=10
+        ) as copy:
+            for i in range(100):
+                await copy.write_row((i, "x"))
+            1 / 0
+
+    assert copy.rowcount == -1
+    for pconn in pconns:
+        assert pconn.info.transaction_status == pq.TransactionStatus.IDLE
+    cur = await aconn.execute("select count(*) from copy_in")
+    assert await cur.fetchone() == (0,)
+
+
+@pytest.mark.crdb_skip("2-phase commit")
+@pytest.mark.parametrize("fail", [False, True])
+async def test_parallel_copy_two_phase(aconn, pconns, tpc, fail):
+    await ensure_parallel_table(aconn, "id int check (id < 900), data text")
+    nrecs = 1000 if fail else 500
+    try:
+        async with AsyncParallelCopy(
+            pconns, "copy copy_in (id, data) from stdin", two_phase=True
+        ) as copy:
+            for i in range(nrecs):
+                await copy.write_row((i, "x"))
+    except e.CheckViolation:
+        assert fail
+    else:
+        assert not fail
+        assert copy.rowcount == nrecs
+
+    assert len(copy.xids) == 3
+    assert len({xid.gtrid for xid in copy.xids}) == 1
+    assert tpc.count_xacts() == 0
+    cur = await aconn.execute("select count(*) from copy_in")
+    assert await cur.fetchone() == (0 if fail else nrecs,)
+
+
 class StrictIntDumper(Dumper):
     oid = psycopg.adapters.types["int4"].oid
 
@@ -7,6 +7,7 @@ Tests common to psycopg.Cursor and its subclasses.
 
 import weakref
 import datetime as dt
+from decimal import Decimal
 from typing import Any
 from contextlib import closing
 
@@ -508,6 +509,81 @@ def test_executemany_null_first(conn, fmt_in):
         )
 
 
+@pytest.mark.parametrize("batch", ["values", "unnest"])
+def test_executemany_batch(conn, execmany, batch):
+    cur = conn.cursor()
+    query = ph(cur, "insert into execmany(num, data) values (%s::int, %s::text)")
+    records = [(i, f"rec{i}") for i in range(25)]
+    if isinstance(cur, psycopg.RawCursor):
+        with pytest.raises(psycopg.NotSupportedError):
+            cur.executemany(query, records, batch=batch, batch_size=10)
+        return
+
+    cur.executemany(query, records, batch=batch, batch_size=10)
+    assert cur.rowcount == 25
+    cur.execute("select num, data from execmany order by 1")
+    assert cur.fetchall() == records
+
+
+@pytest.mark.parametrize("batch", ["values", "unnest"])
+def test_executemany_batch_name(conn, execmany, batch):
+    cur = conn.cursor()
+    cur.executemany(
+        ph(
+            cur, "insert into execmany(num, data) values (%(num)s::int, %(data)s::text)"
+        ),
+        [{"num": 11, "data": "hello"}, {"num": 21, "data": "world"}],
+        batch=batch,
+    )
+    cur.execute("select num, data from execmany order by 1")
+    assert cur.fetchall() == [(11, "hello"), (21, "world")]
+
+
+@pytest.mark.parametrize("batch", ["values", "unnest"])
+def test_executemany_batch_returning(conn, execmany, batch):
+    cur = conn.cursor()
+    if isinstance(cur, psycopg.RawCursor):
+        pytest.skip("batch mode not supported by raw cursors")
+    cur.executemany(
+        "insert into execmany(num, data) values (%s::int, %s::text) returning num",
+        [(10, "a"), (20, "b"), (30, "c")],
+        returning=True,
+        batch=batch,
+        batch_size=2,
+    )
+    assert cur.rowcount == 2
+    assert cur.fetchall() == [(10,), (20,)]
+    assert cur.nextset()
+    assert cur.rowcount == 1
+    assert cur.fetchall() == [(30,)]
+    assert cur.nextset() is None
+
+
+@pytest.mark.parametrize(
+    "query, batch, exc",
+    [
+        ("insert into execmany(num) values (%s)", "nope", ValueError),
+        ("select %s", "values", psycopg.ProgrammingError),
+        (
+            "insert into execmany(num) values (%s), (%s)",
+            "values",
+            psycopg.ProgrammingError,
+        ),
+        (
+            "insert into execmany(num) values (%s + 1)",
+            "unnest",
+            psycopg.ProgrammingError,
+        ),
+    ],
+)
+def test_executemany_batch_bad(conn, query, batch, exc):
+    cur = conn.cursor()
+    if isinstance(cur, psycopg.RawCursor):
+        pytest.skip("batch mode not supported by raw cursors")
+    with pytest.raises(exc):
+        cur.executemany(query, [(1,), (2,)], batch=batch)
+
+
 @pytest.mark.slow
 def test_executemany_lock(conn):
 
@@ -593,6 +669,71 @@ select x from generate_series(4, 6) x;
     assert cur.rownumber == 1
 
 
+def test_fetch_columns(conn):
+    cur = conn.cursor()
+    cur.execute("select x, x::text, null from generate_series(1, 5) as x")
+    assert cur.fetch_columns(2) == [[1, 2], ["1", "2"], [None, None]]
+    assert cur.fetchone() == (3, "3", None)
+    assert cur.fetch_columns() == [[4, 5], ["4", "5"], [None, None]]
+    assert cur.fetch_columns() == [[], [], []]
+    assert cur.rownumber == 5
+
+
+@pytest.mark.numpy
+def test_fetch_numpy(conn):
+    np = pytest.importorskip("numpy")
+    cur = conn.cursor()
+    cur.execute(
+        "select x, x::float8, nullif(x, 2), x::text from generate_series(1, 3) as x"
+    )
+    ints, floats, nulls, texts = cur.fetch_numpy()
+    assert ints.dtype == np.int32
+    assert ints.tolist() == [1, 2, 3]
+    assert floats.dtype == np.float64
+    assert floats.tolist() == [1.0, 2.0, 3.0]
+    assert nulls.tolist() == [1, None, 3]
+    assert nulls.mask.tolist() == [False, True, False]
+    assert texts.dtype == object
+    assert texts.tolist() == ["1", "2", "3"]
+    assert [a.tolist() for a in cur.fetch_numpy()] == [[], [], [], []]
+
+
+@pytest.mark.pyarrow
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_arrow(conn, binary):
+    pa = pytest.importorskip("pyarrow")
+    if binary and conn.cursor_factory is psycopg.ClientCursor:
+        pytest.skip("binary results not supported by client-side cursors")
+    cur = conn.cursor(binary=binary)
+    cur.execute("""
+        select x as id, nullif(x, 2)::int8 as n, 'x' || x as s,
+            '2042-01-01 12:00'::timestamptz + x * '1 day'::interval as ts,
+            array[x, -x] as a, x::numeric / 2 as num
+        from generate_series(1, 3) as x
+        """)
+    batch = cur.fetch_arrow(2)
+    assert batch.schema.names == ["id", "n", "s", "ts", "a", "num"]
+    assert batch.schema.types[:5] == [
+        pa.int32(),
+        pa.int64(),
+        pa.string(),
+        pa.timestamp("us", tz="UTC"),
+        pa.list_(pa.int32()),
+    ]
+    assert batch.num_rows == 2
+    assert batch.column(1).to_pylist() == [1, None]
+    assert batch.column(2).to_pylist() == ["x1", "x2"]
+    assert batch.column(3).to_pylist()[0] == dt.datetime(
+        2042, 1, 2, 12, tzinfo=dt.timezone.utc
+    )
+    assert batch.column(4).to_pylist() == [[1, -1], [2, -2]]
+    assert batch.column(5).to_pylist() == [Decimal("0.5"), Decimal("1")]
+
+    batch = cur.fetch_arrow()
+    assert batch.column(0).to_pylist() == [3]
+    assert cur.fetch_arrow().num_rows == 0
+
+
 def test_iter(conn):
     cur = conn.cursor()
     cur.execute("select generate_series(1, 3)")
@@ -791,6 +932,41 @@ def test_stream_chunked_row_factory(conn):
         assert [c.name for c in cur.description] == ["a"]
 
 
+def test_stream_batches(conn):
+    cur = conn.cursor()
+    batches = list(
+        cur.stream_batches(
+            ph(cur, "select i, 'x' || i from generate_series(1, %s) as i"), [3]
+        )
+    )
+    assert batches == [[(1, "x1")], [(2, "x2")], [(3, "x3")]]
+
+
+def test_stream_batches_no_row(conn):
+    cur = conn.cursor()
+    batches = list(cur.stream_batches("select generate_series(2,1) as a"))
+    assert batches == []
+
+
+@pytest.mark.libpq(">= 17")
+def test_stream_batches_chunked(conn):
+    cur = conn.cursor(row_factory=rows.scalar_row)
+    batches = list(cur.stream_batches("select generate_series(1, 5)", size=2))
+    assert batches == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.libpq(">= 17")
+def test_stream_batches_interrupted(conn):
+    conn.set_autocommit(True)
+    cur = conn.cursor()
+    it = cur.stream_batches("select generate_series(1, 10000)", size=100)
+    assert len(next(it)) == 100
+    it.close()
+    assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+    cur.execute("select 1")
+    assert cur.fetchone() == (1,)
+
+
 @pytest.mark.crdb_skip("no col query")
 def test_stream_no_col(conn):
     cur = conn.cursor()
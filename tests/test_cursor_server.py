@@ -418,6 +418,48 @@ def test_rownumber(conn):
     cur.close()
 
 
+def test_fetch_columns(conn):
+    with conn.cursor("foo") as cur:
+        cur.execute(ph(cur, "select x, -x from generate_series(1, %s) x"), (5,))
+        assert cur.fetch_columns(3) == [[1, 2, 3], [-1, -2, -3]]
+        assert cur.rownumber == 3
+        assert cur.fetch_columns() == [[4, 5], [-4, -5]]
+        assert cur.fetch_columns() == [[], []]
+        assert cur.rownumber == 5
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("binary", [False, True])
+def test_fetch_numpy(conn, binary):
+    np = pytest.importorskip("numpy")
+    with conn.cursor("foo", binary=binary) as cur:
+        cur.execute(
+            ph(cur, "select x::int8, nullif(x, 2) from generate_series(1, %s) x"), (3,)
+        )
+        ints, nulls = cur.fetch_numpy(2)
+        assert ints.dtype == np.int64
+        assert ints.tolist() == [1, 2]
+        assert nulls.tolist() == [1, None]
+        assert cur.rownumber == 2
+        ints, nulls = cur.fetch_numpy()
+        assert ints.tolist() == [3]
+        assert nulls.mask is np.ma.nomask
+
+
+@pytest.mark.pyarrow
+def test_fetch_arrow(conn):
+    pytest.importorskip("pyarrow")
+    with conn.cursor("foo") as cur:
+        cur.execute(
+            ph(cur, "select x as a, x::text as b from generate_series(1, %s) x"), (3,)
+        )
+        batch = cur.fetch_arrow(2)
+        assert batch.to_pydict() == {"a": [1, 2], "b": ["1", "2"]}
+        assert cur.rownumber == 2
+        batch = cur.fetch_arrow()
+        assert batch.to_pydict() == {"a": [3], "b": ["3"]}
+
+
 def test_iter(conn):
     with conn.cursor("foo") as cur:
         cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (3,))
@@ -453,6 +495,162 @@ def test_itersize(conn, commands):
             assert "fetch forward 2" in cmd.lower()
 
 
+def test_fetch_statement(conn):
+    cur = conn.cursor("foo")
+    stmt = cur._make_fetch_statement(10)
+    assert stmt == b'FETCH FORWARD 10 FROM "foo"'
+    assert cur._make_fetch_statement(10) is stmt
+    assert cur._make_fetch_statement(None) == b'FETCH FORWARD ALL FROM "foo"'
+    cur.close()
+
+
+def test_itersize_bytes(conn, commands):
+    with conn.cursor("foo") as cur:
+        assert cur.itersize_bytes is None
+        cur.itersize = 2
+        cur.itersize_bytes = 100
+        cur.execute("select repeat('x', 10) as x from generate_series(1, 50)")
+        commands.popall()  # flush begin and other noise
+
+        assert list(cur) == [("x" * 10,)] * 50
+        assert cur.itersize == 10
+        cmds = [cmd.lower() for cmd in commands.popall()]
+        assert len(cmds) == 6
+        assert "fetch forward 2" in cmds[0]
+        for cmd in cmds[1:]:
+            assert "fetch forward 10" in cmd
+
+
+def test_prefetch(conn, commands):
+    with conn.cursor("foo") as cur:
+        assert cur.prefetch == 0
+        cur.itersize = 2
+        cur.prefetch = 2
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (11,))
+        commands.popall()  # flush begin and other noise
+
+        assert list(cur) == [(i,) for i in range(1, 12)]
+        cmds = commands.popall()
+        assert len(cmds) == 1
+        assert "fetch forward 2" in cmds[0].lower()
+
+
+def test_prefetch_other_query(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 1
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+        got = []
+        for rec in cur:
+            got.append(rec[0])
+            cur2 = conn.execute("select %s::int", [rec[0] * 10])
+            assert cur2.fetchone() == (rec[0] * 10,)
+
+        assert got == [1, 2, 3, 4, 5]
+
+
+def test_prefetch_close(conn):
+    cur = conn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+    assert next(cur) == (1,)
+    cur.close()
+
+    cur2 = conn.execute("select 1")
+    assert cur2.fetchone() == (1,)
+
+
+def test_prefetch_fetchall(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        got = [next(cur) for i in range(3)]
+        got.extend(cur.fetchall())
+        assert cur.rownumber == 7
+        got.extend(list(cur))
+        assert sorted(got) == [(i,) for i in range(1, 11)]
+        assert cur.rownumber == 10
+
+
+def test_prefetch_fetchmany(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        assert next(cur) == (1,)
+        assert next(cur) == (2,)
+        assert cur.fetchone() == (3,)
+        assert cur.fetchmany(4) == [(4,), (5,), (6,), (7,)]
+        assert cur.rownumber == 7
+        assert list(cur) == [(8,), (9,), (10,)]
+
+
+def test_prefetch_fetch_columns(conn):
+    with conn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 1
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+        assert next(cur) == (1,)
+        assert next(cur) == (2,)
+        assert cur.fetch_columns() == [[3, 4, 5]]
+        assert cur.rownumber == 5
+
+
+def test_prefetch_scroll(conn):
+    with conn.cursor("foo", scrollable=True) as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        assert next(cur) == (1,)
+        assert next(cur) == (2,)
+        cur.scroll(1)
+        assert cur.fetchone() == (4,)
+        cur.scroll(3)
+        assert cur.fetchone() == (8,)
+        cur.scroll(-2)
+        assert cur.fetchone() == (7,)
+        assert cur.rownumber == 7
+
+
+def test_prefetch_error(conn):
+    cur = conn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    cur.execute("select 10 / (3 - i) from generate_series(1, 5) i")
+    assert next(cur) == (5,)
+    # The error of the FETCH sent ahead is raised before committing.
+    with pytest.raises(e.DivisionByZero):
+        conn.commit()
+    assert conn.info.transaction_status == pq.TransactionStatus.INERROR
+    conn.rollback()
+
+
+def test_prefetch_error_transaction(conn):
+    with pytest.raises(e.DivisionByZero):
+        with conn.transaction():
+            cur = conn.cursor("foo")
+            cur.itersize = 2
+            cur.prefetch = 1
+            cur.execute("select 10 / (3 - i) from generate_series(1, 5) i")
+            assert next(cur) == (5,)
+
+    assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_prefetch_status(conn):
+    cur = conn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+    assert next(cur) == (1,)
+    with pytest.raises(e.ProgrammingError, match="INTRANS"):
+        conn.set_autocommit(True)
+    conn.rollback()
+    conn.set_autocommit(True)
+
+
 def test_next(conn):
     with conn.cursor() as cur:
         cur.execute("select 1")
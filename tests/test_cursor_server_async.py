@@ -424,6 +424,50 @@ async def test_rownumber(aconn):
     await cur.close()
 
 
+async def test_fetch_columns(aconn):
+    async with aconn.cursor("foo") as cur:
+        await cur.execute(ph(cur, "select x, -x from generate_series(1, %s) x"), (5,))
+        assert await cur.fetch_columns(3) == [[1, 2, 3], [-1, -2, -3]]
+        assert cur.rownumber == 3
+        assert await cur.fetch_columns() == [[4, 5], [-4, -5]]
+        assert await cur.fetch_columns() == [[], []]
+        assert cur.rownumber == 5
+
+
+@pytest.mark.numpy
+@pytest.mark.parametrize("binary", [False, True])
+async def test_fetch_numpy(aconn, binary):
+    np = pytest.importorskip("numpy")
+    async with aconn.cursor("foo", binary=binary) as cur:
+        await cur.execute(
+            ph(cur, "select x::int8, nullif(x, 2) from generate_series(1, %s) x"),
+            (3,),
+        )
+        ints, nulls = await cur.fetch_numpy(2)
+        assert ints.dtype == np.int64
+        assert ints.tolist() == [1, 2]
+        assert nulls.tolist() == [1, None]
+        assert cur.rownumber == 2
+        ints, nulls = await cur.fetch_numpy()
+        assert ints.tolist() == [3]
+        assert nulls.mask is np.ma.nomask
+
+
+@pytest.mark.pyarrow
+async def test_fetch_arrow(aconn):
+    pytest.importorskip("pyarrow")
+    async with aconn.cursor("foo") as cur:
+        await cur.execute(
+            ph(cur, "select x as a, x::text as b from generate_series(1, %s) x"),
+            (3,),
+        )
+        batch = await cur.fetch_arrow(2)
+        assert batch.to_pydict() == {"a": [1, 2], "b": ["1", "2"]}
+        assert cur.rownumber == 2
+        batch = await cur.fetch_arrow()
+        assert batch.to_pydict() == {"a": [3], "b": ["3"]}
+
+
 async def test_iter(aconn):
     async with aconn.cursor("foo") as cur:
         await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (3,))
@@ -459,6 +503,162 @@ async def test_itersize(aconn, acommands):
             assert "fetch forward 2" in cmd.lower()
 
 
+async def test_fetch_statement(aconn):
+    cur = aconn.cursor("foo")
+    stmt = cur._make_fetch_statement(10)
+    assert stmt == b'FETCH FORWARD 10 FROM "foo"'
+    assert cur._make_fetch_statement(10) is stmt
+    assert cur._make_fetch_statement(None) == b'FETCH FORWARD ALL FROM "foo"'
+    await cur.close()
+
+
+async def test_itersize_bytes(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        assert cur.itersize_bytes is None
+        cur.itersize = 2
+        cur.itersize_bytes = 100
+        await cur.execute("select repeat('x', 10) as x from generate_series(1, 50)")
+        acommands.popall()  # flush begin and other noise
+
+        assert await alist(cur) == [("x" * 10,)] * 50
+        assert cur.itersize == 10
+        cmds = [cmd.lower() for cmd in acommands.popall()]
+        assert len(cmds) == 6
+        assert "fetch forward 2" in cmds[0]
+        for cmd in cmds[1:]:
+            assert "fetch forward 10" in cmd
+
+
+async def test_prefetch(aconn, acommands):
+    async with aconn.cursor("foo") as cur:
+        assert cur.prefetch == 0
+        cur.itersize = 2
+        cur.prefetch = 2
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (11,))
+        acommands.popall()  # flush begin and other noise
+
+        assert await alist(cur) == [(i,) for i in range(1, 12)]
+        cmds = acommands.popall()
+        assert len(cmds) == 1
+        assert "fetch forward 2" in cmds[0].lower()
+
+
+async def test_prefetch_other_query(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 1
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+        got = []
+        async for rec in cur:
+            got.append(rec[0])
+            cur2 = await aconn.execute("select %s::int", [rec[0] * 10])
+            assert await cur2.fetchone() == (rec[0] * 10,)
+
+        assert got == [1, 2, 3, 4, 5]
+
+
+async def test_prefetch_close(aconn):
+    cur = aconn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+    assert await anext(cur) == (1,)
+    await cur.close()
+
+    cur2 = await aconn.execute("select 1")
+    assert await cur2.fetchone() == (1,)
+
+
+async def test_prefetch_fetchall(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        got = [await anext(cur) for i in range(3)]
+        got.extend(await cur.fetchall())
+        assert cur.rownumber == 7
+        got.extend(await alist(cur))
+        assert sorted(got) == [(i,) for i in range(1, 11)]
+        assert cur.rownumber == 10
+
+
+async def test_prefetch_fetchmany(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        assert await anext(cur) == (1,)
+        assert await anext(cur) == (2,)
+        assert await cur.fetchone() == (3,)
+        assert await cur.fetchmany(4) == [(4,), (5,), (6,), (7,)]
+        assert cur.rownumber == 7
+        assert await alist(cur) == [(8,), (9,), (10,)]
+
+
+async def test_prefetch_fetch_columns(aconn):
+    async with aconn.cursor("foo") as cur:
+        cur.itersize = 2
+        cur.prefetch = 1
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+        assert await anext(cur) == (1,)
+        assert await anext(cur) == (2,)
+        assert await cur.fetch_columns() == [[3, 4, 5]]
+        assert cur.rownumber == 5
+
+
+async def test_prefetch_scroll(aconn):
+    async with aconn.cursor("foo", scrollable=True) as cur:
+        cur.itersize = 2
+        cur.prefetch = 2
+        await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (10,))
+        assert await anext(cur) == (1,)
+        assert await anext(cur) == (2,)
+        await cur.scroll(1)
+        assert await cur.fetchone() == (4,)
+        await cur.scroll(3)
+        assert await cur.fetchone() == (8,)
+        await cur.scroll(-2)
+        assert await cur.fetchone() == (7,)
+        assert cur.rownumber == 7
+
+
+async def test_prefetch_error(aconn):
+    cur = aconn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    await cur.execute("select 10 / (3 - i) from generate_series(1, 5) i")
+    assert await anext(cur) == (5,)
+    # The error of the FETCH sent ahead is raised before committing.
+    with pytest.raises(e.DivisionByZero):
+        await aconn.commit()
+    assert aconn.info.transaction_status == pq.TransactionStatus.INERROR
+    await aconn.rollback()
+
+
+async def test_prefetch_error_transaction(aconn):
+    with pytest.raises(e.DivisionByZero):
+        async with aconn.transaction():
+            cur = aconn.cursor("foo")
+            cur.itersize = 2
+            cur.prefetch = 1
+            await cur.execute("select 10 / (3 - i) from generate_series(1, 5) i")
+            assert await anext(cur) == (5,)
+
+    assert aconn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+async def test_prefetch_status(aconn):
+    cur = aconn.cursor("foo")
+    cur.itersize = 2
+    cur.prefetch = 1
+    await cur.execute(ph(cur, "select generate_series(1, %s) as bar"), (5,))
+    assert await anext(cur) == (1,)
+    with pytest.raises(e.ProgrammingError, match="INTRANS"):
+        await aconn.set_autocommit(True)
+    await aconn.rollback()
+    await aconn.set_autocommit(True)
+
+
 async def test_next(aconn):
     async with aconn.cursor() as cur:
         await cur.execute("select 1")
@@ -14,7 +14,7 @@ import psycopg
 from psycopg import errors as e
 from psycopg import pq
 
-from .acompat import is_async
+from .acompat import gather, is_async, spawn
 
 pytestmark = [
     pytest.mark.pipeline,
@@ -607,3 +607,187 @@ def test_execute_nextset(conn):
         assert cur.fetchall() == [(2,)]
         assert not cur.nextset()
         assert cur.fetchall() == []
+
+
+@pytest.fixture
+def batches(conn, monkeypatch):
+    """Record the size of the batches executed in auto-pipeline mode."""
+    rv = []
+    execute_batch = conn._execute_batch
+
+    def _execute_batch(queries):
+        rv.append(len(queries))
+        return execute_batch(queries)
+
+    monkeypatch.setattr(conn, "_execute_batch", _execute_batch)
+    return rv
+
+
+def run_concurrently(f, n):
+    """Run f(i) for i in range(n) concurrently and return results or errors."""
+    rv: list[Any] = [None] * n
+
+    def worker(i):
+        try:
+            rv[i] = f(i)
+        except Exception as ex:
+            rv[i] = ex
+
+    gather(*[spawn(worker, (i,)) for i in range(n)])
+    return rv
+
+
+@pytest.mark.parametrize("autocommit", [True, False])
+def test_auto_pipeline(conn, batches, autocommit):
+    conn.set_autocommit(autocommit)
+    conn.auto_pipeline = True
+
+    def f(i):
+        cur = conn.execute("select %s::int * 2", (i,))
+        return cur.fetchone()
+
+    assert run_concurrently(f, 20) == [(i * 2,) for i in range(20)]
+    assert sum(batches) == 20
+
+    status = pq.TransactionStatus.IDLE if autocommit else pq.TransactionStatus.INTRANS
+    assert conn.info.transaction_status == status
+    assert not conn._pipeline
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+
+def test_auto_pipeline_error(conn, batches):
+    conn.set_autocommit(True)
+    conn.auto_pipeline = True
+
+    def f(i):
+        cur = conn.cursor()
+        if i == 3:
+            cur.execute("select 1 / 0")
+        elif i == 4:
+            cur.execute("select %s::int", ("x",))
+        elif i == 5:
+            cur.execute("select %s, %s", (1,))
+        else:
+            cur.execute("select %s::int", (i,))
+        return cur.fetchone()
+
+    res = run_concurrently(f, 10)
+    assert isinstance(res[3], e.DivisionByZero)
+    assert isinstance(res[4], e.InvalidTextRepresentation)
+    assert isinstance(res[5], e.ProgrammingError)
+    assert [r for i, r in enumerate(res) if i not in (3, 4, 5)] == [
+        (i,) for i in range(10) if i not in (3, 4, 5)
+    ]
+    assert sum(batches) == 10
+    assert conn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+def test_auto_pipeline_prepared(conn, batches):
+    conn.set_autocommit(True)
+    conn.auto_pipeline = True
+
+    def f(i):
+        cur = conn.execute("select %s::int", (i,), prepare=True)
+        return cur.fetchone()
+
+    for _ in range(2):
+        assert run_concurrently(f, 5) == [(i,) for i in range(5)]
+
+    cur = conn.execute("select count(*) from pg_prepared_statements")
+    assert cur.fetchone() == (1,)
+
+
+def test_auto_pipeline_not_concurrent(conn, batches):
+    conn.set_autocommit(True)
+    conn.auto_pipeline = True
+
+    # Not concurrent queries are not executed in pipeline mode, so multiple
+    # statements are allowed.
+    cur = conn.execute("select 1; select 2")
+    assert cur.fetchone() == (1,)
+    assert cur.nextset()
+    assert cur.fetchone() == (2,)
+    assert batches == [1]
+
+    with conn.pipeline():
+        cur = conn.execute("select 3")
+    assert cur.fetchone() == (3,)
+    assert batches == [1]
+
+
+def test_auto_pipeline_connect(conn_cls, dsn):
+    with conn_cls.connect(dsn, auto_pipeline=True) as conn:
+        assert conn.auto_pipeline
+        conn.auto_pipeline = False
+        assert not conn.auto_pipeline
+
+
+def test_max_in_flight(conn):
+    with conn.pipeline(max_in_flight=3) as p:
+        assert p.max_in_flight == 3
+        curs = []
+        for i in range(10):
+            curs.append(conn.execute("select %s::int", (i,)))
+            assert p.in_flight <= 3
+        p.sync()
+        assert p.in_flight == 0
+
+    for i, cur in enumerate(curs):
+        assert cur.fetchone() == (i,)
+
+
+def test_max_in_flight_bytes(conn):
+    with conn.pipeline(max_in_flight_bytes=200) as p:
+        assert p.max_in_flight_bytes == 200
+        curs = []
+        for i in range(10):
+            curs.append(conn.execute("select %s::text", ("x" * 80,)))
+            assert p.in_flight_bytes <= 200
+        p.sync()
+        assert p.in_flight_bytes == 0
+
+    for cur in curs:
+        assert cur.fetchone() == ("x" * 80,)
+
+
+def test_max_in_flight_executemany(conn):
+    conn.execute("create temp table pipeline_window (n int)")
+    with conn.pipeline(max_in_flight=5) as p:
+        cur = conn.cursor()
+        cur.executemany(
+            "insert into pipeline_window values (%s)", [(i,) for i in range(50)]
+        )
+        assert p.in_flight <= 5
+    assert cur.rowcount == 50
+    cur = conn.execute("select count(*) from pipeline_window")
+    assert cur.fetchone() == (50,)
+
+
+def test_max_in_flight_error(conn):
+    conn.set_autocommit(True)
+    with conn.pipeline(max_in_flight=1) as p:
+        conn.execute("select 1")
+        conn.execute("select 1 / 0")
+        with pytest.raises(e.DivisionByZero):
+            conn.execute("select 'aborted'")
+        p.sync()
+        cur = conn.execute("select 2")
+    assert cur.fetchone() == (2,)
+
+
+def test_max_in_flight_nested(conn):
+    with conn.pipeline() as p1:
+        assert p1.max_in_flight is None
+        with conn.pipeline(max_in_flight=2) as p2:
+            assert p2 is p1
+            assert p1.max_in_flight == 2
+        assert p1.max_in_flight is None
+
+
+@pytest.mark.parametrize("kwargs", [{"max_in_flight": 0}, {"max_in_flight_bytes": -1}])
+def test_max_in_flight_bad(conn, kwargs):
+    with pytest.raises(ValueError):
+        with conn.pipeline(**kwargs):
+            pass
+    assert conn._pipeline is None
+    assert conn.pgconn.pipeline_status == pq.PipelineStatus.OFF
@@ -11,7 +11,7 @@ import psycopg
 from psycopg import errors as e
 from psycopg import pq
 
-from .acompat import is_async
+from .acompat import gather, is_async, spawn
 
 pytestmark = [
     pytest.mark.pipeline,
@@ -616,3 +616,189 @@ async def test_execute_nextset(aconn):
         assert (await cur.fetchall()) == [(2,)]
         assert not cur.nextset()
         assert (await cur.fetchall()) == []
+
+
+@pytest.fixture
+async def batches(aconn, monkeypatch):
+    """Record the size of the batches executed in auto-pipeline mode."""
+    rv = []
+    execute_batch = aconn._execute_batch
+
+    async def _execute_batch(queries):
+        rv.append(len(queries))
+        return await execute_batch(queries)
+
+    monkeypatch.setattr(aconn, "_execute_batch", _execute_batch)
+    return rv
+
+
+async def run_concurrently(f, n):
+    """Run f(i) for i in range(n) concurrently and return results or errors."""
+    rv: list[Any] = [None] * n
+
+    async def worker(i):
+        try:
+            rv[i] = await f(i)
+        except Exception as ex:
+            rv[i] = ex
+
+    await gather(*[spawn(worker, (i,)) for i in range(n)])
+    return rv
+
+
+@pytest.mark.parametrize("autocommit", [True, False])
+async def test_auto_pipeline(aconn, batches, autocommit):
+    await aconn.set_autocommit(autocommit)
+    aconn.auto_pipeline = True
+
+    async def f(i):
+        cur = await aconn.execute("select %s::int * 2", (i,))
+        return await cur.fetchone()
+
+    assert await run_concurrently(f, 20) == [(i * 2,) for i in range(20)]
+    assert sum(batches) == 20
+    if is_async(aconn):
+        assert batches == [1, 19]
+
+    status = pq.TransactionStatus.IDLE if autocommit else pq.TransactionStatus.INTRANS
+    assert aconn.info.transaction_status == status
+    assert not aconn._pipeline
+    assert aconn.pgconn.pipeline_status == pq.PipelineStatus.OFF
+
+
+async def test_auto_pipeline_error(aconn, batches):
+    await aconn.set_autocommit(True)
+    aconn.auto_pipeline = True
+
+    async def f(i):
+        cur = aconn.cursor()
+        if i == 3:
+            await cur.execute("select 1 / 0")
+        elif i == 4:
+            await cur.execute("select %s::int", ("x",))
+        elif i == 5:
+            await cur.execute("select %s, %s", (1,))
+        else:
+            await cur.execute("select %s::int", (i,))
+        return await cur.fetchone()
+
+    res = await run_concurrently(f, 10)
+    assert isinstance(res[3], e.DivisionByZero)
+    assert isinstance(res[4], e.InvalidTextRepresentation)
+    assert isinstance(res[5], e.ProgrammingError)
+    assert [r for i, r in enumerate(res) if i not in (3, 4, 5)] == [
+        (i,) for i in range(10) if i not in (3, 4, 5)
+    ]
+    assert sum(batches) == 10
+    assert aconn.info.transaction_status == pq.TransactionStatus.IDLE
+
+
+async def test_auto_pipeline_prepared(aconn, batches):
+    await aconn.set_autocommit(True)
+    aconn.auto_pipeline = True
+
+    async def f(i):
+        cur = await aconn.execute("select %s::int", (i,), prepare=True)
+        return await cur.fetchone()
+
+    for _ in range(2):
+        assert await run_concurrently(f, 5) == [(i,) for i in range(5)]
+
+    cur = await aconn.execute("select count(*) from pg_prepared_statements")
+    assert await cur.fetchone() == (1,)
+
+
+async def test_auto_pipeline_not_concurrent(aconn, batches):
+    await aconn.set_autocommit(True)
+    aconn.auto_pipeline = True
+
+    # Not concurrent queries are not executed in pipeline mode, so multiple
+    # statements are allowed.
+    cur = await aconn.execute("select 1; select 2")
+    assert await cur.fetchone() == (1,)
+    assert cur.nextset()
+    assert await cur.fetchone() == (2,)
+    assert batches == [1]
+
+    async with aconn.pipeline():
+        cur = await aconn.execute("select 3")
+    assert await cur.fetchone() == (3,)
+    assert batches == [1]
+
+
+async def test_auto_pipeline_connect(aconn_cls, dsn):
+    async with await aconn_cls.connect(dsn, auto_pipeline=True) as conn:
+        assert conn.auto_pipeline
+        conn.auto_pipeline = False
+        assert not conn.auto_pipeline
+
+
+async def test_max_in_flight(aconn):
+    async with aconn.pipeline(max_in_flight=3) as p:
+        assert p.max_in_flight == 3
+        curs = []
+        for i in range(10):
+            curs.append(await aconn.execute("select %s::int", (i,)))
+            assert p.in_flight <= 3
+        await p.sync()
+        assert p.in_flight == 0
+
+    for i, cur in enumerate(curs):
+        assert await cur.fetchone() == (i,)
+
+
+async def test_max_in_flight_bytes(aconn):
+    async with aconn.pipeline(max_in_flight_bytes=200) as p:
+        assert p.max_in_flight_bytes == 200
+        curs = []
+        for i in range(10):
+            curs.append(await aconn.execute("select %s::text", ("x" * 80,)))
+            assert p.in_flight_bytes <= 200
+        await p.sync()
+        assert p.in_flight_bytes == 0
+
+    for cur in curs:
+        assert await cur.fetchone() == ("x" * 80,)
+
+
+async def test_max_in_flight_executemany(aconn):
+    await aconn.execute("create temp table pipeline_window (n int)")
+    async with aconn.pipeline(max_in_flight=5) as p:
+        cur = aconn.cursor()
+        await cur.executemany(
+            "insert into pipeline_window values (%s)", [(i,) for i in range(50)]
+        )
+        assert p.in_flight <= 5
+    assert cur.rowcount == 50
+    cur = await aconn.execute("select count(*) from pipeline_window")
+    assert await cur.fetchone() == (50,)
+
+
+async def test_max_in_flight_error(aconn):
+    await aconn.set_autocommit(True)
+    async with aconn.pipeline(max_in_flight=1) as p:
+        await aconn.execute("select 1")
+        await aconn.execute("select 1 / 0")
+        with pytest.raises(e.DivisionByZero):
+            await aconn.execute("select 'aborted'")
+        await p.sync()
+        cur = await aconn.execute("select 2")
+    assert await cur.fetchone() == (2,)
+
+
+async def test_max_in_flight_nested(aconn):
+    async with aconn.pipeline() as p1:
+        assert p1.max_in_flight is None
+        async with aconn.pipeline(max_in_flight=2) as p2:
+            assert p2 is p1
+            assert p1.max_in_flight == 2
+        assert p1.max_in_flight is None
+
+
+@pytest.mark.parametrize("kwargs", [{"max_in_flight": 0}, {"max_in_flight_bytes": -1}])
+async def test_max_in_flight_bad(aconn, kwargs):
+    with pytest.raises(ValueError):
+        async with aconn.pipeline(**kwargs):
+            pass
+    assert aconn._pipeline is None
+    assert aconn.pgconn.pipeline_status == pq.PipelineStatus.OFF
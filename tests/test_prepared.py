@@ -14,7 +14,7 @@ from operator import itemgetter
 import pytest
 
 import psycopg
-from psycopg.rows import namedtuple_row
+from psycopg.rows import dict_row, namedtuple_row, tuple_row
 from psycopg.pq._debug import PGconnDebug
 
 
@@ -180,6 +180,121 @@ def test_evict_lru_deallocate(conn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+def test_evict_lfu(conn):
+    conn.prepared_max = 5
+    conn.prepare_threshold = 0
+    conn.prepared_eviction = "lfu"
+    for i in range(3):
+        conn.execute("select 'a'")
+    for i in range(10):
+        conn.execute(f"select {i}")
+
+    assert len(conn._prepared._names) == 5
+    assert (b"select 'a'", ()) in conn._prepared._names
+
+    stmts = get_prepared_statements(conn)
+    got = sorted((stmt.statement for stmt in stmts))
+    assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
+
+
+def test_evict_lfu_max_0(conn):
+    conn.prepared_max = 0
+    conn.prepare_threshold = 0
+    conn.prepared_eviction = "lfu"
+    for i in range(3):
+        conn.execute(f"select {i}")
+
+    assert not conn._prepared._names
+    assert not get_prepared_statements(conn)
+
+
+def test_prepared_eviction_bad(conn):
+    with pytest.raises(ValueError):
+        conn.prepared_eviction = "arc"
+    assert conn.prepared_eviction == "lru"
+
+
+def test_prepared_stats(conn):
+    conn.prepared_max = 2
+    conn.prepare_threshold = 0
+    assert conn.get_prepared_stats() == dict.fromkeys(
+        ["hits", "misses", "prepares", "deallocations"], 0
+    )
+
+    for i in [1, 1, 2, 3]:
+        conn.execute(f"select {i}")
+    conn.execute("select 4", prepare=False)
+
+    assert conn.get_prepared_stats() == {
+        "hits": 1,
+        "misses": 3,
+        "prepares": 3,
+        "deallocations": 1,
+    }
+
+
+def test_reuse_row_maker(conn):
+    conn.prepare_threshold = 0
+    makers = []
+
+    def factory(cur):
+        makers.append(rv := tuple_row(cur))
+        return rv
+
+    cur = conn.cursor(row_factory=factory)
+    for i in range(3):
+        cur.execute("select %s::int as x", [i])
+        assert cur.fetchone() == (i,)
+        assert cur.description[0].name == "x"
+    assert len(makers) == 1
+
+    cur.execute("select %s::int as x", [3], binary=True)
+    assert cur.fetchone() == (3,)
+    assert len(makers) == 2
+
+    cur.execute("select %s::int as y", [4], prepare=False)
+    assert cur.fetchone() == (4,)
+    assert cur.description[0].name == "y"
+    assert len(makers) == 3
+
+    cur.row_factory = dict_row
+    cur.execute("select %s::int as x", [5])
+    assert cur.fetchone() == {"x": 5}
+
+
+def test_prepare_gen(conn):
+    conn.set_autocommit(True)
+    conn.execute("select 'a'", prepare=True)
+    keys = [(b"select 'a'", ()), (b"select $1", (23,)), (b"select nosuchcol", ())]
+    conn._prepared._counts[b"select $1", (23,)] = 1
+
+    got = conn.wait(conn._prepared.prepare_gen(conn, keys))
+    assert got == [(b"select $1", (23,))]
+    assert (b"select $1", (23,)) not in conn._prepared._counts
+    assert (b"select nosuchcol", ()) not in conn._prepared._names
+
+    stmts = get_prepared_statements(conn)
+    assert sorted((stmt.statement for stmt in stmts)) == ["select $1", "select 'a'"]
+
+
+def test_prepare_gen_error_first(conn):
+    conn.set_autocommit(True)
+    keys = [(b"select nosuchcol", ()), (b"select 'a'", ()), (b"select 'b'", ())]
+    got = conn.wait(conn._prepared.prepare_gen(conn, keys))
+    assert got == keys[1:]
+    assert not conn.pgconn.pipeline_status
+
+    stmts = get_prepared_statements(conn)
+    assert sorted((stmt.statement for stmt in stmts)) == ["select 'a'", "select 'b'"]
+
+
+def test_prepare_gen_disabled(conn):
+    conn.prepare_threshold = None
+    keys = [(b"select 'a'", ())]
+    assert conn.wait(conn._prepared.prepare_gen(conn, keys)) == []
+    assert not get_prepared_statements(conn)
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 def test_deallocate_or_close(conn, caplog):
     conn.pgconn = PGconnDebug(conn.pgconn)
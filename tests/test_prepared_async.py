@@ -11,7 +11,7 @@ from operator import itemgetter
 import pytest
 
 import psycopg
-from psycopg.rows import namedtuple_row
+from psycopg.rows import dict_row, namedtuple_row, tuple_row
 from psycopg.pq._debug import PGconnDebug
 
 
@@ -179,6 +179,121 @@ async def test_evict_lru_deallocate(aconn):
     assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
 
 
+async def test_evict_lfu(aconn):
+    aconn.prepared_max = 5
+    aconn.prepare_threshold = 0
+    aconn.prepared_eviction = "lfu"
+    for i in range(3):
+        await aconn.execute("select 'a'")
+    for i in range(10):
+        await aconn.execute(f"select {i}")
+
+    assert len(aconn._prepared._names) == 5
+    assert (b"select 'a'", ()) in aconn._prepared._names
+
+    stmts = await get_prepared_statements(aconn)
+    got = sorted(stmt.statement for stmt in stmts)
+    assert got == [f"select {i}" for i in ["'a'", 6, 7, 8, 9]]
+
+
+async def test_evict_lfu_max_0(aconn):
+    aconn.prepared_max = 0
+    aconn.prepare_threshold = 0
+    aconn.prepared_eviction = "lfu"
+    for i in range(3):
+        await aconn.execute(f"select {i}")
+
+    assert not aconn._prepared._names
+    assert not await get_prepared_statements(aconn)
+
+
+async def test_prepared_eviction_bad(aconn):
+    with pytest.raises(ValueError):
+        aconn.prepared_eviction = "arc"
+    assert aconn.prepared_eviction == "lru"
+
+
+async def test_prepared_stats(aconn):
+    aconn.prepared_max = 2
+    aconn.prepare_threshold = 0
+    assert aconn.get_prepared_stats() == dict.fromkeys(
+        ["hits", "misses", "prepares", "deallocations"], 0
+    )
+
+    for i in [1, 1, 2, 3]:
+        await aconn.execute(f"select {i}")
+    await aconn.execute("select 4", prepare=False)
+
+    assert aconn.get_prepared_stats() == {
+        "hits": 1,
+        "misses": 3,
+        "prepares": 3,
+        "deallocations": 1,
+    }
+
+
+async def test_reuse_row_maker(aconn):
+    aconn.prepare_threshold = 0
+    makers = []
+
+    def factory(cur):
+        makers.append(rv := tuple_row(cur))
+        return rv
+
+    cur = aconn.cursor(row_factory=factory)
+    for i in range(3):
+        await cur.execute("select %s::int as x", [i])
+        assert await cur.fetchone() == (i,)
+        assert cur.description[0].name == "x"
+    assert len(makers) == 1
+
+    await cur.execute("select %s::int as x", [3], binary=True)
+    assert await cur.fetchone() == (3,)
+    assert len(makers) == 2
+
+    await cur.execute("select %s::int as y", [4], prepare=False)
+    assert await cur.fetchone() == (4,)
+    assert cur.description[0].name == "y"
+    assert len(makers) == 3
+
+    cur.row_factory = dict_row
+    await cur.execute("select %s::int as x", [5])
+    assert await cur.fetchone() == {"x": 5}
+
+
+async def test_prepare_gen(aconn):
+    await aconn.set_autocommit(True)
+    await aconn.execute("select 'a'", prepare=True)
+    keys = [(b"select 'a'", ()), (b"select $1", (23,)), (b"select nosuchcol", ())]
+    aconn._prepared._counts[b"select $1", (23,)] = 1
+
+    got = await aconn.wait(aconn._prepared.prepare_gen(aconn, keys))
+    assert got == [(b"select $1", (23,))]
+    assert (b"select $1", (23,)) not in aconn._prepared._counts
+    assert (b"select nosuchcol", ()) not in aconn._prepared._names
+
+    stmts = await get_prepared_statements(aconn)
+    assert sorted(stmt.statement for stmt in stmts) == ["select $1", "select 'a'"]
+
+
+async def test_prepare_gen_error_first(aconn):
+    await aconn.set_autocommit(True)
+    keys = [(b"select nosuchcol", ()), (b"select 'a'", ()), (b"select 'b'", ())]
+    got = await aconn.wait(aconn._prepared.prepare_gen(aconn, keys))
+    assert got == keys[1:]
+    assert not aconn.pgconn.pipeline_status
+
+    stmts = await get_prepared_statements(aconn)
+    assert sorted(stmt.statement for stmt in stmts) == ["select 'a'", "select 'b'"]
+
+
+async def test_prepare_gen_disabled(aconn):
+    aconn.prepare_threshold = None
+    keys = [(b"select 'a'", ())]
+    assert await aconn.wait(aconn._prepared.prepare_gen(aconn, keys)) == []
+    assert not await get_prepared_statements(aconn)
+
+
 @pytest.mark.skipif("psycopg._cmodule._psycopg", reason="Python-only debug conn")
 async def test_deallocate_or_close(aconn, caplog):
     aconn.pgconn = PGconnDebug(aconn.pgconn)
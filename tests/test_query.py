@@ -3,7 +3,7 @@ import pytest
 import psycopg
 from psycopg import pq
 from psycopg.adapt import PyFormat, Transformer
-from psycopg._queries import PostgresQuery, _split_query
+from psycopg._queries import InsertBatcher, PostgresQuery, _split_query
 
 
 @pytest.mark.parametrize(
@@ -160,3 +160,99 @@ def test_pq_query_badprog(query, params):
     pq = PostgresQuery(Transformer())
     with pytest.raises(psycopg.ProgrammingError):
         pq.convert(query, params)
+
+
+@pytest.mark.parametrize(
+    "query, batch, nrecs, want",
+    [
+        (
+            b"insert into t values (%s, %b)",
+            "values",
+            2,
+            b"insert into t VALUES (%s, %b), (%s, %b)",
+        ),
+        (
+            b"INSERT INTO t (a, b) VALUES (%s, f(%s, 'a,)')) RETURNING id",
+            "values",
+            2,
+            b"INSERT INTO t (a, b) VALUES (%s, f(%s, 'a,)')), (%s, f(%s, 'a,)'))"
+            b" RETURNING id",
+        ),
+        (
+            b"insert into t values (%(a)s, %(b)t::numeric(10, 2)) on conflict do nothing",
+            "values",
+            1,
+            b"insert into t VALUES (%s, %t::numeric(10, 2)) on conflict do nothing",
+        ),
+        (
+            b"insert into t values (%s, %b::text)",
+            "unnest",
+            3,
+            b"insert into t SELECT * FROM unnest(%s, %b::text[])",
+        ),
+        (
+            b"insert into t (a, b) values (%(a)s, %(b)t::numeric(10, 2)) returning a",
+            "unnest",
+            3,
+            b"insert into t (a, b) SELECT * FROM unnest(%s, %t::numeric(10, 2)[])"
+            b" returning a",
+        ),
+    ],
+)
+def test_insert_batcher_query(query, batch, nrecs, want):
+    assert InsertBatcher(query, "utf8", batch).query(nrecs) == want
+
+
+@pytest.mark.parametrize(
+    "query, records, want",
+    [
+        (b"insert into t values (%s, %s)", [(1, "a"), [2, "b"]], [1, "a", 2, "b"]),
+        (
+            b"insert into t values (%(a)s, %(b)s, %(a)s)",
+            [{"a": 1, "b": "a"}, {"b": "b", "a": 2}],
+            [1, "a", 1, 2, "b", 2],
+        ),
+    ],
+)
+def test_insert_batcher_params(query, records, want):
+    assert InsertBatcher(query, "utf8", "values").params(records) == want
+    if b"%(" not in query:
+        cols = [want[i :: len(records[0])] for i in range(len(records[0]))]
+        assert InsertBatcher(query, "utf8", "unnest").params(records) == cols
+
+
+def test_insert_batcher_params_bad():
+    batcher = InsertBatcher(b"insert into t values (%s, %s)", "utf8", "values")
+    with pytest.raises(psycopg.ProgrammingError):
+        batcher.params([(1, 2), (3,)])
+    batcher = InsertBatcher(b"insert into t values (%(a)s)", "utf8", "values")
+    with pytest.raises(psycopg.ProgrammingError):
+        batcher.params([{"b": 1}])
+
+
+def test_insert_batcher_max_records():
+    batcher = InsertBatcher(b"insert into t values (%s, %s, %s)", "utf8", "values")
+    assert batcher.max_records == 65535 // 3
+
+
+@pytest.mark.parametrize(
+    "query, batch",
+    [
+        (b"select %s", "values"),
+        (b"insert into t select %s", "values"),
+        (b"insert into t values (1, 2)", "values"),
+        (b"insert into t values (%s), (%s)", "values"),
+        (b"insert into t values (%s, %s", "values"),
+        (b"insert into t values (%s) returning %s", "values"),
+        (b"insert into t values (%s + 1)", "unnest"),
+        (b"insert into t values (f(%s))", "unnest"),
+    ],
+)
+def test_insert_batcher_bad(query, batch):
+    with pytest.raises(psycopg.ProgrammingError):
+        InsertBatcher(query, "utf8", batch)
+
+
+def test_insert_batcher_bad_mode():
+    with pytest.raises(ValueError):
+        InsertBatcher(b"insert into t values (%s)", "utf8", "nope")
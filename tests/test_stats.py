@@ -0,0 +1,81 @@
+import pytest
+
+import psycopg
+from psycopg.stats import StatsCollector
+
+
+def info(query, start=0.0, end=1.0, rows=1, error=None):
+    return psycopg.QueryInfo(
+        query, 0, False, start, start, end, rows, len(query), error
+    )
+
+
+def test_collect():
+    stats = StatsCollector()
+    stats(info(b"select 1", end=1.0))
+    stats(info(b"select 1", end=3.0, rows=2))
+    stats(info(b"select 2", end=0.5, error=psycopg.DataError()))
+
+    assert len(stats) == 2
+    s1, s2 = stats.get_stats()
+    assert s1.query == b"select 1"
+    assert s1.calls == 2
+    assert s1.errors == 0
+    assert s1.total_time == 4.0
+    assert s1.mean_time == 2.0
+    assert s1.max_time == 3.0
+    assert s1.rows == 3
+    assert s1.bytes_sent == 16
+
+    assert s2.query == b"select 2"
+    assert s2.calls == 1
+    assert s2.errors == 1
+
+
+def test_top():
+    stats = StatsCollector()
+    for i in range(5):
+        for j in range(i + 1):
+            stats(info(f"select {i}".encode(), end=5.0 - i))
+
+    top = stats.top(2)
+    assert [s.query for s in top] == [b"select 2", b"select 1"]
+    top = stats.top(2, key="calls")
+    assert [s.query for s in top] == [b"select 4", b"select 3"]
+    top = stats.top(1, key="max_time")
+    assert [s.query for s in top] == [b"select 0"]
+
+    with pytest.raises(ValueError):
+        stats.top(key="nosuchkey")
+
+
+def test_max_queries():
+    stats = StatsCollector(max_queries=2)
+    stats(info(b"select 1"))
+    stats(info(b"select 2"))
+    stats(info(b"select 1"))
+    stats(info(b"select 3"))
+    assert [s.query for s in stats.get_stats()] == [b"select 1", b"select 3"]
+
+    with pytest.raises(ValueError):
+        StatsCollector(max_queries=0)
+
+
+def test_reset():
+    stats = StatsCollector()
+    stats(info(b"select 1"))
+    stats.reset()
+    assert len(stats) == 0
+    assert stats.get_stats() == []
+
+
+def test_observer(conn):
+    stats = StatsCollector()
+    conn.add_query_observer(stats)
+    for i in range(3):
+        conn.execute("select %s::int", [i])
+
+    (s,) = stats.get_stats()
+    assert s.query == b"select $1::int"
+    assert s.calls == 3
+    assert s.rows == 3
@@ -28,8 +28,16 @@ waitfns = [
     pytest.param(
         "wait_epoll", marks=pytest.mark.skipif("not hasattr(select, 'epoll')")
     ),
+    pytest.param(
+        "wait_epoll_persistent",
+        marks=pytest.mark.skipif("not hasattr(select, 'epoll')"),
+    ),
     pytest.param("wait_poll", marks=pytest.mark.skipif("not hasattr(select, 'poll')")),
+    pytest.param("wait_spin", marks=pytest.mark.skipif("not hasattr(select, 'poll')")),
     pytest.param("wait_c", marks=pytest.mark.skipif("not psycopg._cmodule._psycopg")),
+    pytest.param(
+        "wait_spin_c", marks=pytest.mark.skipif("not psycopg._cmodule._psycopg")
+    ),
 ]
 
 events = ["R", "W", "RW"]
@@ -246,6 +254,19 @@ def test_wait_w(waitfn, event, nevents, request):
             assert dt < 0.1
 
 
+@pytest.mark.skipif("not hasattr(select, 'epoll')")
+def test_wait_epoll_persistent_fd_reuse():
+    # File descriptors closed are unregistered from the epoll object: the
+    # same numbers can be waited on again by new sockets.
+    for i in range(3):
+        rs, ws = socket.socketpair()
+        with rs, ws:
+            ws.sendall(b"hi")
+            gen = tgen(waiting.Wait.R)
+            r = waiting.wait_epoll_persistent(gen, rs.fileno(), 0.5)
+            assert r == waiting.Ready.R
+
+
 @pytest.mark.parametrize("waitfn", waitfns)
 @pytest.mark.parametrize("interval", intervals)
 def test_wait(pgconn, waitfn, interval):
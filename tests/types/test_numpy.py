@@ -1,9 +1,11 @@
 import struct
 from math import isnan
+from decimal import Decimal
 
 import pytest
 from packaging.version import parse as ver  # noqa: F401  # used in skipif
 
+import psycopg
 from psycopg.pq import Format
 from psycopg.adapt import PyFormat
 
@@ -228,3 +230,59 @@ def test_random(conn, faker, fmt):
 
     for got, want in zip(recs, faker.records):
         faker.assert_record(got, want)
+
+
+@pytest.mark.parametrize(
+    "pgtype, val, dtype, want",
+    [
+        ("bool", "true", "?", True),
+        ("int2", "-32768", "i2", -32768),
+        ("int4", "2147483647", "i4", 2147483647),
+        ("int8", "-9223372036854775808", "i8", -9223372036854775808),
+        ("float4", "1.5", "f4", 1.5),
+        ("float8", "-1e300", "f8", -1e300),
+        ("date", "1970-01-02", "M8[D]", np.datetime64("1970-01-02")),
+        ("date", "1900-12-31", "M8[D]", np.datetime64("1900-12-31")),
+        (
+            "timestamp",
+            "2042-07-01 12:34:56.789012",
+            "M8[us]",
+            np.datetime64("2042-07-01T12:34:56.789012"),
+        ),
+        (
+            "timestamptz",
+            "1969-12-31 23:00:00-02",
+            "M8[us]",
+            np.datetime64("1970-01-01T01:00:00"),
+        ),
+        ("numeric", "1.5", "O", Decimal("1.5")),
+    ],
+)
+@pytest.mark.parametrize("fmt_out", Format)
+def test_fetch_numpy(conn, pgtype, val, dtype, want, fmt_out):
+    cur = conn.cursor(binary=fmt_out)
+    cur.execute(
+        f"select v from (values ('{val}'::{pgtype}), (null), ('{val}')) as t (v)"
+    )
+    (arr,) = cur.fetch_numpy()
+    assert arr.dtype == np.dtype(dtype)
+    assert arr.mask.tolist() == [False, True, False]
+    assert arr[0] == want
+    assert arr[2] == want
+
+
+@pytest.mark.parametrize("pgtype", ["date", "timestamp", "timestamptz"])
+@pytest.mark.parametrize("val", ["infinity", "-infinity"])
+def test_fetch_numpy_infinity(conn, pgtype, val):
+    cur = conn.cursor(binary=True)
+    cur.execute(f"select '{val}'::{pgtype}")
+    with pytest.raises(psycopg.DataError):
+        cur.fetch_numpy()
+
+
+def test_fetch_numpy_no_null(conn):
+    cur = conn.cursor(binary=True)
+    cur.execute("select generate_series(1, 1000)")
+    (arr,) = cur.fetch_numpy()
+    assert arr.mask is np.ma.nomask
+    assert (arr == np.arange(1, 1001)).all()
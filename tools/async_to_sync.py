@@ -36,15 +36,19 @@ ALL_INPUTS = """
     psycopg/psycopg/cursor_async.py
     psycopg/psycopg/_pipeline_async.py
     psycopg/psycopg/_server_cursor_async.py
+    psycopg_pool/psycopg_pool/keyed_pool_async.py
     psycopg_pool/psycopg_pool/null_pool_async.py
     psycopg_pool/psycopg_pool/pool_async.py
+    psycopg_pool/psycopg_pool/routing_pool_async.py
     psycopg_pool/psycopg_pool/sched_async.py
     tests/crdb/test_connection_async.py
     tests/crdb/test_copy_async.py
     tests/crdb/test_cursor_async.py
     tests/pool/test_pool_async.py
     tests/pool/test_pool_common_async.py
+    tests/pool/test_pool_keyed_async.py
     tests/pool/test_pool_null_async.py
+    tests/pool/test_pool_routing_async.py
     tests/pool/test_sched_async.py
     tests/test_connection_async.py
     tests/test_conninfo_attempts_async.py
@@ -291,6 +295,7 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "ALock": "Lock",
         "AQueue": "Queue",
         "AWorker": "Worker",
+        "AbstractAsyncContextManager": "AbstractContextManager",
         "AsyncClientCursor": "ClientCursor",
         "AsyncConnectFailedCB": "ConnectFailedCB",
         "AsyncConnection": "Connection",
@@ -300,16 +305,20 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "AsyncCopyWriter": "CopyWriter",
         "AsyncCrdbConnection": "CrdbConnection",
         "AsyncCursor": "Cursor",
+        "AsyncExitStack": "ExitStack",
         "AsyncFileWriter": "FileWriter",
         "AsyncGenerator": "Generator",
         "AsyncIterator": "Iterator",
+        "AsyncKeyedConnectionPool": "KeyedConnectionPool",
         "AsyncLibpqWriter": "LibpqWriter",
         "AsyncNullConnectionPool": "NullConnectionPool",
+        "AsyncParallelCopy": "ParallelCopy",
         "AsyncPipeline": "Pipeline",
         "AsyncPoolConnection": "PoolConnection",
         "AsyncQueuedLibpqWriter": "QueuedLibpqWriter",
         "AsyncRawCursor": "RawCursor",
         "AsyncRawServerCursor": "RawServerCursor",
+        "AsyncRoutingConnectionPool": "RoutingConnectionPool",
         "AsyncRowFactory": "RowFactory",
         "AsyncScheduler": "Scheduler",
         "AsyncServerCursor": "ServerCursor",
@@ -318,6 +327,8 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "AsyncKwargsParam": "KwargsParam",
         "AsyncConninfoParam": "ConninfoParam",
         "StopAsyncIteration": "StopIteration",
+        "_AsyncKeyedSubPool": "_KeyedSubPool",
+        "_AsyncPool": "_Pool",
         "__aenter__": "__enter__",
         "__aexit__": "__exit__",
         "__aiter__": "__iter__",
@@ -341,11 +352,14 @@ class RenameAsyncToSync(ast.NodeTransformer):  # type: ignore
         "conninfo_attempts_async": "conninfo_attempts",
         "current_task_name": "current_thread_name",
         "cursor_async": "cursor",
+        "enter_async_context": "enter_context",
         "ensure_table_async": "ensure_table",
         "find_insert_problem_async": "find_insert_problem",
+        "keyed_pool_async": "keyed_pool",
         "pool_async": "pool",
         "psycopg_pool.pool_async": "psycopg_pool.pool",
         "psycopg_pool.sched_async": "psycopg_pool.sched",
+        "routing_pool_async": "routing_pool",
         "sched_async": "sched",
         "test_pool_common_async": "test_pool_common",
         "wait_async": "wait",